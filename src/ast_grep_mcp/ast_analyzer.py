@@ -56,8 +56,8 @@ class AstAnalyzer:
             
             # If no matches found, try alternative patterns
             if match_count == 0:
-                from .utils.pattern_helpers import generate_alternative_patterns
-                alternatives = generate_alternative_patterns(pattern, language)
+                from .utils.pattern_helpers import iter_alternative_patterns
+                alternatives = iter_alternative_patterns(pattern, language)
                 
                 for alt_pattern in alternatives:
                     try:
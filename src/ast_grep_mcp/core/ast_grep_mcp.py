@@ -11,6 +11,7 @@ from ..utils.security import sanitize_pattern, validate_file_access
 from ..utils.ignore_handler import IgnoreHandler
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple
+import itertools
 import logging
 import time
 import os
@@ -640,17 +641,17 @@ class AstGrepMCP:
             self.logger.info(f"No matches found for pattern '{safe_pattern}', trying alternatives...")
             
             # Get alternative patterns from the fixer
-            alternatives = PatternFixer.fix_pattern(safe_pattern, language)
+            alternatives = PatternFixer.iter_pattern_fixes(safe_pattern, language)
             
             # Also try fuzzy patterns if enabled
             if self.config.pattern_config.fuzzy_matching:
-                fuzzy_alternatives = FuzzyPatternMatcher.make_pattern_fuzzy(safe_pattern, language)
-                alternatives.extend(fuzzy_alternatives)
+                fuzzy_alternatives = FuzzyPatternMatcher.iter_fuzzy_patterns(safe_pattern, language)
+                alternatives = itertools.chain(alternatives, fuzzy_alternatives)
             
             # Remove duplicates and original pattern
-            alternatives = list(dict.fromkeys(alternatives))
-            if safe_pattern in alternatives:
-                alternatives.remove(safe_pattern)
+            alternatives = [
+                alt for alt in dict.fromkeys(alternatives) if alt != safe_pattern
+            ]
             
             # Try each alternative
             for alt_pattern in alternatives[:5]:  # Limit to 5 alternatives
@@ -1256,14 +1257,15 @@ class AstGrepMCP:
             
             if detected_language:
                 # Get alternative patterns
-                alternatives = PatternFixer.fix_pattern(safe_pattern, detected_language)
-                fuzzy_alternatives = FuzzyPatternMatcher.make_pattern_fuzzy(safe_pattern, detected_language)
-                alternatives.extend(fuzzy_alternatives)
+                alternatives = itertools.chain(
+                    PatternFixer.iter_pattern_fixes(safe_pattern, detected_language),
+                    FuzzyPatternMatcher.iter_fuzzy_patterns(safe_pattern, detected_language),
+                )
                 
                 # Remove duplicates and original
-                alternatives = list(dict.fromkeys(alternatives))
-                if safe_pattern in alternatives:
-                    alternatives.remove(safe_pattern)
+                alternatives = [
+                    alt for alt in dict.fromkeys(alternatives) if alt != safe_pattern
+                ]
                 
                 # Try each alternative (limit to 3 for performance)
                 for alt_pattern in alternatives[:3]:
@@ -1320,12 +1322,15 @@ class AstGrepMCP:
             
             # Use pattern simplifier to suggest alternatives
             if detected_language:
-                simplified_patterns = self.pattern_simplifier.simplify_pattern(safe_pattern, detected_language)
-                if simplified_patterns:
-                    result["debug_info"]["simplified_patterns"] = [
-                        {"pattern": p, "description": desc} 
-                        for p, desc in simplified_patterns[:5]  # Limit to 5 suggestions
-                    ]
+                simplified_patterns = itertools.islice(  # Limit to 5 suggestions
+                    self.pattern_simplifier.iter_simplified_patterns(safe_pattern, detected_language), 5
+                )
+                simplified_debug = [
+                    {"pattern": p, "description": desc}
+                    for p, desc in simplified_patterns
+                ]
+                if simplified_debug:
+                    result["debug_info"]["simplified_patterns"] = simplified_debug
                 
                 # Add pattern examples
                 examples = self.pattern_simplifier.get_pattern_examples(detected_language)
@@ -1333,7 +1338,7 @@ class AstGrepMCP:
                     # Show most relevant examples
                     result["debug_info"]["pattern_examples"] = {}
                     for category, patterns in examples.items():
-                        result["debug_info"]["pattern_examples"][category] = patterns[:3]
+                        result["debug_info"]["pattern_examples"][category] = list(patterns[:3])
 
         # Log cache statistics periodically
         result_cache.log_stats()
@@ -4310,8 +4315,8 @@ pattern = builder.async_function().with_params().returns('Result<()>').with_body
             "pattern": template.pattern,
             "replacement": template.replacement,
             "language": template.language,
-            "example_matches": template.example_matches,
-            "variables": template.variables,
+            "example_matches": list(template.example_matches),
+            "variables": dict(template.variables),
             "category": template.category,
             "notes": template.notes,
             "confidence": template.confidence,
@@ -5,52 +5,167 @@ This module fixes common pattern problems like metavariables that don't work
 as expected (e.g., $EXPR.unwrap()).
 """
 
+import functools
 import re
-from typing import List, Optional
+from typing import Iterator, List, Optional, Sequence, Tuple
 from ..utils.common_patterns import CommonPatternLibrary
+from ..utils.pattern_helpers import JS_ARROW_TEMPLATE, JS_ASYNC_ARROW_TEMPLATE
 
 
-class PatternFixer:
-    """Fixes common pattern issues to make them work with ast-grep."""
-    
-    # Known problematic patterns and their fixes
-    PATTERN_FIXES = {
+def _build_intent_scanner(
+    tokens: Sequence[Tuple[str, str]],
+) -> Tuple[re.Pattern[str], Tuple[Tuple[str, str], ...]]:
+    """
+    Build a single-pass scanner for intent tokens.
+
+    Args:
+        tokens: (token, library keyword) pairs in the order they should be tried
+
+    Returns:
+        Tuple of (compiled alternation of all tokens, token pairs)
+    """
+    # Longest tokens first so overlapping literals match the most specific one
+    alternation = "|".join(
+        re.escape(token) for token in sorted({t for t, _ in tokens}, key=len, reverse=True)
+    )
+    return re.compile(alternation), tuple(tokens)
+
+
+_JS_INTENT_SCANNER = _build_intent_scanner([
+    ("await", "await"),
+    ("then", "promise"),
+    ("catch", "promise"),
+    ("=>", "arrow"),
+])
+
+# Intent tokens per language, each found with one regex pass over the pattern
+_INTENT_SCANNERS = {
+    "rust": _build_intent_scanner([
+        ("unwrap", "unwrap"),
+        ("expect", "expect"),
+        ("await", "await"),
+        ("spawn", "spawn"),
+        ("?", "error handling"),
+    ]),
+    "javascript": _JS_INTENT_SCANNER,
+    "typescript": _JS_INTENT_SCANNER,
+    "python": _build_intent_scanner([
+        ("async def", "async"),
+        ("try", "except"),
+        ("except", "except"),
+    ]),
+}
+
+
+# Known problematic patterns and their fixes, precompiled at import time
+_PATTERN_FIXES = tuple(
+    (re.compile(problematic), fixes)
+    for problematic, fixes in (
         # Rust patterns
-        r'\$EXPR\.unwrap\(\)': ['unwrap()', '.unwrap()', '$VAR.unwrap()'],
-        r'\$\.unwrap\(\)': ['unwrap()', '.unwrap()'],
-        r'\$_\.unwrap\(\)': ['unwrap()', '.unwrap()'],
-        r'\$EXPR\.expect\(\$MSG\)': ['expect($MSG)', '.expect($MSG)', '$VAR.expect($MSG)'],
-        r'\$EXPR\.await': ['.await', '$VAR.await'],
-        r'\$EXPR\?': ['$VAR?', '?'],
+        (r'\$EXPR\.unwrap\(\)', ('unwrap()', '.unwrap()', '$VAR.unwrap()')),
+        (r'\$\.unwrap\(\)', ('unwrap()', '.unwrap()')),
+        (r'\$_\.unwrap\(\)', ('unwrap()', '.unwrap()')),
+        (r'\$EXPR\.expect\(\$MSG\)', ('expect($MSG)', '.expect($MSG)', '$VAR.expect($MSG)')),
+        (r'\$EXPR\.await', ('.await', '$VAR.await')),
+        (r'\$EXPR\?', ('$VAR?', '?')),
         
         # JavaScript/TypeScript patterns
-        r'\$EXPR\.then\(\$\$\$ARGS\)': ['.then($$$ARGS)', '$VAR.then($$$ARGS)'],
-        r'\$EXPR\.catch\(\$\$\$ARGS\)': ['.catch($$$ARGS)', '$VAR.catch($$$ARGS)'],
-        r'await \$EXPR': ['await $VAR', 'await'],
+        (r'\$EXPR\.then\(\$\$\$ARGS\)', ('.then($$$ARGS)', '$VAR.then($$$ARGS)')),
+        (r'\$EXPR\.catch\(\$\$\$ARGS\)', ('.catch($$$ARGS)', '$VAR.catch($$$ARGS)')),
+        (r'await \$EXPR', ('await $VAR', 'await')),
         
         # Python patterns
-        r'\$EXPR\.append\(\$ITEM\)': ['.append($ITEM)', '$VAR.append($ITEM)'],
-        r'\$EXPR\[\$KEY\]': ['$VAR[$KEY]'],
-    }
+        (r'\$EXPR\.append\(\$ITEM\)', ('.append($ITEM)', '$VAR.append($ITEM)')),
+        (r'\$EXPR\[\$KEY\]', ('$VAR[$KEY]',)),
+    )
+)
+
+# Fixed alternatives for Rust task-spawn patterns, most general first
+_SPAWN_ALTERNATIVES = (
+    "spawn($$$ARGS)",  # Most general - catches everything
+    "spawn(async { $$$BODY })",
+    "spawn(async move { $$$BODY })",
+    "tokio::spawn($$$ARGS)",
+    "tokio::spawn(async { $$$BODY })",
+    "tokio::spawn(async move { $$$BODY })",
+)
+
+# Fixed expansions used by FuzzyPatternMatcher.expand_pattern
+_UNWRAP_EXPANSIONS = (
+    "unwrap()",
+    "unwrap_or($DEFAULT)",
+    "unwrap_or_else($CLOSURE)",
+    "unwrap_or_default()",
+)
+_ERROR_HANDLING_EXPANSIONS = (
+    "unwrap()",
+    "expect($MSG)",
+    "$EXPR?",
+    "match $RESULT { Ok($VAL) => $OK, Err($ERR) => $ERR_BODY }",
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _first_library_pattern(language: str, keyword: str) -> Optional[str]:
+    """Return the first library pattern matching a keyword, or None."""
+    patterns = CommonPatternLibrary.search_patterns(language, keyword)
+    return patterns[0].pattern if patterns else None
+
+
+class PatternFixer:
+    """Fixes common pattern issues to make them work with ast-grep."""
     
     @classmethod
-    def fix_pattern(cls, pattern: str, language: str) -> List[str]:
+    def fix_pattern(
+        cls, pattern: str, language: str, max_alternatives: Optional[int] = None
+    ) -> List[str]:
         """
         Fix a potentially problematic pattern by generating alternatives.
         
         Args:
             pattern: The original pattern
             language: Programming language
+            max_alternatives: Stop once this many unique alternatives have been
+                produced (None for no limit)
             
         Returns:
             List of alternative patterns to try (including the original)
         """
-        alternatives = [pattern]  # Always include the original
+        alternatives = cls.iter_pattern_fixes(pattern, language)
+        if max_alternatives is None:
+            # Remove duplicates while preserving order
+            return list(dict.fromkeys(alternatives))
+        
+        # Deduplicate as we go so the remaining heuristics are never run
+        # once enough alternatives have been found
+        unique_alternatives: dict[str, None] = {}
+        for alt in alternatives:
+            unique_alternatives[alt] = None
+            if len(unique_alternatives) >= max_alternatives:
+                break
+        return list(unique_alternatives)
+    
+    @classmethod
+    def iter_pattern_fixes(cls, pattern: str, language: str) -> Iterator[str]:
+        """
+        Lazily yield alternatives for a potentially problematic pattern.
+        
+        Same alternatives as fix_pattern, but may contain duplicates. Use this
+        when trying alternatives in order and stopping at the first success.
+        
+        Args:
+            pattern: The original pattern
+            language: Programming language
+            
+        Yields:
+            Alternative patterns to try, starting with the original
+        """
+        yield pattern  # Always include the original
         
         # Check if it's a known problematic pattern
-        for problematic, fixes in cls.PATTERN_FIXES.items():
-            if re.match(problematic, pattern):
-                alternatives.extend(fixes)
+        for problematic, fixes in _PATTERN_FIXES:
+            if problematic.match(pattern):
+                yield from fixes
                 break
         
         # Additional heuristics for common issues
@@ -60,63 +175,43 @@ class PatternFixer:
             # Try without the $EXPR prefix
             if pattern.startswith("$EXPR."):
                 simplified = pattern[6:]  # Remove "$EXPR."
-                alternatives.append(simplified)
-                alternatives.append("." + simplified)
+                yield simplified
+                yield "." + simplified
             elif pattern.startswith("$VAR."):
                 simplified = pattern[5:]  # Remove "$VAR."
-                alternatives.append(simplified)
-                alternatives.append("." + simplified)
+                yield simplified
+                yield "." + simplified
         
         # Issue: Complex metavariable patterns
         if "$$" in pattern and "$$$" not in pattern:
             # Convert $$ to $$$ for variadic
-            alternatives.append(pattern.replace("$$", "$$$"))
+            yield pattern.replace("$$", "$$$")
         
         # Issue: Specific function names might need metavariables
         if language == "rust":
             # For patterns like "spawn(async move { ... })"
             if "spawn" in pattern and ("async" in pattern or "{" in pattern):
                 # Handle various spawn patterns with nested blocks
-                alternatives.extend([
-                    "spawn($$$ARGS)",  # Most general - catches everything
-                    "spawn(async { $$$BODY })",
-                    "spawn(async move { $$$BODY })",
-                    "tokio::spawn($$$ARGS)",
-                    "tokio::spawn(async { $$$BODY })",
-                    "tokio::spawn(async move { $$$BODY })",
-                ])
+                yield from _SPAWN_ALTERNATIVES
                 
                 # Also add pattern without the block for simpler matching
                 if "async move {" in pattern and "$$BODY" in pattern:
                     # User tried nested pattern, suggest simpler alternatives
-                    alternatives.extend([
-                        "spawn(async move { $_ })",  # Match any single expression
-                        "spawn(async move { $$$_ })",  # Match any statements
-                        pattern.replace("$$BODY", "$$$BODY"),  # Fix variadic
-                    ])
+                    yield "spawn(async move { $_ })"  # Match any single expression
+                    yield "spawn(async move { $$$_ })"  # Match any statements
+                    yield pattern.replace("$$BODY", "$$$BODY")  # Fix variadic
             
             # For patterns like "fn name(...) { ... }"
-            if re.match(r'^fn \w+\(', pattern):
+            if pattern.startswith("fn "):
                 # Extract function name
-                match = re.match(r'^fn (\w+)', pattern)
-                if match:
-                    func_name = match.group(1)
-                    alternatives.extend([
-                        f"fn {func_name}",
-                        f"fn {func_name}($$$PARAMS)",
-                        f"fn {func_name}($$$PARAMS) {{ $$$BODY }}",
-                        "fn $NAME",
-                    ])
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_alternatives = []
-        for alt in alternatives:
-            if alt not in seen:
-                seen.add(alt)
-                unique_alternatives.append(alt)
-        
-        return unique_alternatives
+                rest = pattern[3:]
+                paren = rest.find("(")
+                func_name = rest[:paren]
+                if paren > 0 and func_name.isidentifier():
+                    yield f"fn {func_name}"
+                    yield f"fn {func_name}($$$PARAMS)"
+                    yield f"fn {func_name}($$$PARAMS) {{ $$$BODY }}"
+                    yield "fn $NAME"
     
     @classmethod
     def suggest_working_pattern(cls, pattern: str, language: str) -> Optional[str]:
@@ -130,44 +225,22 @@ class PatternFixer:
         Returns:
             A suggested pattern that should work, or None
         """
-        # Look for common patterns in our library that might match the intent
-        library = CommonPatternLibrary()
-        
         # Try to understand the intent
         intent_keywords = []
         
-        if language == "rust":
-            if "unwrap" in pattern:
-                intent_keywords.append("unwrap")
-            if "expect" in pattern:
-                intent_keywords.append("expect")
-            if "await" in pattern:
-                intent_keywords.append("await")
-            if "spawn" in pattern:
-                intent_keywords.append("spawn")
-            if "?" in pattern:
-                intent_keywords.append("error handling")
-                
-        elif language in ["javascript", "typescript"]:
-            if "await" in pattern:
-                intent_keywords.append("await")
-            if "then" in pattern or "catch" in pattern:
-                intent_keywords.append("promise")
-            if "=>" in pattern:
-                intent_keywords.append("arrow")
-                
-        elif language == "python":
-            if "async def" in pattern:
-                intent_keywords.append("async")
-            if "try" in pattern or "except" in pattern:
-                intent_keywords.append("except")
+        scanner = _INTENT_SCANNERS.get(language)
+        if scanner:
+            intent_re, tokens = scanner
+            found = set(intent_re.findall(pattern))
+            intent_keywords = list(dict.fromkeys(
+                keyword for token, keyword in tokens if token in found
+            ))
         
-        # Find matching patterns from library
+        # Find matching patterns from library, stopping at the first hit
         for keyword in intent_keywords:
-            patterns = library.search_patterns(language, keyword)
-            if patterns:
-                # Return the first matching pattern
-                return patterns[0].pattern
+            suggestion = _first_library_pattern(language, keyword)
+            if suggestion:
+                return suggestion
         
         return None
     
@@ -220,6 +293,51 @@ class PatternFixer:
         return "\n".join(explanations)
 
 
+def _rust_fuzzy_variations(pattern: str) -> Iterator[str]:
+    """Yield fuzzy variations of a Rust pattern."""
+    # Handle async variations
+    if "async fn" in pattern:
+        # Add with/without visibility modifiers
+        if not pattern.startswith("pub "):
+            yield f"pub {pattern}"
+        if "pub " in pattern:
+            yield pattern.replace("pub ", "")
+            
+    # Handle spawn variations
+    if pattern == "spawn(async)":
+        yield from _SPAWN_ALTERNATIVES
+        
+    # Handle method calls
+    if "." in pattern and not pattern.startswith("."):
+        # Add version starting with dot
+        yield "." + pattern.split(".", 1)[1]
+
+
+def _js_fuzzy_variations(pattern: str) -> Iterator[str]:
+    """Yield fuzzy variations of a JavaScript/TypeScript pattern."""
+    # Handle function variations
+    if "function" in pattern:
+        # Add arrow function equivalent
+        if "async function" in pattern:
+            name_match = re.search(r'async function (\w+)', pattern)
+            if name_match:
+                name = name_match.group(1)
+                yield JS_ASYNC_ARROW_TEMPLATE.format(name=name)
+        else:
+            name_match = re.search(r'function (\w+)', pattern)
+            if name_match:
+                name = name_match.group(1)
+                yield JS_ARROW_TEMPLATE.format(name=name)
+
+
+# Language-specific fuzzy variation generators used by FuzzyPatternMatcher
+_FUZZY_VARIATIONS = {
+    "rust": _rust_fuzzy_variations,
+    "javascript": _js_fuzzy_variations,
+    "typescript": _js_fuzzy_variations,
+}
+
+
 class FuzzyPatternMatcher:
     """Provides fuzzy pattern matching capabilities."""
     
@@ -235,52 +353,26 @@ class FuzzyPatternMatcher:
         Returns:
             List of fuzzy pattern variations
         """
-        variations = [pattern]
-        
-        # For Rust
-        if language == "rust":
-            # Handle async variations
-            if "async fn" in pattern:
-                # Add with/without visibility modifiers
-                if not pattern.startswith("pub "):
-                    variations.append(f"pub {pattern}")
-                if "pub " in pattern:
-                    variations.append(pattern.replace("pub ", ""))
-                    
-            # Handle spawn variations
-            if pattern == "spawn(async)":
-                variations.extend([
-                    "spawn($$$ARGS)",
-                    "spawn(async { $$$BODY })",
-                    "spawn(async move { $$$BODY })",
-                    "tokio::spawn($$$ARGS)",
-                    "tokio::spawn(async { $$$BODY })",
-                    "tokio::spawn(async move { $$$BODY })",
-                ])
-                
-            # Handle method calls
-            if "." in pattern and not pattern.startswith("."):
-                # Add version starting with dot
-                variations.append("." + pattern.split(".", 1)[1])
+        # Remove duplicates
+        return list(dict.fromkeys(cls.iter_fuzzy_patterns(pattern, language)))
+    
+    @classmethod
+    def iter_fuzzy_patterns(cls, pattern: str, language: str) -> Iterator[str]:
+        """
+        Lazily yield fuzzy variations of a pattern, possibly with duplicates.
         
-        # For JavaScript/TypeScript
-        elif language in ["javascript", "typescript"]:
-            # Handle function variations
-            if "function" in pattern:
-                # Add arrow function equivalent
-                if "async function" in pattern:
-                    name_match = re.search(r'async function (\w+)', pattern)
-                    if name_match:
-                        name = name_match.group(1)
-                        variations.append(f"const {name} = async ($$$PARAMS) => $$$BODY")
-                else:
-                    name_match = re.search(r'function (\w+)', pattern)
-                    if name_match:
-                        name = name_match.group(1)
-                        variations.append(f"const {name} = ($$$PARAMS) => $$$BODY")
+        Args:
+            pattern: The original pattern
+            language: Programming language
+            
+        Yields:
+            Fuzzy pattern variations, starting with the original
+        """
+        yield pattern
         
-        # Remove duplicates
-        return list(dict.fromkeys(variations))
+        variations = _FUZZY_VARIATIONS.get(language)
+        if variations:
+            yield from variations(pattern)
     
     @classmethod
     def expand_pattern(cls, pattern: str, language: str) -> List[str]:
@@ -301,20 +393,11 @@ class FuzzyPatternMatcher:
         if language == "rust":
             # Expand unwrap to related methods
             if pattern == "unwrap":
-                expansions.extend([
-                    "unwrap()",
-                    "unwrap_or($DEFAULT)",
-                    "unwrap_or_else($CLOSURE)",
-                    "unwrap_or_default()",
-                ])
+                expansions.extend(_UNWRAP_EXPANSIONS)
             
             # Expand error handling
             elif pattern == "error handling":
-                expansions.extend([
-                    "unwrap()",
-                    "expect($MSG)",
-                    "$EXPR?",
-                    "match $RESULT { Ok($VAL) => $OK, Err($ERR) => $ERR_BODY }",
-                ])
+                expansions.extend(_ERROR_HANDLING_EXPANSIONS)
                 
-        return expansions
\ No newline at end of file
+        # Remove duplicates
+        return list(dict.fromkeys(expansions))
@@ -4,13 +4,38 @@ Utilities for enhancing pattern handling, especially error diagnostics.
 
 import re
 import logging
-from typing import Dict, Optional, Any
+from itertools import islice
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Optional
 from ..language_handlers import get_handler
 
 logger = logging.getLogger("ast_grep_mcp.pattern_helpers")
 
+# Rust visibility modifiers, as prefixes accepted by str.startswith
+_RUST_VIS_PREFIXES = ("pub ", "pub(crate) ", "pub(super) ")
+
+# Arrow-function equivalents of a named JavaScript/TypeScript function
+JS_ARROW_TEMPLATE = "const {name} = ($$$PARAMS) => $$$BODY"
+JS_ASYNC_ARROW_TEMPLATE = "const {name} = async ($$$PARAMS) => $$$BODY"
+
+# All metavariables, and the double-dollar form that is neither $ nor $$$
+_METAVAR_RE = re.compile(r"\$(\${0,2}\w+)")
+_INVALID_METAVAR_RE = re.compile(r"(?<!\$)\$\$(?!\$)\w+")
+
+# Fixed sections of the message built by enrich_error_message
+_ENRICH_HEADER = (
+    "\n\nPattern syntax error detected. "
+    "Here are some valid common pattern examples:\n"
+)
+_ENRICH_SYNTAX_HELP = (
+    "\nPatterns use $ to define capture variables/placeholders:\n"
+    "  $NAME - captures a single node\n"
+    "  $$$NAME - captures multiple nodes (variadic)\n"
+)
+_ENRICH_FOOTER = "\nFor more details, see the ast-grep pattern documentation."
+
 # Common pattern syntax errors and their descriptive messages
-COMMON_SYNTAX_ERRORS = {
+COMMON_SYNTAX_ERRORS = MappingProxyType({
     "mismatched_brackets": "Mismatched brackets, braces, or parentheses",
     "invalid_variable": "Invalid metavariable name format",
     "empty_variable": "Empty metavariable (use $_)",
@@ -18,10 +43,10 @@ COMMON_SYNTAX_ERRORS = {
     "missing_dollar": "Missing $ for metavariable",
     "unclosed_string": "Unclosed string literal",
     "invalid_escape": "Invalid escape sequence",
-}
+})
 
 # Language-specific pattern syntax errors and solutions
-LANGUAGE_SPECIFIC_ERRORS = {
+_LANGUAGE_SPECIFIC_ERRORS = {
     "python": {
         "inconsistent_indentation": {
             "message": "Inconsistent indentation in pattern",
@@ -130,6 +155,20 @@ def function():
     },
 }
 
+# Read-only view of the tables above. Entries stay plain dicts because they
+# are returned to callers and serialized into tool responses.
+LANGUAGE_SPECIFIC_ERRORS = MappingProxyType({
+    language: MappingProxyType(errors)
+    for language, errors in _LANGUAGE_SPECIFIC_ERRORS.items()
+})
+
+# Per-language (error, details) pairs for get_pattern_help, built once. The
+# response dicts are built per call, since callers may modify them.
+_COMMON_ERRORS_BY_LANG = MappingProxyType({
+    language: tuple(errors.items())
+    for language, errors in _LANGUAGE_SPECIFIC_ERRORS.items()
+})
+
 
 def is_pattern_syntax_error(error_message: str) -> bool:
     """
@@ -161,23 +200,19 @@ def is_pattern_syntax_error(error_message: str) -> bool:
     )
 
 
-def analyze_pattern_error(pattern: str, language: str) -> Dict[str, Any]:
+def _check_basic(pattern: str, language: str) -> list[Dict[str, Any]]:
     """
-    Analyze a pattern to identify potential syntax errors and provide solutions.
+    Run the language-independent syntax checks on a non-empty pattern.
 
     Args:
-        pattern: The pattern to analyze
+        pattern: The pattern to check
         language: The programming language
 
     Returns:
-        Dictionary with error information and solutions
+        List of error entries for the checks that failed
     """
-    result = {
-        "has_errors": False,
-        "errors": [],
-        "suggestions": [],
-        "language_specific": [],
-    }
+    # Metavariable checks can only fire when the pattern contains a $
+    has_metavars = "$" in pattern
 
     # Check for basic syntax issues
     error_checks = [
@@ -203,22 +238,24 @@ def analyze_pattern_error(pattern: str, language: str) -> Dict[str, Any]:
             "Mismatched angle brackets <>",
         ),
         (
-            lambda p: re.search(r"\$\$[^$\w]", p),
+            lambda p: has_metavars and re.search(r"\$\$[^$\w]", p),
             "invalid_variable",
             "Invalid metavariable (should be $ or $$$)",
         ),
         (
-            lambda p: "$$" in p and "$$$" not in p,
+            lambda p: has_metavars and "$$" in p and "$$$" not in p,
             "invalid_variable",
             "Invalid metavariable (use $$$ for variadic)",
         ),
         (
-            lambda p: re.search(r"\$\s+\w", p),
+            lambda p: has_metavars and re.search(r"\$\s+\w", p),
             "invalid_variable",
             "Space after $ in metavariable",
         ),
         (
-            lambda p: re.search(r"\$\w*\d+\w*", p) and language not in ["rust"],
+            lambda p: has_metavars
+            and re.search(r"\$\w*\d+\w*", p)
+            and language not in ["rust"],
             "invalid_variable",
             "Numbers in metavariable names",
         ),
@@ -237,20 +274,31 @@ def analyze_pattern_error(pattern: str, language: str) -> Dict[str, Any]:
         ),
     ]
 
-    for check_func, error_type, message in error_checks:
-        if check_func(pattern):
-            result["has_errors"] = True
-            result["errors"].append(
-                {
-                    "type": error_type,
-                    "message": message,
-                    "solution": COMMON_SYNTAX_ERRORS.get(
-                        error_type, "Check syntax documentation"
-                    ),
-                }
-            )
+    return [
+        {
+            "type": error_type,
+            "message": message,
+            "solution": COMMON_SYNTAX_ERRORS.get(
+                error_type, "Check syntax documentation"
+            ),
+        }
+        for check_func, error_type, message in error_checks
+        if check_func(pattern)
+    ]
+
+
+def _check_language_specific(pattern: str, language: str) -> list[Dict[str, Any]]:
+    """
+    Run only the language-specific syntax checks on a pattern.
+
+    Args:
+        pattern: The pattern to check
+        language: The programming language
 
-    # Language-specific checks
+    Returns:
+        List of LANGUAGE_SPECIFIC_ERRORS entries that apply to the pattern
+    """
+    issues = []
     if language in LANGUAGE_SPECIFIC_ERRORS:
         lang_errors = LANGUAGE_SPECIFIC_ERRORS[language]
 
@@ -259,16 +307,14 @@ def analyze_pattern_error(pattern: str, language: str) -> Dict[str, Any]:
             if ":" in pattern and not re.search(
                 r"(if|for|while|def|class|with|try|except|lambda).*:", pattern
             ):
-                result["language_specific"].append(lang_errors["missing_colon"])
+                issues.append(lang_errors["missing_colon"])
 
             if (
                 "\n" in pattern
                 and re.search(r"\n\s+\S", pattern)
                 and not re.search(r"\n\s{4}\S", pattern)
             ):
-                result["language_specific"].append(
-                    lang_errors["inconsistent_indentation"]
-                )
+                issues.append(lang_errors["inconsistent_indentation"])
 
         # JavaScript/TypeScript specific checks
         elif language in ["javascript", "typescript"]:
@@ -277,30 +323,57 @@ def analyze_pattern_error(pattern: str, language: str) -> Dict[str, Any]:
                 and ">" in pattern
                 and not re.search(r"<\/?[A-Za-z]([^<>]*)(\/?)>", pattern)
             ):
-                result["language_specific"].append(lang_errors["jsx_syntax"])
+                issues.append(lang_errors["jsx_syntax"])
 
             if "=>" in pattern and not re.search(
                 r"(\(.*\)|[a-zA-Z_$][0-9a-zA-Z_$]*)\s*=>\s*(\{.*\}|[^{])", pattern
             ):
-                result["language_specific"].append(lang_errors["arrow_function"])
+                issues.append(lang_errors["arrow_function"])
+
+    return issues
+
+
+def analyze_pattern_error(pattern: str, language: str) -> Dict[str, Any]:
+    """
+    Analyze a pattern to identify potential syntax errors and provide solutions.
+
+    Args:
+        pattern: The pattern to analyze
+        language: The programming language
+
+    Returns:
+        Dictionary with error information and solutions
+    """
+    result = {
+        "has_errors": False,
+        "errors": [],
+        "suggestions": [],
+        "language_specific": [],
+    }
+
+    # Nothing to check in an empty pattern
+    if not pattern:
+        return result
+
+    result["errors"] = _check_basic(pattern, language)
+    result["language_specific"] = _check_language_specific(pattern, language)
 
     # Extract all metavariables for analysis
-    metavars = re.findall(r"\$(\${0,2}\w+)", pattern)
+    metavars = _METAVAR_RE.findall(pattern) if "$" in pattern else []
     if metavars:
         result["metavariables"] = metavars
 
         # Check for common metavariable issues
-        for var in metavars:
-            if var.startswith("$") and not var.startswith("$$$"):
-                result["has_errors"] = True
-                result["errors"].append(
-                    {
-                        "type": "invalid_variable",
-                        "message": f"Invalid metavariable syntax: ${var} ($$$ for variadic)",
-                        "solution": "Use $ for single capture, $$$ for multiple captures",
-                    }
-                )
+        for match in _INVALID_METAVAR_RE.finditer(pattern):
+            result["errors"].append(
+                {
+                    "type": "invalid_variable",
+                    "message": f"Invalid metavariable syntax: {match.group()} ($$$ for variadic)",
+                    "solution": "Use $ for single capture, $$$ for multiple captures",
+                }
+            )
 
+    result["has_errors"] = bool(result["errors"])
     return result
 
 
@@ -348,10 +421,10 @@ def get_pattern_help(
             help_info["syntax_examples"] = examples
 
     # Add common errors and solutions
-    if language in LANGUAGE_SPECIFIC_ERRORS:
+    if language in _COMMON_ERRORS_BY_LANG:
         help_info["common_errors"] = [
-            {"error": error, "details": details}
-            for error, details in LANGUAGE_SPECIFIC_ERRORS[language].items()
+            {"error": error, "details": dict(details)}
+            for error, details in _COMMON_ERRORS_BY_LANG[language]
         ]
 
     # Add specific help for the error message if provided
@@ -382,34 +455,31 @@ def enrich_error_message(error_message: str, language: str, pattern: str) -> str
     # Get basic pattern help
     help_info = get_pattern_help(language)
 
-    # Analyze the pattern for specific errors
-    analysis = analyze_pattern_error(pattern, language)
+    # Only the language-specific findings are shown in the message
+    language_specific = _check_language_specific(pattern, language)
 
     # Build the enhanced error message
-    enhanced_msg = f"{error_message}\n\nPattern syntax error detected. Here are some valid common pattern examples:\n"
+    parts = [error_message, _ENRICH_HEADER]
 
-    # Add examples from the language handler
-    if help_info["syntax_examples"]:
-        for name, example in help_info["syntax_examples"][:3]:  # Just show the first 3
-            enhanced_msg += f"  {name}: {example}\n"
+    # Add examples from the language handler (just the first 3)
+    for name, example in islice(help_info["syntax_examples"], 3):
+        parts.append(f"  {name}: {example}\n")
 
     # Add basic syntax explanation
-    enhanced_msg += "\nPatterns use $ to define capture variables/placeholders:\n"
-    enhanced_msg += "  $NAME - captures a single node\n"
-    enhanced_msg += "  $$$NAME - captures multiple nodes (variadic)\n"
+    parts.append(_ENRICH_SYNTAX_HELP)
 
     # Add language-specific suggestions if available
-    if analysis["language_specific"]:
-        enhanced_msg += "\nCommon issues in this language:\n"
-        for error in analysis["language_specific"][:2]:  # Show just the first 2
-            enhanced_msg += f"  - {error['message']}: {error['solution']}\n"
+    if language_specific:
+        parts.append("\nCommon issues in this language:\n")
+        for error in language_specific[:2]:  # Show just the first 2
+            parts.append(f"  - {error['message']}: {error['solution']}\n")
             if "example" in error:
-                enhanced_msg += f"    Example: {error['example']}\n"
+                parts.append(f"    Example: {error['example']}\n")
 
     # Point to documentation
-    enhanced_msg += "\nFor more details, see the ast-grep pattern documentation."
+    parts.append(_ENRICH_FOOTER)
 
-    return enhanced_msg
+    return "".join(parts)
 
 
 def generate_alternative_patterns(pattern: str, language: str) -> list[str]:
@@ -427,18 +497,28 @@ def generate_alternative_patterns(pattern: str, language: str) -> list[str]:
     Returns:
         List of alternative patterns to try
     """
-    alternatives = []
-    
+    return list(iter_alternative_patterns(pattern, language))
+
+
+def iter_alternative_patterns(pattern: str, language: str) -> Iterator[str]:
+    """
+    Lazily yield alternative patterns, for callers that stop at the first match.
+
+    Args:
+        pattern: The original pattern
+        language: The programming language
+
+    Yields:
+        Alternative patterns to try, in the same order as
+        generate_alternative_patterns
+    """
     if language == "rust":
         # Handle async function patterns
         if "async fn " in pattern:
-            # Check if it already has visibility modifier
-            has_visibility = any(pattern.startswith(vis + " ") for vis in ["pub", "pub(crate)", "pub(super)"])
-            
             if pattern.startswith("async fn "):
                 # No visibility modifier, add alternatives with visibility
-                alternatives.append(f"pub {pattern}")
-                alternatives.append(f"pub(crate) {pattern}")
+                yield f"pub {pattern}"
+                yield f"pub(crate) {pattern}"
             
             # If it has a specific name, try with metavariable
             parts = pattern.split()
@@ -448,15 +528,15 @@ def generate_alternative_patterns(pattern: str, language: str) -> list[str]:
                 # Replace specific name with metavariable
                 new_parts = parts[:fn_index + 1] + ["$NAME"] + parts[fn_index + 2:]
                 metavar_pattern = " ".join(new_parts)
-                alternatives.append(metavar_pattern)
+                yield metavar_pattern
         
         # Handle regular function patterns
         elif pattern.startswith("fn ") and "async" not in pattern:
             # Also look for async versions
-            alternatives.append(f"async {pattern}")
-            if not any(pattern.startswith(vis + " ") for vis in ["pub", "pub(crate)", "pub(super)"]):
-                alternatives.append(f"pub {pattern}")
-                alternatives.append(f"pub async {pattern}")
+            yield f"async {pattern}"
+            if not pattern.startswith(_RUST_VIS_PREFIXES):
+                yield f"pub {pattern}"
+                yield f"pub async {pattern}"
     
     elif language in ["javascript", "typescript"]:
         # Handle function patterns
@@ -465,14 +545,12 @@ def generate_alternative_patterns(pattern: str, language: str) -> list[str]:
             parts = pattern.split()
             if len(parts) >= 2 and not parts[1].startswith("$"):
                 name = parts[1]
-                alternatives.append(f"const {name} = ($$$PARAMS) => $$$BODY")
-                alternatives.append(f"const {name} = async ($$$PARAMS) => $$$BODY")
+                yield JS_ARROW_TEMPLATE.format(name=name)
+                yield JS_ASYNC_ARROW_TEMPLATE.format(name=name)
         
         # Handle async patterns
         if pattern.startswith("async function "):
             parts = pattern.split()
             if len(parts) >= 3 and not parts[2].startswith("$"):
                 name = parts[2]
-                alternatives.append(f"const {name} = async ($$$PARAMS) => $$$BODY")
-    
-    return alternatives
+                yield JS_ASYNC_ARROW_TEMPLATE.format(name=name)
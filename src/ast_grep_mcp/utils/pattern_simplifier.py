@@ -5,11 +5,212 @@ This module provides functionality to simplify complex patterns that may fail
 and suggest simpler alternatives that are more likely to work.
 """
 
+import functools
 import re
-from typing import List, Dict, Tuple
+from types import MappingProxyType
+from typing import Iterator, List, Mapping, Tuple
 import logging
 
 
+def _compile_constructs(*constructs: str) -> Tuple[Tuple[str, re.Pattern], ...]:
+    """Pair each construct keyword with a regex capturing the metavariable after it."""
+    return tuple(
+        (construct, re.compile(rf'{re.escape(construct)}\s+(\$\w+)'))
+        for construct in constructs
+    )
+
+
+# Main constructs (function, class, etc.) per language for generic simplification
+_MAIN_CONSTRUCTS = {
+    'rust': _compile_constructs('fn', 'async fn', 'impl', 'struct', 'trait'),
+    'javascript': _compile_constructs('function', 'class', 'const', 'let', 'var'),
+    'python': _compile_constructs('def', 'class', 'async def'),
+    'go': _compile_constructs('func', 'type', 'interface'),
+    'c': _compile_constructs('void', 'int', 'struct', 'typedef'),
+}
+
+# Issue tags reported by analyze_complexity. The same objects key the
+# strategy tables below, so "issue in lang_strategies" hits on identity.
+_ISSUE_MULTIPLE_COMPLEX_METAVARS = 'multiple_complex_metavars'
+_ISSUE_FUNCTION_WITH_PARAMS_AND_BODY = 'function_with_params_and_body'
+_ISSUE_COMPLEX_ASYNC_FUNCTION = 'complex_async_function'
+_ISSUE_NESTED_BRACES = 'nested_braces'
+_ISSUE_CLASS_WITH_BODY = 'class_with_body'
+_ISSUE_TOO_MANY_METAVARS = 'too_many_metavars'
+_ISSUE_UNBALANCED_PARENTHESES = 'unbalanced_parentheses'
+_ISSUE_UNBALANCED_BRACES = 'unbalanced_braces'
+_ISSUE_UNBALANCED_BRACKETS = 'unbalanced_brackets'
+
+# Strategy table key holding general suggestions rather than rewrites
+_SUGGESTIONS = 'suggestions'
+
+# Simplification strategies by language; shared read-only by every PatternSimplifier
+_SIMPLIFICATION_STRATEGIES = MappingProxyType({
+    'rust': MappingProxyType({
+        _ISSUE_FUNCTION_WITH_PARAMS_AND_BODY: (
+            ('fn $NAME($$$PARAMS) { $$$BODY }', 'fn $NAME'),
+            ('async fn $NAME($$$PARAMS) { $$$BODY }', 'async fn $NAME'),
+            ('pub fn $NAME($$$PARAMS) { $$$BODY }', 'pub fn $NAME'),
+            ('pub async fn $NAME($$$PARAMS) { $$$BODY }', 'pub async fn $NAME'),
+        ),
+        _ISSUE_COMPLEX_ASYNC_FUNCTION: (
+            ('async fn $NAME($$$) { $$$$ }', 'async fn $NAME'),
+            ('async { $$$$ }', 'async'),
+        ),
+        _SUGGESTIONS: (
+            'For Rust functions, try: fn $NAME',
+            'For async functions: async fn $NAME',
+            'For trait implementations: impl $TRAIT for $TYPE',
+            'For match expressions: match $EXPR',
+        )
+    }),
+    'javascript': MappingProxyType({
+        _ISSUE_FUNCTION_WITH_PARAMS_AND_BODY: (
+            ('function $NAME($$$PARAMS) { $$$BODY }', 'function $NAME'),
+            ('const $NAME = ($$$PARAMS) => { $$$BODY }', 'const $NAME = '),
+            ('async function $NAME($$$PARAMS) { $$$BODY }', 'async function $NAME'),
+        ),
+        _SUGGESTIONS: (
+            'For functions: function $NAME',
+            'For arrow functions: const $NAME =',
+            'For async functions: async function $NAME',
+            'For classes: class $NAME',
+        )
+    }),
+    'python': MappingProxyType({
+        _ISSUE_FUNCTION_WITH_PARAMS_AND_BODY: (
+            ('def $NAME($$$PARAMS): $$$BODY', 'def $NAME'),
+            ('async def $NAME($$$PARAMS): $$$BODY', 'async def $NAME'),
+            ('def $NAME($$$PARAMS):', 'def $NAME'),
+        ),
+        _ISSUE_CLASS_WITH_BODY: (
+            ('class $NAME: $$$BODY', 'class $NAME:'),
+            ('class $NAME($BASE): $$$BODY', 'class $NAME'),
+        ),
+        _SUGGESTIONS: (
+            'For functions: def $NAME',
+            'For async functions: async def $NAME',
+            'For classes: class $NAME:',
+            'For decorators: @$DECORATOR',
+        )
+    }),
+    'go': MappingProxyType({
+        _ISSUE_FUNCTION_WITH_PARAMS_AND_BODY: (
+            ('func $NAME($$$PARAMS) $RETURN { $$$BODY }', 'func $NAME'),
+            ('func ($RECV) $NAME($$$PARAMS) { $$$BODY }', 'func $NAME'),
+        ),
+        _SUGGESTIONS: (
+            'For functions: func $NAME',
+            'For methods: func ($RECV) $NAME',
+            'For structs: type $NAME struct',
+            'For interfaces: type $NAME interface',
+        )
+    })
+})
+_NO_STRATEGIES: Mapping[str, Tuple[Tuple[str, str], ...]] = MappingProxyType({})
+
+# Examples of working patterns per language, keyed by category
+_PATTERN_EXAMPLES: Mapping[str, Mapping[str, Tuple[str, ...]]] = MappingProxyType({
+    'rust': MappingProxyType({
+        'functions': (
+            'fn $NAME',
+            'pub fn $NAME',
+            'async fn $NAME',
+            'pub async fn $NAME',
+        ),
+        'async': (
+            'async',
+            '$EXPR.await',
+            'tokio::spawn',
+        ),
+        'types': (
+            'struct $NAME',
+            'enum $NAME',
+            'impl $TYPE',
+            'impl $TRAIT for $TYPE',
+        ),
+        'control_flow': (
+            'match $EXPR',
+            'if let $PATTERN = $EXPR',
+            'loop',
+            'while $COND',
+        ),
+    }),
+    'javascript': MappingProxyType({
+        'functions': (
+            'function $NAME',
+            'const $NAME = function',
+            'const $NAME = () =>',
+            'async function $NAME',
+        ),
+        'classes': (
+            'class $NAME',
+            'class $NAME extends $BASE',
+        ),
+        'async': (
+            'await $EXPR',
+            'async',
+            'Promise',
+            '.then',
+        ),
+        'imports': (
+            'import $NAME',
+            'import { $NAME }',
+            'require($MODULE)',
+        ),
+    }),
+    'python': MappingProxyType({
+        'functions': (
+            'def $NAME',
+            'def $NAME():',
+            'async def $NAME',
+            'lambda',
+        ),
+        'classes': (
+            'class $NAME:',
+            'class $NAME($BASE):',
+        ),
+        'control_flow': (
+            'if $COND:',
+            'for $VAR in $ITER:',
+            'while $COND:',
+            'try:',
+        ),
+        'decorators': (
+            '@$DECORATOR',
+            '@property',
+            '@staticmethod',
+        ),
+    }),
+    'go': MappingProxyType({
+        'functions': (
+            'func $NAME',
+            'func ($RECV) $NAME',
+        ),
+        'types': (
+            'type $NAME struct',
+            'type $NAME interface',
+        ),
+        'control_flow': (
+            'if $COND',
+            'for $INIT; $COND; $POST',
+            'switch $EXPR',
+            'select',
+        ),
+        'concurrency': (
+            'go $FUNC',
+            'chan $TYPE',
+            '<-$CHAN',
+        ),
+    }),
+})
+_NO_EXAMPLES: Mapping[str, Tuple[str, ...]] = MappingProxyType({})
+
+_SIMPLE_METAVAR_RE = re.compile(r'\$\w+')
+_VARIADIC_PARAMS_RE = re.compile(r'\([^)]*\$\$\$\w+[^)]*\)')
+_VARIADIC_BODY_RE = re.compile(r'\{[^}]*\$\$\$\w+[^}]*\}')
+
+
 class PatternSimplifier:
     """Simplifies complex patterns and provides alternatives."""
     
@@ -19,79 +220,52 @@ class PatternSimplifier:
         # Pattern complexity indicators
         self.complexity_patterns = {
             # Multiple metavariables in one pattern
-            r'\$\w+.*\$\$\$\w+.*\$\$\$\w+': 'multiple_complex_metavars',
+            r'\$\w+.*\$\$\$\w+.*\$\$\$\w+': _ISSUE_MULTIPLE_COMPLEX_METAVARS,
             # Function with params and body
-            r'(fn|function|def)\s+\$\w+\s*\([^)]*\$\$\$\w+[^)]*\)\s*[{:]?\s*\$\$\$\w+': 'function_with_params_and_body',
+            r'(fn|function|def)\s+\$\w+\s*\([^)]*\$\$\$\w+[^)]*\)\s*[{:]?\s*\$\$\$\w+': _ISSUE_FUNCTION_WITH_PARAMS_AND_BODY,
             # Complex async patterns
-            r'async\s+(fn|function)\s+\$\w+\s*\([^)]*\)\s*.*\{.*\}': 'complex_async_function',
+            r'async\s+(fn|function)\s+\$\w+\s*\([^)]*\)\s*.*\{.*\}': _ISSUE_COMPLEX_ASYNC_FUNCTION,
             # Nested structures
-            r'\{[^}]*\{[^}]*\}[^}]*\}': 'nested_braces',
+            r'\{[^}]*\{[^}]*\}[^}]*\}': _ISSUE_NESTED_BRACES,
             # Complex class patterns
-            r'(class|struct)\s+\$\w+.*\{.*\$\$\$\w+.*\}': 'class_with_body',
+            r'(class|struct)\s+\$\w+.*\{.*\$\$\$\w+.*\}': _ISSUE_CLASS_WITH_BODY,
         }
         
+        # Literals each regex above cannot match without. They are checked
+        # against the lowercased pattern (the regexes are case-insensitive), so
+        # simple patterns skip the regex battery with a few substring tests.
+        required_literals = {
+            _ISSUE_MULTIPLE_COMPLEX_METAVARS: ('$$$',),
+            _ISSUE_FUNCTION_WITH_PARAMS_AND_BODY: ('$$$', '('),
+            _ISSUE_COMPLEX_ASYNC_FUNCTION: ('async', '(', '{', '}'),
+            _ISSUE_NESTED_BRACES: ('{', '}'),
+            _ISSUE_CLASS_WITH_BODY: ('$$$', '{', '}'),
+        }
+        
+        # Compiled once here so analyze_complexity doesn't re-resolve them per call
+        self._complexity_regexes = [
+            (re.compile(regex, re.IGNORECASE), issue_type, frozenset(required_literals[issue_type]))
+            for regex, issue_type in self.complexity_patterns.items()
+        ]
+        # Every literal any regex needs; scanned once per pattern
+        self._complexity_literals = tuple(
+            sorted(set().union(*required_literals.values()))
+        )
+        self._metavar_rx = re.compile(r'\$+\w+')
+        
+        # analyze_complexity is pure in the pattern; remember recent results
+        self._complexity_cache = functools.lru_cache(maxsize=512)(self._compute_complexity)
+        
         # Simplification strategies by language
-        self.simplification_strategies = {
-            'rust': {
-                'function_with_params_and_body': [
-                    ('fn $NAME($$$PARAMS) { $$$BODY }', 'fn $NAME'),
-                    ('async fn $NAME($$$PARAMS) { $$$BODY }', 'async fn $NAME'),
-                    ('pub fn $NAME($$$PARAMS) { $$$BODY }', 'pub fn $NAME'),
-                    ('pub async fn $NAME($$$PARAMS) { $$$BODY }', 'pub async fn $NAME'),
-                ],
-                'complex_async_function': [
-                    ('async fn $NAME($$$) { $$$$ }', 'async fn $NAME'),
-                    ('async { $$$$ }', 'async'),
-                ],
-                'suggestions': [
-                    'For Rust functions, try: fn $NAME',
-                    'For async functions: async fn $NAME',
-                    'For trait implementations: impl $TRAIT for $TYPE',
-                    'For match expressions: match $EXPR',
-                ]
-            },
-            'javascript': {
-                'function_with_params_and_body': [
-                    ('function $NAME($$$PARAMS) { $$$BODY }', 'function $NAME'),
-                    ('const $NAME = ($$$PARAMS) => { $$$BODY }', 'const $NAME = '),
-                    ('async function $NAME($$$PARAMS) { $$$BODY }', 'async function $NAME'),
-                ],
-                'suggestions': [
-                    'For functions: function $NAME',
-                    'For arrow functions: const $NAME =',
-                    'For async functions: async function $NAME',
-                    'For classes: class $NAME',
-                ]
-            },
-            'python': {
-                'function_with_params_and_body': [
-                    ('def $NAME($$$PARAMS): $$$BODY', 'def $NAME'),
-                    ('async def $NAME($$$PARAMS): $$$BODY', 'async def $NAME'),
-                    ('def $NAME($$$PARAMS):', 'def $NAME'),
-                ],
-                'class_with_body': [
-                    ('class $NAME: $$$BODY', 'class $NAME:'),
-                    ('class $NAME($BASE): $$$BODY', 'class $NAME'),
-                ],
-                'suggestions': [
-                    'For functions: def $NAME',
-                    'For async functions: async def $NAME',
-                    'For classes: class $NAME:',
-                    'For decorators: @$DECORATOR',
-                ]
-            },
-            'go': {
-                'function_with_params_and_body': [
-                    ('func $NAME($$$PARAMS) $RETURN { $$$BODY }', 'func $NAME'),
-                    ('func ($RECV) $NAME($$$PARAMS) { $$$BODY }', 'func $NAME'),
-                ],
-                'suggestions': [
-                    'For functions: func $NAME',
-                    'For methods: func ($RECV) $NAME',
-                    'For structs: type $NAME struct',
-                    'For interfaces: type $NAME interface',
-                ]
-            }
+        self.simplification_strategies = _SIMPLIFICATION_STRATEGIES
+        
+        # Compiled matchers for every complex template in the strategies above
+        self._template_regexes = {
+            complex_pattern: self._compile_template(complex_pattern)
+            for lang_strategies in self.simplification_strategies.values()
+            for issue, entries in lang_strategies.items()
+            if issue != _SUGGESTIONS
+            for complex_pattern, _ in entries
         }
     
     def analyze_complexity(self, pattern: str) -> List[str]:
@@ -104,26 +278,36 @@ class PatternSimplifier:
         Returns:
             List of complexity issues found
         """
+        return list(self._complexity_cache(pattern))
+    
+    def _compute_complexity(self, pattern: str) -> Tuple[str, ...]:
+        """Uncached implementation of analyze_complexity."""
         issues = []
         
-        for regex, issue_type in self.complexity_patterns.items():
-            if re.search(regex, pattern, re.IGNORECASE):
+        # One pass over the literals decides which regexes can possibly match
+        lowered = pattern.lower()
+        present = frozenset(
+            [literal for literal in self._complexity_literals if literal in lowered]
+        )
+        for regex, issue_type, required in self._complexity_regexes:
+            if required <= present and regex.search(pattern):
                 issues.append(issue_type)
         
         # Additional checks
-        metavar_count = len(re.findall(r'\$+\w+', pattern))
+        metavar_count = len(self._metavar_rx.findall(pattern))
         if metavar_count > 3:
-            issues.append('too_many_metavars')
+            issues.append(_ISSUE_TOO_MANY_METAVARS)
         
-        # Check for unbalanced delimiters
+        # Check for unbalanced delimiters. Six C-level str.count scans are
+        # an order of magnitude faster than one Python-level counting pass.
         if pattern.count('(') != pattern.count(')'):
-            issues.append('unbalanced_parentheses')
+            issues.append(_ISSUE_UNBALANCED_PARENTHESES)
         if pattern.count('{') != pattern.count('}'):
-            issues.append('unbalanced_braces')
+            issues.append(_ISSUE_UNBALANCED_BRACES)
         if pattern.count('[') != pattern.count(']'):
-            issues.append('unbalanced_brackets')
+            issues.append(_ISSUE_UNBALANCED_BRACKETS)
         
-        return issues
+        return tuple(issues)
     
     def simplify_pattern(self, pattern: str, language: str) -> List[Tuple[str, str]]:
         """
@@ -136,39 +320,55 @@ class PatternSimplifier:
         Returns:
             List of (simplified_pattern, description) tuples
         """
-        simplified = []
+        return list(self.iter_simplified_patterns(pattern, language))
+    
+    def iter_simplified_patterns(self, pattern: str, language: str) -> Iterator[Tuple[str, str]]:
+        """
+        Lazily yield the alternatives returned by simplify_pattern.
+        
+        Callers that only show the first few alternatives can stop early
+        (e.g. with itertools.islice) without running the remaining strategies.
+        
+        Args:
+            pattern: The complex pattern
+            language: The programming language
+            
+        Yields:
+            (simplified_pattern, description) tuples
+        """
         issues = self.analyze_complexity(pattern)
         
         if not issues:
-            return [(pattern, "Pattern appears simple enough")]
+            yield (pattern, "Pattern appears simple enough")
+            return
         
         # Get language-specific simplifications
-        lang_strategies = self.simplification_strategies.get(language, {})
+        lang_strategies = self.simplification_strategies.get(language, _NO_STRATEGIES)
         
         # Apply simplification strategies based on issues
+        found_specific = False
         for issue in issues:
             if issue in lang_strategies:
                 for complex_pattern, simple_pattern in lang_strategies[issue]:
                     if self._pattern_matches_template(pattern, complex_pattern):
-                        simplified.append((
+                        found_specific = True
+                        yield (
                             simple_pattern,
                             f"Simplified from: {complex_pattern}"
-                        ))
+                        )
         
         # If no specific simplifications found, try generic ones
-        if not simplified:
-            simplified.extend(self._generic_simplifications(pattern, language))
+        if not found_specific:
+            yield from self._generic_simplifications(pattern, language)
         
         # Add language-specific suggestions
-        if 'suggestions' in lang_strategies:
-            for suggestion in lang_strategies['suggestions']:
-                simplified.append((suggestion, "Common pattern suggestion"))
-        
-        return simplified
+        if _SUGGESTIONS in lang_strategies:
+            for suggestion in lang_strategies[_SUGGESTIONS]:
+                yield (suggestion, "Common pattern suggestion")
     
-    def _pattern_matches_template(self, pattern: str, template: str) -> bool:
-        """Check if a pattern roughly matches a template."""
-        # Convert template to regex pattern
+    @staticmethod
+    def _compile_template(template: str) -> re.Pattern:
+        """Convert a simplification template into a compiled regex."""
         regex_pattern = re.escape(template)
         regex_pattern = regex_pattern.replace(r'\$NAME', r'\$\w+')
         regex_pattern = regex_pattern.replace(r'\$\$\$PARAMS', r'.*?')
@@ -176,48 +376,43 @@ class PatternSimplifier:
         regex_pattern = regex_pattern.replace(r'\$\$\$\w+', r'.*?')
         regex_pattern = regex_pattern.replace(r'\$\w+', r'\$\w+')
         
-        return bool(re.search(regex_pattern, pattern, re.IGNORECASE | re.DOTALL))
+        return re.compile(regex_pattern, re.IGNORECASE | re.DOTALL)
     
-    def _generic_simplifications(self, pattern: str, language: str) -> List[Tuple[str, str]]:
-        """Apply generic simplification strategies."""
-        simplified = []
+    def _pattern_matches_template(self, pattern: str, template: str) -> bool:
+        """Check if a pattern roughly matches a template."""
+        regex = self._template_regexes.get(template)
+        if regex is None:
+            regex = self._compile_template(template)
         
+        return regex.search(pattern) is not None
+    
+    def _generic_simplifications(self, pattern: str, language: str) -> Iterator[Tuple[str, str]]:
+        """Apply generic simplification strategies."""
         # Extract the main construct (function, class, etc.)
-        main_constructs = {
-            'rust': ['fn', 'async fn', 'impl', 'struct', 'trait'],
-            'javascript': ['function', 'class', 'const', 'let', 'var'],
-            'python': ['def', 'class', 'async def'],
-            'go': ['func', 'type', 'interface'],
-            'c': ['void', 'int', 'struct', 'typedef'],
-        }
-        
-        constructs = main_constructs.get(language, [])
-        
-        for construct in constructs:
+        for construct, construct_rx in _MAIN_CONSTRUCTS.get(language, ()):
+            # Cheap substring test first; most constructs are absent
             if construct in pattern:
                 # Try to extract metavariable after construct
-                match = re.search(rf'{construct}\s+(\$\w+)', pattern)
+                match = construct_rx.search(pattern)
                 if match:
                     simple = f"{construct} {match.group(1)}"
-                    simplified.append((simple, f"Simplified to basic {construct} pattern"))
+                    yield (simple, f"Simplified to basic {construct} pattern")
         
         # If pattern has multiple metavariables, suggest using just the first
-        metavars = re.findall(r'\$\w+', pattern)
+        metavars = _SIMPLE_METAVAR_RE.findall(pattern)
         if len(metavars) > 1:
             first_metavar = metavars[0]
-            simplified.append((first_metavar, "Use just the primary metavariable"))
+            yield (first_metavar, "Use just the primary metavariable")
         
         # Remove complex body/parameter patterns
         if '$$$' in pattern:
-            simple = re.sub(r'\([^)]*\$\$\$\w+[^)]*\)', '', pattern)
-            simple = re.sub(r'\{[^}]*\$\$\$\w+[^}]*\}', '', simple)
+            simple = _VARIADIC_PARAMS_RE.sub('', pattern)
+            simple = _VARIADIC_BODY_RE.sub('', simple)
             simple = simple.strip()
             if simple and simple != pattern:
-                simplified.append((simple, "Removed complex parameter/body patterns"))
-        
-        return simplified
+                yield (simple, "Removed complex parameter/body patterns")
     
-    def get_pattern_examples(self, language: str) -> Dict[str, List[str]]:
+    def get_pattern_examples(self, language: str) -> Mapping[str, Tuple[str, ...]]:
         """
         Get examples of working patterns for a language.
         
@@ -225,101 +420,6 @@ class PatternSimplifier:
             language: The programming language
             
         Returns:
-            Dictionary of pattern categories to example patterns
+            Read-only mapping of pattern categories to example patterns
         """
-        examples = {
-            'rust': {
-                'functions': [
-                    'fn $NAME',
-                    'pub fn $NAME',
-                    'async fn $NAME',
-                    'pub async fn $NAME',
-                ],
-                'async': [
-                    'async',
-                    '$EXPR.await',
-                    'tokio::spawn',
-                ],
-                'types': [
-                    'struct $NAME',
-                    'enum $NAME',
-                    'impl $TYPE',
-                    'impl $TRAIT for $TYPE',
-                ],
-                'control_flow': [
-                    'match $EXPR',
-                    'if let $PATTERN = $EXPR',
-                    'loop',
-                    'while $COND',
-                ],
-            },
-            'javascript': {
-                'functions': [
-                    'function $NAME',
-                    'const $NAME = function',
-                    'const $NAME = () =>',
-                    'async function $NAME',
-                ],
-                'classes': [
-                    'class $NAME',
-                    'class $NAME extends $BASE',
-                ],
-                'async': [
-                    'await $EXPR',
-                    'async',
-                    'Promise',
-                    '.then',
-                ],
-                'imports': [
-                    'import $NAME',
-                    'import { $NAME }',
-                    'require($MODULE)',
-                ],
-            },
-            'python': {
-                'functions': [
-                    'def $NAME',
-                    'def $NAME():',
-                    'async def $NAME',
-                    'lambda',
-                ],
-                'classes': [
-                    'class $NAME:',
-                    'class $NAME($BASE):',
-                ],
-                'control_flow': [
-                    'if $COND:',
-                    'for $VAR in $ITER:',
-                    'while $COND:',
-                    'try:',
-                ],
-                'decorators': [
-                    '@$DECORATOR',
-                    '@property',
-                    '@staticmethod',
-                ],
-            },
-            'go': {
-                'functions': [
-                    'func $NAME',
-                    'func ($RECV) $NAME',
-                ],
-                'types': [
-                    'type $NAME struct',
-                    'type $NAME interface',
-                ],
-                'control_flow': [
-                    'if $COND',
-                    'for $INIT; $COND; $POST',
-                    'switch $EXPR',
-                    'select',
-                ],
-                'concurrency': [
-                    'go $FUNC',
-                    'chan $TYPE',
-                    '<-$CHAN',
-                ],
-            }
-        }
-        
-        return examples.get(language, {})
\ No newline at end of file
+        return _PATTERN_EXAMPLES.get(language, _NO_EXAMPLES)
\ No newline at end of file
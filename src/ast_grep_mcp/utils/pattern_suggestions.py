@@ -5,13 +5,76 @@ This module provides functionality to suggest alternative patterns
 when a pattern doesn't match or yields unexpected results.
 """
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+import functools
+import heapq
 import re
 import logging
-from ..language_handlers import get_handler
+import weakref
+from ..language_handlers import LanguageHandler, get_handler
 
 logger = logging.getLogger("ast_grep_mcp.pattern_suggestions")
 
+# Regexes used by get_pattern_variants
+_VAR_RE = re.compile(r"\$([A-Z_][A-Z0-9_]*)")
+_TRIPLE_VAR_RE = re.compile(r"\$\$\$([A-Z_][A-Z0-9_]*)")
+_BRACE_RE = re.compile(r"(\{[^{}]*\})")
+_OPTIONAL_RE = re.compile(r"\?[^:]*:")
+_PAREN_RE = re.compile(r"\([^()]*\)")
+_PAREN_CONTENT_RE = re.compile(r"\([^)]*\)")
+_JS_FUNCTION_RE = re.compile(r"(function\s+\w+\s*\([^)]*\))\s*\{")
+# One scan for both JavaScript-to-Python conversions: "call {" with an optional
+# leading "function " keyword
+_JS_BLOCK_RE = re.compile(r"(?P<func>function\s+)?(?P<call>\w+\s*\([^)]*\))\s*\{")
+
+# Characters at least one get_pattern_variants rule needs to fire
+_VARIANT_TRIGGERS = frozenset("${(?\n:")
+
+# Splits a pattern into word/metavariable tokens and single punctuation tokens
+_TOKEN_RE = re.compile(r"[$\w]+|[^\s\w]")
+
+# Token bitmaps: each distinct library token gets one bit, so the token
+# overlap between a pattern and a library entry is a single "&" plus a
+# popcount instead of a set intersection
+LibraryEntry = Tuple[str, str, int, int]  # name, pattern, token bits, keyword bits
+LibraryIndex = Tuple[Dict[str, int], Tuple[LibraryEntry, ...]]
+
+# Tokenized pattern library per handler, see _get_library_index
+_LIBRARY_INDEX: "weakref.WeakKeyDictionary[LanguageHandler, LibraryIndex]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_library_index(handler: LanguageHandler) -> LibraryIndex:
+    """
+    Return the handler's default patterns with their tokens precomputed.
+
+    The index is built on first use and cached per handler instance, so
+    each library pattern is tokenized once instead of on every suggestion.
+
+    Args:
+        handler: The language handler whose default patterns to index
+
+    Returns:
+        Tuple of the token-to-bit mapping and the (name, pattern, token bits,
+        non-metavariable token bits) entries
+    """
+    index = _LIBRARY_INDEX.get(handler)
+    if index is None:
+        token_bits: Dict[str, int] = {}
+        entries = []
+        for name, lib_pattern in handler.get_default_patterns().items():
+            tokens_mask = keywords_mask = 0
+            for token in _TOKEN_RE.findall(lib_pattern):
+                bit = token_bits.setdefault(token, 1 << len(token_bits))
+                tokens_mask |= bit
+                if not token.startswith("$"):
+                    keywords_mask |= bit
+            entries.append((name, lib_pattern, tokens_mask, keywords_mask))
+        index = (token_bits, tuple(entries))
+        _LIBRARY_INDEX[handler] = index
+    return index
+
 
 def get_pattern_variants(pattern: str) -> List[str]:
     """
@@ -27,87 +90,98 @@ def get_pattern_variants(pattern: str) -> List[str]:
     Returns:
         List of alternative patterns to try
     """
-    variants = []
+    return list(_pattern_variants(pattern))
 
-    # Replace specific identifiers with wildcards
-    var_pattern = re.compile(r"\$([A-Z_][A-Z0-9_]*)")
 
-    # Instead of converting to list upfront, iterate directly over the iterator
-    for match in var_pattern.finditer(pattern):
+@functools.lru_cache(maxsize=512)
+def _pattern_variants(pattern: str) -> Tuple[str, ...]:
+    """Cached implementation of get_pattern_variants."""
+    # Every rule below is triggered by one of these characters, so plain
+    # words and dotted names have no variants
+    if _VARIANT_TRIGGERS.isdisjoint(pattern):
+        return ()
+
+    # Ordered set of variants; dict keys keep insertion order and drop repeats
+    variants: Dict[str, None] = {}
+
+    # Replace specific identifiers with wildcards
+    for match in _VAR_RE.finditer(pattern) if "$" in pattern else ():
         # Replace specific variables with generic wildcards
         variant = pattern[: match.start()] + "$_" + pattern[match.end() :]
-        variants.append(variant)
+        variants[variant] = None
 
     # Remove specific variable names in triple-$ patterns
-    triple_var_pattern = re.compile(r"\$\$\$([A-Z_][A-Z0-9_]*)")
-    if triple_var_pattern.search(pattern):
-        variant = triple_var_pattern.sub("$$$_", pattern)
-        variants.append(variant)
+    if "$$$" in pattern and _TRIPLE_VAR_RE.search(pattern):
+        variant = _TRIPLE_VAR_RE.sub("$$$_", pattern)
+        variants[variant] = None
 
     # Simplify nested structures (remove content inside {})
-    brace_pattern = re.compile(r"(\{[^{}]*\})")
-    if brace_pattern.search(pattern):
-        variant = brace_pattern.sub("{$$$_}", pattern)
-        variants.append(variant)
+    if "{" in pattern and _BRACE_RE.search(pattern):
+        variant = _BRACE_RE.sub("{$$$_}", pattern)
+        variants[variant] = None
 
     # Remove optional parts (parts that can be absent in some cases)
-    optional_pattern = re.compile(r"\?[^:]*:")
-    if optional_pattern.search(pattern):
-        variant = optional_pattern.sub("", pattern)
-        variants.append(variant)
+    if "?" in pattern and _OPTIONAL_RE.search(pattern):
+        variant = _OPTIONAL_RE.sub("", pattern)
+        variants[variant] = None
 
     # Handle parentheses structures (function calls, etc.)
-    paren_pattern = re.compile(r"\([^()]*\)")
-    if paren_pattern.search(pattern):
-        variant = paren_pattern.sub("($$$_)", pattern)
-        variants.append(variant)
+    if "(" in pattern and _PAREN_RE.search(pattern):
+        variant = _PAREN_RE.sub("($$$_)", pattern)
+        variants[variant] = None
 
     # For function definitions, try with any params
     if pattern.startswith("def ") and "(" in pattern:
-        variant = re.sub(r"\([^)]*\)", "($$$_)", pattern)
-        variants.append(variant)
+        variant = _PAREN_CONTENT_RE.sub("($$$_)", pattern)
+        variants[variant] = None
 
     # For class definitions, try without base classes
     if pattern.startswith("class ") and "(" in pattern:
-        variant = re.sub(r"\([^)]*\)", "", pattern)
-        variants.append(variant)
+        variant = _PAREN_CONTENT_RE.sub("", pattern)
+        variants[variant] = None
 
     # For multi-line patterns, extract just the first line
     if "\n" in pattern:
         first_line = pattern.split("\n")[0]
-        variants.append(first_line)
-
-    # Convert JavaScript-style syntax to Python-style
-    js_function_pattern = re.compile(r"(function\s+\w+\s*\([^)]*\))\s*\{")
-    js_func_match = js_function_pattern.search(pattern)
-    if js_func_match:
-        # Convert "function name() {" to "function name():"
-        python_variant = js_func_match.group(1) + ":"
-        variants.append(python_variant)
-
-    # Convert JavaScript-style method/function to Python-style
-    js_method_pattern = re.compile(r"(\w+\s*\([^)]*\))\s*\{")
-    js_method_match = js_method_pattern.search(pattern)
-    if js_method_match:
-        # Convert "name() {" to "name():"
-        python_variant = js_method_match.group(1) + ":"
-        variants.append(python_variant)
+        variants[first_line] = None
+
+    # Both JavaScript-style conversions need a call followed by a brace, so
+    # some "{" must come after the first ")"; str.find/rfind settle that
+    # before the regex engine is involved
+    first_close = pattern.find(")")
+    if first_close != -1 and pattern.rfind("{") > first_close and "(" in pattern:
+        js_match = _JS_BLOCK_RE.search(pattern)
+        if js_match:
+            if js_match.group("func"):
+                # Convert "function name() {" to "function name():"
+                variants[pattern[js_match.start() : js_match.end("call")] + ":"] = None
+            elif "function" in pattern:
+                # A JavaScript function may still follow the first call block
+                js_func_match = _JS_FUNCTION_RE.search(pattern, js_match.start())
+                if js_func_match:
+                    variants[js_func_match.group(1) + ":"] = None
+
+            # Convert "name() {" to "name():"
+            variants[js_match.group("call") + ":"] = None
 
     # Convert brace to colon (generic case)
     if "{" in pattern and ":" not in pattern:
         variant = pattern.replace("{", ":")
-        variants.append(variant)
+        variants[variant] = None
         # Also try removing the closing brace if it exists
         if "}" in variant:
             variant = variant.replace("}", "")
-            variants.append(variant)
+            variants[variant] = None
 
     # Direct conversion from JavaScript/C-style to Python-style
     if "def " in pattern and "{" in pattern:
         variant = pattern.replace("{", ":")
         if "}" in variant:
             variant = variant.replace("}", "")
-        variants.append(variant)
+        variants[variant] = None
+
+    # The original pattern is not a variant
+    variants.pop(pattern, None)
 
     # If we have no variants yet, try a more generic approach
     if not variants:
@@ -115,12 +189,9 @@ def get_pattern_variants(pattern: str) -> List[str]:
         if ":" in pattern and not pattern.endswith(":"):
             # For complex patterns with colons, keep everything before the colon + colon
             variant = pattern.split(":", 1)[0] + ":"
-            variants.append(variant)
-
-    # Remove duplicates and the original pattern
-    unique_variants = [v for v in variants if v != pattern]
+            variants[variant] = None
 
-    return unique_variants
+    return tuple(variants)
 
 
 def get_similar_patterns(pattern: str, language: str) -> List[Tuple[str, str]]:
@@ -138,49 +209,64 @@ def get_similar_patterns(pattern: str, language: str) -> List[Tuple[str, str]]:
     if not handler:
         return []
 
-    patterns = handler.get_default_patterns()
+    return _similar_patterns(pattern, _get_library_index(handler))
+
+
+def _similar_patterns(pattern: str, index: LibraryIndex) -> List[Tuple[str, str]]:
+    """get_similar_patterns against an already fetched library index."""
+    token_bits, library = index
 
     # No patterns available for this language
-    if not patterns:
+    if not library:
         return []
 
     # Calculate similarity scores using simple heuristics
     similar_patterns = []
 
-    # Tokenize the input pattern (split on spaces, newlines, parens, etc.)
-    pattern_tokens = re.findall(r"[$\w]+|[^\s\w]", pattern)
-    pattern_keywords = [token for token in pattern_tokens if not token.startswith("$")]
-
-    for name, lib_pattern in patterns.items():
-        # Simple scoring: count common tokens
-        lib_tokens = re.findall(r"[$\w]+|[^\s\w]", lib_pattern)
-        lib_keywords = [token for token in lib_tokens if not token.startswith("$")]
+    # Tokenize the input pattern (split on spaces, newlines, parens, etc.).
+    # Tokens missing from the library vocabulary can never be shared, so only
+    # known tokens contribute bits. Tokens are never empty, so token[0] is a
+    # cheaper metavariable test than startswith.
+    keyword_count = 0
+    pattern_tokens_mask = pattern_keywords_mask = 0
+    bit_for = token_bits.get
+    for token in _TOKEN_RE.findall(pattern):
+        bit = bit_for(token, 0)
+        pattern_tokens_mask |= bit
+        if token[0] != "$":
+            keyword_count += 1
+            pattern_keywords_mask |= bit
+
+    # Shared keywords can never exceed the pattern's known keywords; if those
+    # already miss the threshold below, no library entry can qualify
+    known_keywords = pattern_keywords_mask.bit_count()
+    if known_keywords < 1 or known_keywords < keyword_count / 2:
+        return []
 
+    for name, lib_pattern, lib_tokens_mask, lib_keywords_mask in library:
         # Count common non-variable tokens
-        common_tokens = set(pattern_keywords).intersection(lib_keywords)
+        common_count = (pattern_keywords_mask & lib_keywords_mask).bit_count()
 
-        # If they share significant tokens, consider it similar
-        if len(common_tokens) >= 1 and len(common_tokens) >= len(pattern_keywords) / 2:
-            similar_patterns.append((name, lib_pattern))
+        # If they share significant tokens, consider it similar, keeping the
+        # overall token overlap as the sort key so it is computed only once
+        if common_count >= 1 and common_count >= keyword_count / 2:
+            score = (pattern_tokens_mask & lib_tokens_mask).bit_count()
+            similar_patterns.append((score, name, lib_pattern))
 
-    # Sort by similarity (currently just by the number of matching tokens)
-    similar_patterns.sort(
-        key=lambda x: len(
-            set(re.findall(r"[$\w]+|[^\s\w]", x[1])).intersection(
-                set(re.findall(r"[$\w]+|[^\s\w]", pattern))
-            )
-        ),
-        reverse=True,
-    )
-
-    # Return top 3 similar patterns
-    return similar_patterns[:3]
+    # Return top 3 similar patterns (currently just by the number of matching
+    # tokens); nlargest keeps library order for ties, like a stable sort
+    top = heapq.nlargest(3, similar_patterns, key=lambda item: item[0])
+    return [(name, lib_pattern) for _, name, lib_pattern in top]
 
 
 def suggest_patterns(pattern: str, code: str, language: str) -> Dict[str, List[str]]:
     """
     Suggest alternative patterns when a pattern doesn't match.
 
+    Suggestions depend only on the pattern and the language's pattern
+    library, so they are cached per (pattern, handler); ``code`` does not
+    influence the result.
+
     Args:
         pattern: The original pattern that didn't match
         code: The code being analyzed
@@ -189,43 +275,101 @@ def suggest_patterns(pattern: str, code: str, language: str) -> Dict[str, List[s
     Returns:
         Dictionary with suggestion categories and lists of patterns
     """
-    suggestions = {"variants": [], "similar_patterns": [], "examples": []}
-
+    variants, similar_patterns, examples = _cached_suggestions(
+        pattern, get_handler(language)
+    )
+    return {
+        "variants": list(variants),
+        "similar_patterns": list(similar_patterns),
+        "examples": list(examples),
+    }
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_suggestions(
+    pattern: str, handler: Optional[LanguageHandler]
+) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """Cached (variants, similar patterns, examples) for suggest_patterns."""
     # Get pattern variants
-    variants = get_pattern_variants(pattern)
-    suggestions["variants"] = variants
-
-    # Get similar patterns from the library
-    similar = get_similar_patterns(pattern, language)
-    suggestions["similar_patterns"] = [
-        f"{name}: {pattern}" for name, pattern in similar
-    ]
+    variants = _pattern_variants(pattern)
+    similar_patterns: Tuple[str, ...] = ()
+    examples_sample: Tuple[str, ...] = ()
 
-    # Get example patterns for this language
-    handler = get_handler(language)
+    # Similar patterns and examples both come from the handler's library,
+    # so look its cached index up once
     if handler:
-        # Get patterns directly without unnecessary conversion to list
-        pattern_items = handler.get_default_patterns().items()
+        index = _get_library_index(handler)
+
+        # Get similar patterns from the library
+        similar_patterns = tuple(
+            f"{name}: {lib_pattern}"
+            for name, lib_pattern in _similar_patterns(pattern, index)
+        )
+
+        # Get example patterns for this language; the cached (name, pattern,
+        # ...) entries are already indexable
+        _, examples = index
+
+        # Select a few representative examples: entries 0, step and 2 * step,
+        # or every entry when there are no more than three. Slicing the tuple
+        # copies only the picked entries.
+        if examples:
+            step = max(1, len(examples) // 3)
+            examples_sample = tuple(
+                item[1] for item in examples[: 2 * step + 1 : step]
+            )
 
-        # Select a few representative examples
-        if pattern_items:
-            # Convert to list only when needed for indexing
-            examples = list(pattern_items) if len(pattern_items) > 3 else pattern_items
+    return variants, similar_patterns, examples_sample
 
-            if len(examples) <= 3:
-                examples_sample = [item[1] for item in examples]
-            else:
-                step = max(1, len(examples) // 3)
-                indices = [
-                    0,
-                    min(step, len(examples) - 1),
-                    min(2 * step, len(examples) - 1),
-                ]
-                examples_sample = [examples[i][1] for i in indices]
 
-            suggestions["examples"] = examples_sample
+# (heading, suggestions key) for the numbered sections of the message
+_SUGGESTION_SECTIONS = (
+    ("\nDid you mean:", "variants"),
+    ("\nSimilar patterns from library:", "similar_patterns"),
+    ("\nExample patterns for this language:", "examples"),
+)
 
-    return suggestions
+# Static tip blocks for build_suggestion_message, joined once at import
+_GENERAL_TIPS = "\n".join(
+    [
+        "\n📝 Pattern Writing Tips:",
+        "  • Use $VAR to match any single expression/identifier",
+        "  • Use $$$VAR to match multiple expressions/statements",
+        "  • Use $_ as a wildcard to match any single node",
+        "  • Ensure your pattern follows the exact syntax of the language",
+    ]
+)
+
+_JS_TS_TIPS = "\n".join(
+    [
+        "\n  JavaScript/TypeScript-specific:",
+        "  • Include braces { } for function bodies",
+        "  • Semicolons are optional but can affect matching",
+        "  • For JSX: <$TAG>$$$CHILDREN</$TAG>",
+    ]
+)
+
+_LANGUAGE_TIPS = {
+    "python": "\n".join(
+        [
+            "\n  Python-specific:",
+            "  • Don't forget colons after def/class/if/for/while statements",
+            "  • Use proper indentation (ast-grep is indent-sensitive)",
+        ]
+    ),
+    "javascript": _JS_TS_TIPS,
+    "typescript": _JS_TS_TIPS,
+    "rust": "\n".join(
+        [
+            "\n  Rust-specific:",
+            "  • Include semicolons at the end of statements",
+            "  • For async functions: async fn $NAME",
+            "  • For generics: $NAME<$TYPE>",
+        ]
+    ),
+}
+
+_CLOSING_TIP = "\n  💡 Try simpler patterns first, then add complexity"
 
 
 def build_suggestion_message(
@@ -243,81 +387,21 @@ def build_suggestion_message(
         Formatted message with suggestions
     """
     # Start with a more helpful base message
-    base_message = f"Pattern '{pattern}' did not match any {language} code.\n\n🔍 Troubleshooting Tips:"
-
-    # Create parts of the message using list comprehensions instead of appending
-    variant_lines = (
-        ["\nDid you mean:"]
-        + [
-            f"  {i}. {variant}"
-            for i, variant in enumerate(suggestions["variants"][:3], 1)
-        ]
-        if suggestions["variants"]
-        else []
-    )
+    lines = [
+        f"Pattern '{pattern}' did not match any {language} code.\n\n🔍 Troubleshooting Tips:"
+    ]
 
-    similar_pattern_lines = (
-        ["\nSimilar patterns from library:"]
-        + [
-            f"  {i}. {pattern_desc}"
-            for i, pattern_desc in enumerate(suggestions["similar_patterns"][:3], 1)
-        ]
-        if suggestions["similar_patterns"]
-        else []
-    )
+    for heading, key in _SUGGESTION_SECTIONS:
+        items = suggestions[key]
+        if items:
+            lines.append(heading)
+            lines.extend(f"  {i}. {item}" for i, item in enumerate(items[:3], 1))
 
-    example_lines = (
-        ["\nExample patterns for this language:"]
-        + [
-            f"  {i}. {example}"
-            for i, example in enumerate(suggestions["examples"][:3], 1)
-        ]
-        if suggestions["examples"]
-        else []
-    )
-
-    # Tips section with language-specific advice
-    tip_lines = ["\n📝 Pattern Writing Tips:"]
-    
-    # Add general tips
-    tip_lines.extend([
-        "  • Use $VAR to match any single expression/identifier",
-        "  • Use $$$VAR to match multiple expressions/statements", 
-        "  • Use $_ as a wildcard to match any single node",
-        "  • Ensure your pattern follows the exact syntax of the language"
-    ])
-    
-    # Add language-specific tips
-    if language == "python":
-        tip_lines.extend([
-            "\n  Python-specific:",
-            "  • Don't forget colons after def/class/if/for/while statements",
-            "  • Use proper indentation (ast-grep is indent-sensitive)"
-        ])
-    elif language in ["javascript", "typescript"]:
-        tip_lines.extend([
-            "\n  JavaScript/TypeScript-specific:",
-            "  • Include braces { } for function bodies",
-            "  • Semicolons are optional but can affect matching",
-            "  • For JSX: <$TAG>$$$CHILDREN</$TAG>"
-        ])
-    elif language == "rust":
-        tip_lines.extend([
-            "\n  Rust-specific:",
-            "  • Include semicolons at the end of statements",
-            "  • For async functions: async fn $NAME",
-            "  • For generics: $NAME<$TYPE>"
-        ])
-    
-    tip_lines.append("\n  💡 Try simpler patterns first, then add complexity")
-
-    # Combine all message parts
-    message_parts = (
-        [base_message]
-        + variant_lines
-        + similar_pattern_lines
-        + example_lines
-        + tip_lines
-    )
+    # Tips section with language-specific advice; each block is pre-joined
+    lines.append(_GENERAL_TIPS)
+    language_tips = _LANGUAGE_TIPS.get(language)
+    if language_tips:
+        lines.append(language_tips)
+    lines.append(_CLOSING_TIP)
 
-    return "\n".join(message_parts)
+    return "\n".join(lines)
@@ -5,33 +5,47 @@ This module provides pre-built pattern templates with examples
 and variable explanations.
 """
 
-from typing import Dict, List, Optional
+import functools
+import re
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PatternTemplate:
-    """Represents a pattern template with metadata."""
+    """
+    Represents a pattern template with metadata.
+    
+    Templates are shared by the cached libraries, so instances are frozen
+    and their example matches and variables are stored read-only.
+    """
     
     name: str
     description: str
     pattern: str
     replacement: Optional[str]
     language: str
-    example_matches: List[str]
-    variables: Dict[str, str]
+    # Any sequence and mapping are accepted; stored as a tuple and a read-only view
+    example_matches: Sequence[str]
+    variables: Mapping[str, str]
     category: str
     notes: Optional[str] = None
     confidence: float = 0.9
+    
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "example_matches", tuple(self.example_matches))
+        object.__setattr__(self, "variables", MappingProxyType(dict(self.variables)))
 
 
 class PatternTemplateLibrary:
     """Library of pattern templates for common scenarios."""
     
     @staticmethod
-    def rust_templates() -> Dict[str, PatternTemplate]:
-        """Get Rust pattern templates."""
-        return {
+    @functools.lru_cache(maxsize=1)
+    def rust_templates() -> Mapping[str, PatternTemplate]:
+        """Get Rust pattern templates. Built once and shared read-only."""
+        return MappingProxyType({
             "unwrap_to_expect": PatternTemplate(
                 name="unwrap_to_expect",
                 description="Convert unwrap() to expect() with message",
@@ -160,12 +174,13 @@ class PatternTemplateLibrary:
                 category="async",
                 notes="General pattern that matches all spawn calls"
             )
-        }
+        })
     
     @staticmethod
-    def javascript_templates() -> Dict[str, PatternTemplate]:
-        """Get JavaScript/TypeScript pattern templates."""
-        return {
+    @functools.lru_cache(maxsize=1)
+    def javascript_templates() -> Mapping[str, PatternTemplate]:
+        """Get JavaScript/TypeScript pattern templates. Built once and shared read-only."""
+        return MappingProxyType({
             "callback_to_promise": PatternTemplate(
                 name="callback_to_promise",
                 description="Convert callback to Promise",
@@ -237,12 +252,13 @@ class PatternTemplateLibrary:
                 category="async",
                 notes="Must be inside async function"
             )
-        }
+        })
     
     @staticmethod
-    def python_templates() -> Dict[str, PatternTemplate]:
-        """Get Python pattern templates."""
-        return {
+    @functools.lru_cache(maxsize=1)
+    def python_templates() -> Mapping[str, PatternTemplate]:
+        """Get Python pattern templates. Built once and shared read-only."""
+        return MappingProxyType({
             "print_to_logging": PatternTemplate(
                 name="print_to_logging",
                 description="Convert print to logging",
@@ -294,7 +310,7 @@ class PatternTemplateLibrary:
                 },
                 category="pythonic"
             )
-        }
+        })
     
     @classmethod
     def get_template(cls, name: str, language: str) -> Optional[PatternTemplate]:
@@ -303,15 +319,10 @@ class PatternTemplateLibrary:
         return templates.get(name)
     
     @classmethod
-    def get_all_templates(cls, language: str) -> Dict[str, PatternTemplate]:
+    def get_all_templates(cls, language: str) -> Mapping[str, PatternTemplate]:
         """Get all templates for a language."""
-        if language == "rust":
-            return cls.rust_templates()
-        elif language in ["javascript", "typescript"]:
-            return cls.javascript_templates()
-        elif language == "python":
-            return cls.python_templates()
-        return {}
+        loader = _TEMPLATE_LOADERS.get(language)
+        return loader() if loader else _NO_TEMPLATES
     
     @classmethod
     def get_templates_by_category(
@@ -333,45 +344,79 @@ class PatternTemplateLibrary:
         language: str
     ) -> List[PatternTemplate]:
         """Suggest applicable templates based on code content."""
-        templates = cls.get_all_templates(language)
-        suggestions = []
+        # Unknown languages have no templates; keep them out of the caches
+        if language not in _TEMPLATE_LOADERS:
+            return []
+        keyed_templates = _keyed_templates(language)
         
-        # Simple keyword-based matching
+        # Simple keyword-based matching. Each distinct keyword is searched for
+        # once, rather than once per template that uses it.
         code_lower = code.lower()
+        hits = {
+            keyword
+            for keyword in _language_keywords(language)
+            if keyword in code_lower
+        }
         
-        for template in templates.values():
-            # Check if pattern keywords appear in code
-            pattern_keywords = set()
-            
-            # Extract keywords from pattern
-            if language == "rust":
-                if "unwrap()" in template.pattern:
-                    pattern_keywords.add("unwrap")
-                if "println!" in template.pattern:
-                    pattern_keywords.add("println")
-                if "match" in template.pattern:
-                    pattern_keywords.add("match")
-                if "Vec::new()" in template.pattern:
-                    pattern_keywords.add("vec::new")
-            
-            elif language in ["javascript", "typescript"]:
-                if "console.log" in template.pattern:
-                    pattern_keywords.add("console.log")
-                if "var " in template.pattern:
-                    pattern_keywords.add("var ")
-                if ".then(" in template.pattern:
-                    pattern_keywords.add(".then")
-            
-            elif language == "python":
-                if "print(" in template.pattern:
-                    pattern_keywords.add("print(")
-                
-            # Check if any keywords match
-            if any(keyword in code_lower for keyword in pattern_keywords):
-                suggestions.append(template)
-        
-        return suggestions
-    
+        return [
+            template
+            for template, pattern_keywords in keyed_templates
+            if not hits.isdisjoint(pattern_keywords)
+        ]
+
+
+# Template loaders per language, used by get_all_templates
+_TEMPLATE_LOADERS = {
+    "rust": PatternTemplateLibrary.rust_templates,
+    "javascript": PatternTemplateLibrary.javascript_templates,
+    "typescript": PatternTemplateLibrary.javascript_templates,
+    "python": PatternTemplateLibrary.python_templates,
+}
+
+_NO_TEMPLATES: Mapping[str, PatternTemplate] = MappingProxyType({})
+
+# (substring of a template pattern, keyword to look for in code) per language,
+# used by suggest_templates_for_code
+_SUGGESTION_KEYWORDS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "rust": (
+        ("unwrap()", "unwrap"),
+        ("println!", "println"),
+        ("match", "match"),
+        ("Vec::new()", "vec::new"),
+    ),
+    "javascript": (
+        ("console.log", "console.log"),
+        ("var ", "var "),
+        (".then(", ".then"),
+    ),
+    "python": (
+        ("print(", "print("),
+    ),
+}
+_SUGGESTION_KEYWORDS["typescript"] = _SUGGESTION_KEYWORDS["javascript"]
+
+# Metavariables in a generated pattern; variadic ones are tried first
+_METAVAR_RE = re.compile(r'\$\$\$\w+|\$\w+')
+
+
+@functools.lru_cache(maxsize=len(_TEMPLATE_LOADERS))
+def _keyed_templates(language: str) -> Tuple[Tuple[PatternTemplate, FrozenSet[str]], ...]:
+    """Pair each template of a language with the code keywords that suggest it."""
+    rules = _SUGGESTION_KEYWORDS.get(language, ())
+    return tuple(
+        (
+            template,
+            frozenset(keyword for marker, keyword in rules if marker in template.pattern),
+        )
+        for template in PatternTemplateLibrary.get_all_templates(language).values()
+    )
+
+
+@functools.lru_cache(maxsize=len(_TEMPLATE_LOADERS))
+def _language_keywords(language: str) -> FrozenSet[str]:
+    """Keywords used by at least one template of a language."""
+    return frozenset().union(*(keywords for _, keywords in _keyed_templates(language)))
+
 
 def create_template_from_example(
     name: str,
@@ -403,9 +448,7 @@ def create_template_from_example(
     variables = {}
     
     # Simple variable detection
-    import re
-    metavars = re.findall(r'\$\w+|\$\$\$\w+', pattern)
-    for var in metavars:
+    for var in _METAVAR_RE.findall(pattern):
         if "$$$" in var:
             variables[var] = "Multiple items (variadic)"
         else:
@@ -1,13 +1,60 @@
 """
 Interactive pattern building wizard for ast-grep.
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Mapping, Optional, Tuple
+from types import MappingProxyType
+import functools
+import heapq
 import re
 from dataclasses import dataclass
 
 from ..utils.error_handling import handle_errors
 
 
+# (keyword, words in a description that imply it) in reporting order
+_KEYWORD_WORDS = (
+    # Function-related
+    ("function", ("function", "method", "func", "def")),
+    ("async", ("async", "await")),
+    ("public", ("public", "pub")),
+    # Class-related
+    ("class", ("class", "struct", "type")),
+    ("extends", ("inherit", "extend")),
+    # Import-related
+    ("import", ("import", "require", "use")),
+    # Error handling
+    ("error", ("error", "exception", "try", "catch", "unwrap")),
+    # Pattern matching
+    ("match", ("match", "switch")),
+    # Variable/assignment
+    ("variable", ("variable", "const", "let", "assign")),
+)
+
+# One bit per keyword, so a template's score is a few "&" and popcounts
+_KEYWORD_BITS = {keyword: 1 << index for index, (keyword, _) in enumerate(_KEYWORD_WORDS)}
+
+# Metavariables, split into their "$" prefix and name
+_METAVAR_RE = re.compile(r'(\$+)(\w+)')
+
+# Explanation phrases for well-known metavariables, in explanation order
+_METAVAR_PHRASES = (
+    ("$NAME", "an identifier"),
+    ("$$$ARGS", "with any arguments"),
+    ("$$$BODY", "containing any code block"),
+    ("$RETURN_TYPE", "with a return type"),
+)
+
+# (pattern substring, common use it suggests) in reporting order
+_COMMON_USES = (
+    ("$NAME", "Finding all occurrences of specific identifiers"),
+    ("$$$ARGS", "Matching functions regardless of parameter count"),
+    ("async", "Identifying asynchronous code for refactoring"),
+)
+
+# (category keyword bits, name keyword bits, (keyword bit, points) bonuses)
+TemplateMasks = Tuple[int, int, Tuple[Tuple[int, int], ...]]
+
+
 @dataclass
 class PatternExample:
     """Example showing pattern usage."""
@@ -16,112 +63,199 @@ class PatternExample:
     explanation: str
 
 
+# Metavariable reference guide shown with every wizard result
+_METAVAR_REFERENCE = MappingProxyType({
+    "$VAR": "Matches single identifier",
+    "$$$VAR": "Matches zero or more tokens",
+    "$_": "Matches any single token (wildcard)",
+    "...": "Matches any sequence of code",
+    "$VAR1, $VAR2": "Multiple captures with different names",
+    "$$VAR": "Invalid - use either $ or $$$",
+})
+
+# Pattern tips shared by every language, plus the language-specific extras
+_TIPS_COMMON = (
+    "Use $ for single token capture (e.g., $VAR)",
+    "Use $$$ for multiple tokens capture (e.g., $$$ARGS)",
+    "Metavariables can be reused to ensure consistency",
+    "Use ... for any code sequence",
+)
+_LANGUAGE_TIPS = MappingProxyType({
+    "python": _TIPS_COMMON + (
+        "Python patterns are whitespace-sensitive",
+        "Use proper indentation in multi-line patterns",
+    ),
+    "rust": _TIPS_COMMON + (
+        "Match lifetime annotations with $LIFETIME",
+        "Generic types can be matched with $T",
+    ),
+})
+
+# Next-step tips attached to every pattern explanation
+_EXPLAIN_TIPS = (
+    "Test with actual code using analyze_code()",
+    "Use validate_pattern() to check syntax",
+    "Combine with other patterns using compose_rule()",
+)
+
+# Example rules per (language, category) as (pattern marker, code, matched
+# captures); an empty marker matches any pattern
+_EXAMPLE_RULES = MappingProxyType({
+    ("python", "function"): (
+        ("async", "async def fetch_data(url: str) -> dict:", ("fetch_data", "url: str", "dict")),
+        ("", "def calculate_sum(a, b):", ("calculate_sum", "a, b")),
+    ),
+    ("rust", "function"): (
+        (
+            "pub async",
+            "pub async fn handle_request(req: Request) -> Result<Response, Error>",
+            ("handle_request", "req: Request", "Result<Response, Error>"),
+        ),
+    ),
+})
+
+# Common pattern templates per language and category, frozen below
+_RAW_PATTERN_TEMPLATES = {
+    "python": {
+        "function": {
+            "simple": "def $NAME($$$ARGS)",
+            "async": "async def $NAME($$$ARGS)",
+            "with_return": "def $NAME($$$ARGS) -> $RETURN_TYPE",
+            "with_decorator": "@$DECORATOR\ndef $NAME($$$ARGS)",
+            "class_method": "def $NAME(self, $$$ARGS)",
+        },
+        "class": {
+            "simple": "class $NAME",
+            "with_base": "class $NAME($BASE)",
+            "with_decorator": "@$DECORATOR\nclass $NAME",
+        },
+        "import": {
+            "simple": "import $MODULE",
+            "from": "from $MODULE import $NAME",
+            "alias": "import $MODULE as $ALIAS",
+        },
+        "exception": {
+            "try_except": "try:\n    $$$BODY\nexcept $EXCEPTION",
+            "raise": "raise $EXCEPTION",
+        },
+        "assignment": {
+            "simple": "$VAR = $VALUE",
+            "multiple": "$VAR1, $VAR2 = $VALUE",
+            "augmented": "$VAR += $VALUE",
+        },
+    },
+    "javascript": {
+        "function": {
+            "simple": "function $NAME($$$ARGS) { $$$BODY }",
+            "arrow": "const $NAME = ($$$ARGS) => $BODY",
+            "async": "async function $NAME($$$ARGS) { $$$BODY }",
+            "async_arrow": "const $NAME = async ($$$ARGS) => $BODY",
+        },
+        "class": {
+            "simple": "class $NAME { $$$BODY }",
+            "extends": "class $NAME extends $BASE { $$$BODY }",
+            "method": "$NAME($$$ARGS) { $$$BODY }",
+        },
+        "import": {
+            "named": "import { $NAME } from '$MODULE'",
+            "default": "import $NAME from '$MODULE'",
+            "namespace": "import * as $NAME from '$MODULE'",
+        },
+        "variable": {
+            "const": "const $NAME = $VALUE",
+            "let": "let $NAME = $VALUE",
+            "destructure": "const { $$$PROPS } = $OBJECT",
+        },
+    },
+    "rust": {
+        "function": {
+            "simple": "fn $NAME($$$ARGS)",
+            "with_return": "fn $NAME($$$ARGS) -> $RETURN_TYPE",
+            "async": "async fn $NAME($$$ARGS)",
+            "public": "pub fn $NAME($$$ARGS)",
+            "pub_async": "pub async fn $NAME($$$ARGS)",
+        },
+        "struct": {
+            "simple": "struct $NAME",
+            "with_fields": "struct $NAME { $$$FIELDS }",
+            "tuple": "struct $NAME($$$TYPES)",
+        },
+        "impl": {
+            "simple": "impl $TYPE { $$$BODY }",
+            "trait": "impl $TRAIT for $TYPE { $$$BODY }",
+        },
+        "match": {
+            "simple": "match $EXPR { $$$ARMS }",
+            "result": "match $EXPR { Ok($OK) => $OK_BODY, Err($ERR) => $ERR_BODY }",
+        },
+        "error_handling": {
+            "unwrap": "$EXPR.unwrap()",
+            "expect": "$EXPR.expect($MSG)",
+            "question_mark": "$EXPR?",
+        },
+    },
+    "go": {
+        "function": {
+            "simple": "func $NAME($$$ARGS)",
+            "with_return": "func $NAME($$$ARGS) $RETURN_TYPE",
+            "method": "func ($RECEIVER $TYPE) $NAME($$$ARGS)",
+        },
+        "struct": {
+            "simple": "type $NAME struct { $$$FIELDS }",
+        },
+        "interface": {
+            "simple": "type $NAME interface { $$$METHODS }",
+        },
+        "error_handling": {
+            "check": "if err != nil { $$$BODY }",
+            "return": "return $VALUE, err",
+        },
+    },
+}
+
+# Frozen at every level so all wizards can share one read-only copy
+_PATTERN_TEMPLATES = MappingProxyType({
+    language: MappingProxyType({
+        category: MappingProxyType(templates)
+        for category, templates in categories.items()
+    })
+    for language, categories in _RAW_PATTERN_TEMPLATES.items()
+})
+
+
 class PatternWizard:
     """Interactive pattern building assistant."""
     
     def __init__(self, logger=None):
         self.logger = logger
         self.pattern_templates = self._load_pattern_templates()
+        
+        # Templates flattened per language into (category, name, pattern,
+        # explanation, examples, keyword masks) rows; none of it changes, so
+        # it is generated here once instead of on every wizard call
+        self._template_rows = {
+            language: tuple(
+                (
+                    category,
+                    template_name,
+                    pattern,
+                    self._explain_pattern(pattern, language),
+                    tuple(self._generate_examples(pattern, language, category)),
+                    self._template_masks(category, template_name),
+                )
+                for category, templates in lang_templates.items()
+                for template_name, pattern in templates.items()
+            )
+            for language, lang_templates in self.pattern_templates.items()
+        }
+        
+        # Interactive sessions repeat similar questions; the ranked
+        # suggestions only depend on the arguments, so they are memoized
+        self._suggestion_cache = functools.lru_cache(maxsize=256)(self._compute_suggestions)
     
-    def _load_pattern_templates(self) -> Dict[str, Dict[str, Any]]:
+    def _load_pattern_templates(self) -> Mapping[str, Mapping[str, Mapping[str, str]]]:
         """Load common pattern templates."""
-        return {
-            "python": {
-                "function": {
-                    "simple": "def $NAME($$$ARGS)",
-                    "async": "async def $NAME($$$ARGS)",
-                    "with_return": "def $NAME($$$ARGS) -> $RETURN_TYPE",
-                    "with_decorator": "@$DECORATOR\ndef $NAME($$$ARGS)",
-                    "class_method": "def $NAME(self, $$$ARGS)",
-                },
-                "class": {
-                    "simple": "class $NAME",
-                    "with_base": "class $NAME($BASE)",
-                    "with_decorator": "@$DECORATOR\nclass $NAME",
-                },
-                "import": {
-                    "simple": "import $MODULE",
-                    "from": "from $MODULE import $NAME",
-                    "alias": "import $MODULE as $ALIAS",
-                },
-                "exception": {
-                    "try_except": "try:\n    $$$BODY\nexcept $EXCEPTION",
-                    "raise": "raise $EXCEPTION",
-                },
-                "assignment": {
-                    "simple": "$VAR = $VALUE",
-                    "multiple": "$VAR1, $VAR2 = $VALUE",
-                    "augmented": "$VAR += $VALUE",
-                },
-            },
-            "javascript": {
-                "function": {
-                    "simple": "function $NAME($$$ARGS) { $$$BODY }",
-                    "arrow": "const $NAME = ($$$ARGS) => $BODY",
-                    "async": "async function $NAME($$$ARGS) { $$$BODY }",
-                    "async_arrow": "const $NAME = async ($$$ARGS) => $BODY",
-                },
-                "class": {
-                    "simple": "class $NAME { $$$BODY }",
-                    "extends": "class $NAME extends $BASE { $$$BODY }",
-                    "method": "$NAME($$$ARGS) { $$$BODY }",
-                },
-                "import": {
-                    "named": "import { $NAME } from '$MODULE'",
-                    "default": "import $NAME from '$MODULE'",
-                    "namespace": "import * as $NAME from '$MODULE'",
-                },
-                "variable": {
-                    "const": "const $NAME = $VALUE",
-                    "let": "let $NAME = $VALUE",
-                    "destructure": "const { $$$PROPS } = $OBJECT",
-                },
-            },
-            "rust": {
-                "function": {
-                    "simple": "fn $NAME($$$ARGS)",
-                    "with_return": "fn $NAME($$$ARGS) -> $RETURN_TYPE",
-                    "async": "async fn $NAME($$$ARGS)",
-                    "public": "pub fn $NAME($$$ARGS)",
-                    "pub_async": "pub async fn $NAME($$$ARGS)",
-                },
-                "struct": {
-                    "simple": "struct $NAME",
-                    "with_fields": "struct $NAME { $$$FIELDS }",
-                    "tuple": "struct $NAME($$$TYPES)",
-                },
-                "impl": {
-                    "simple": "impl $TYPE { $$$BODY }",
-                    "trait": "impl $TRAIT for $TYPE { $$$BODY }",
-                },
-                "match": {
-                    "simple": "match $EXPR { $$$ARMS }",
-                    "result": "match $EXPR { Ok($OK) => $OK_BODY, Err($ERR) => $ERR_BODY }",
-                },
-                "error_handling": {
-                    "unwrap": "$EXPR.unwrap()",
-                    "expect": "$EXPR.expect($MSG)",
-                    "question_mark": "$EXPR?",
-                },
-            },
-            "go": {
-                "function": {
-                    "simple": "func $NAME($$$ARGS)",
-                    "with_return": "func $NAME($$$ARGS) $RETURN_TYPE",
-                    "method": "func ($RECEIVER $TYPE) $NAME($$$ARGS)",
-                },
-                "struct": {
-                    "simple": "type $NAME struct { $$$FIELDS }",
-                },
-                "interface": {
-                    "simple": "type $NAME interface { $$$METHODS }",
-                },
-                "error_handling": {
-                    "check": "if err != nil { $$$BODY }",
-                    "return": "return $VALUE, err",
-                },
-            },
-        }
+        return _PATTERN_TEMPLATES
     
     @handle_errors
     def pattern_wizard(
@@ -141,163 +275,167 @@ class PatternWizard:
         Returns:
             Dictionary with pattern suggestions and explanations
         """
-        suggestions = []
+        examples_key = tuple(examples) if examples else None
+        suggestions = self._suggestion_cache(description.lower(), language, examples_key)
         
-        # Normalize description
-        desc_lower = description.lower()
+        return {
+            "description": description,
+            "language": language,
+            # Cached suggestions are shared, so callers get their own copies
+            "suggestions": [
+                {
+                    **suggestion,
+                    "examples": [
+                        {**example, "matches": list(example["matches"])}
+                        for example in suggestion["examples"]
+                    ],
+                }
+                for suggestion in suggestions
+            ],
+            "tips": list(self._get_pattern_tips(language)),
+            "metavariables": dict(self._get_metavar_reference()),
+            "next_steps": [
+                "Test patterns with validate_pattern()",
+                "Use explain_pattern() for detailed breakdown",
+                "Refine with pattern_builder() for complex patterns",
+            ],
+        }
+    
+    def _compute_suggestions(
+        self,
+        desc_lower: str,
+        language: str,
+        examples: Optional[Tuple[str, ...]],
+    ) -> Tuple[Dict[str, Any], ...]:
+        """Rank the top 5 suggestions for a lowercased description.
         
+        Results are cached by the caller, so they must be treated as read-only.
+        """
         # Get language templates
-        lang_templates = self.pattern_templates.get(language, {})
+        template_rows = self._template_rows.get(language, ())
         
         # Analyze description for keywords
-        keywords = self._extract_keywords(desc_lower)
-        
-        # Generate suggestions based on keywords
-        for category, templates in lang_templates.items():
-            for template_name, pattern in templates.items():
-                score = self._score_template(keywords, category, template_name)
-                if score > 0:
-                    suggestions.append({
-                        "pattern": pattern,
-                        "score": score,
-                        "category": category,
-                        "name": template_name,
-                        "explanation": self._explain_pattern(pattern, language),
-                        "examples": self._generate_examples(pattern, language, category),
-                    })
-        
-        # Sort by score
-        suggestions.sort(key=lambda x: x["score"], reverse=True)
+        keyword_mask = 0
+        for keyword in self._extract_keywords(desc_lower):
+            keyword_mask |= _KEYWORD_BITS[keyword]
+        
+        # Score templates based on keywords, keeping only the matching rows
+        scored = []
+        for row in template_rows:
+            score = self._score_template(keyword_mask, row[5])
+            if score > 0:
+                scored.append((score, row))
+        
+        # Only the top 5 can be shown; nlargest keeps template order for ties,
+        # like the stable sort it replaces, and result dicts are built for
+        # those 5 alone
+        suggestions = [
+            {
+                "pattern": pattern,
+                "score": score,
+                "category": category,
+                "name": template_name,
+                "explanation": explanation,
+                "examples": template_examples,
+            }
+            for score, (category, template_name, pattern, explanation, template_examples, _)
+            in heapq.nlargest(5, scored, key=lambda item: item[0])
+        ]
         
         # If examples provided, try to infer pattern
         if examples:
-            inferred = self._infer_from_examples(examples, language)
+            inferred = self._infer_from_examples(list(examples), language)
             if inferred:
                 suggestions.insert(0, inferred)
         
         # Limit to top 5 suggestions
-        top_suggestions = suggestions[:5]
-        
-        return {
-            "description": description,
-            "language": language,
-            "suggestions": top_suggestions,
-            "tips": self._get_pattern_tips(language),
-            "metavariables": self._get_metavar_reference(),
-            "next_steps": [
-                "Test patterns with validate_pattern()",
-                "Use explain_pattern() for detailed breakdown",
-                "Refine with pattern_builder() for complex patterns",
-            ],
-        }
+        return tuple(suggestions[:5])
     
     def _extract_keywords(self, description: str) -> List[str]:
         """Extract relevant keywords from description."""
-        # Common programming concepts
+        # Common programming concepts; a concept is found by the first of its
+        # words that occurs, so the remaining words are never scanned for
         keywords = []
-        
-        # Function-related
-        if any(word in description for word in ["function", "method", "func", "def"]):
-            keywords.append("function")
-        if "async" in description or "await" in description:
-            keywords.append("async")
-        if "public" in description or "pub" in description:
-            keywords.append("public")
-        
-        # Class-related
-        if any(word in description for word in ["class", "struct", "type"]):
-            keywords.append("class")
-        if "inherit" in description or "extend" in description:
-            keywords.append("extends")
-        
-        # Import-related
-        if "import" in description or "require" in description or "use" in description:
-            keywords.append("import")
-        
-        # Error handling
-        if any(word in description for word in ["error", "exception", "try", "catch", "unwrap"]):
-            keywords.append("error")
-        
-        # Pattern matching
-        if "match" in description or "switch" in description:
-            keywords.append("match")
-        
-        # Variable/assignment
-        if any(word in description for word in ["variable", "const", "let", "assign"]):
-            keywords.append("variable")
+        for keyword, words in _KEYWORD_WORDS:
+            for word in words:
+                if word in description:
+                    keywords.append(keyword)
+                    break
         
         return keywords
     
-    def _score_template(self, keywords: List[str], category: str, template_name: str) -> int:
-        """Score how well a template matches the keywords."""
-        score = 0
+    @staticmethod
+    def _template_masks(category: str, template_name: str) -> TemplateMasks:
+        """
+        Precompute which keywords a template's category and name contain.
         
-        # Category matching
-        for keyword in keywords:
+        Args:
+            category: Template category
+            template_name: Template name
+            
+        Returns:
+            Tuple of (category keyword bits, name keyword bits, bonuses) where
+            bonuses are (keyword bit, points) pairs for specific matches
+        """
+        category_mask = name_mask = 0
+        for keyword, bit in _KEYWORD_BITS.items():
             if keyword in category:
-                score += 2
+                category_mask |= bit
             if keyword in template_name:
-                score += 3
+                name_mask |= bit
+        
+        # Specific matches
+        bonuses = []
+        if "async" in template_name:
+            bonuses.append((_KEYWORD_BITS["async"], 5))
+        if "pub" in template_name or "public" in template_name:
+            bonuses.append((_KEYWORD_BITS["public"], 4))
+        if category == "error_handling":
+            bonuses.append((_KEYWORD_BITS["error"], 5))
+        
+        return category_mask, name_mask, tuple(bonuses)
+    
+    def _score_template(self, keyword_mask: int, masks: TemplateMasks) -> int:
+        """Score how well a template matches the keywords."""
+        category_mask, name_mask, bonuses = masks
+        
+        # Category and name matching
+        score = 2 * (keyword_mask & category_mask).bit_count()
+        score += 3 * (keyword_mask & name_mask).bit_count()
         
         # Specific matches
-        if "async" in keywords and "async" in template_name:
-            score += 5
-        if "public" in keywords and ("pub" in template_name or "public" in template_name):
-            score += 4
-        if "error" in keywords and category == "error_handling":
-            score += 5
+        for bit, points in bonuses:
+            if keyword_mask & bit:
+                score += points
         
         return score
     
     def _explain_pattern(self, pattern: str, language: str) -> str:
         """Generate explanation for a pattern."""
-        explanation = "This pattern matches "
+        parts = ["This pattern matches"]
         
         # Identify metavariables
-        metavars = re.findall(r'\$+\w+', pattern)
-        
-        if "$NAME" in metavars:
-            explanation += "an identifier "
-        if "$$$ARGS" in metavars:
-            explanation += "with any arguments "
-        if "$$$BODY" in metavars:
-            explanation += "containing any code block "
-        if "$RETURN_TYPE" in metavars:
-            explanation += "with a return type "
+        metavars = frozenset(prefix + name for prefix, name in _METAVAR_RE.findall(pattern))
+        parts.extend(
+            phrase for metavar, phrase in _METAVAR_PHRASES if metavar in metavars
+        )
         
         # Add language-specific notes
         if language == "rust" and "pub" in pattern:
-            explanation += "(public visibility) "
+            parts.append("(public visibility)")
         if "async" in pattern:
-            explanation += "(asynchronous) "
+            parts.append("(asynchronous)")
         
-        return explanation.strip()
+        return " ".join(parts)
     
     def _generate_examples(self, pattern: str, language: str, category: str) -> List[Dict[str, str]]:
         """Generate example code that would match the pattern."""
-        examples = []
-        
-        # Generate based on category and language
-        if category == "function":
-            if language == "python":
-                if "async" in pattern:
-                    examples.append({
-                        "code": "async def fetch_data(url: str) -> dict:",
-                        "matches": ["fetch_data", "url: str", "dict"],
-                    })
-                else:
-                    examples.append({
-                        "code": "def calculate_sum(a, b):",
-                        "matches": ["calculate_sum", "a, b"],
-                    })
-            elif language == "rust":
-                if "pub async" in pattern:
-                    examples.append({
-                        "code": "pub async fn handle_request(req: Request) -> Result<Response, Error>",
-                        "matches": ["handle_request", "req: Request", "Result<Response, Error>"],
-                    })
+        # The first rule whose marker occurs in the pattern supplies the example
+        for marker, code, matches in _EXAMPLE_RULES.get((language, category), ()):
+            if marker in pattern:
+                return [{"code": code, "matches": list(matches)}]
         
-        return examples
+        return []
     
     def _infer_from_examples(self, examples: List[str], language: str) -> Optional[Dict[str, Any]]:
         """Try to infer pattern from provided examples."""
@@ -305,38 +443,13 @@ class PatternWizard:
         # For now, return None
         return None
     
-    def _get_pattern_tips(self, language: str) -> List[str]:
+    def _get_pattern_tips(self, language: str) -> Tuple[str, ...]:
         """Get language-specific pattern tips."""
-        tips = [
-            "Use $ for single token capture (e.g., $VAR)",
-            "Use $$$ for multiple tokens capture (e.g., $$$ARGS)",
-            "Metavariables can be reused to ensure consistency",
-            "Use ... for any code sequence",
-        ]
-        
-        if language == "python":
-            tips.extend([
-                "Python patterns are whitespace-sensitive",
-                "Use proper indentation in multi-line patterns",
-            ])
-        elif language == "rust":
-            tips.extend([
-                "Match lifetime annotations with $LIFETIME",
-                "Generic types can be matched with $T",
-            ])
-        
-        return tips
+        return _LANGUAGE_TIPS.get(language, _TIPS_COMMON)
     
-    def _get_metavar_reference(self) -> Dict[str, str]:
+    def _get_metavar_reference(self) -> Mapping[str, str]:
         """Get metavariable reference guide."""
-        return {
-            "$VAR": "Matches single identifier",
-            "$$$VAR": "Matches zero or more tokens",
-            "$_": "Matches any single token (wildcard)",
-            "...": "Matches any sequence of code",
-            "$VAR1, $VAR2": "Multiple captures with different names",
-            "$$VAR": "Invalid - use either $ or $$$",
-        }
+        return _METAVAR_REFERENCE
     
     @handle_errors
     def explain_pattern(self, pattern: str, language: str) -> Dict[str, Any]:
@@ -364,11 +477,7 @@ class PatternWizard:
                 "wont_match": self._generate_negative_examples(pattern, language),
             },
             "common_uses": self._get_common_uses(pattern, language),
-            "tips": [
-                "Test with actual code using analyze_code()",
-                "Use validate_pattern() to check syntax",
-                "Combine with other patterns using compose_rule()",
-            ],
+            "tips": list(_EXPLAIN_TIPS),
         }
         
         return explanation
@@ -378,7 +487,7 @@ class PatternWizard:
         components = []
         
         # Find metavariables
-        for match in re.finditer(r'(\$+)(\w+)', pattern):
+        for match in _METAVAR_RE.finditer(pattern):
             prefix = match.group(1)
             name = match.group(2)
             
@@ -428,13 +537,4 @@ class PatternWizard:
     
     def _get_common_uses(self, pattern: str, language: str) -> List[str]:
         """Get common use cases for the pattern."""
-        uses = []
-        
-        if "$NAME" in pattern:
-            uses.append("Finding all occurrences of specific identifiers")
-        if "$$$ARGS" in pattern:
-            uses.append("Matching functions regardless of parameter count")
-        if "async" in pattern:
-            uses.append("Identifying asynchronous code for refactoring")
-        
-        return uses
\ No newline at end of file
+        return [use for marker, use in _COMMON_USES if marker in pattern]
\ No newline at end of file
@@ -4,25 +4,308 @@ Project diagnostic tool to help debug directory and language detection issues.
 This addresses the user feedback about the tool analyzing the wrong directory
 and misidentifying project languages.
 """
-from typing import Dict, Any, Optional
+from typing import AbstractSet, Dict, Any, Iterator, List, Optional, Tuple
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
+import heapq
 import os
+import stat
+import threading
+import time
 
 from ..utils.error_handling import handle_errors
 
 
+# Common code file extensions
+_CODE_EXTENSIONS = frozenset({
+    '.py', '.rs', '.js', '.jsx', '.ts', '.tsx', '.go', '.c', '.cpp', '.h', '.hpp',
+    '.java', '.kt', '.swift', '.rb', '.php', '.lua', '.hs', '.ml', '.scala',
+    '.clj', '.ex', '.erl', '.dart', '.zig'
+})
+
+# Extension-based language detection
+_EXT_TO_LANG = MappingProxyType({
+    ".py": "python", ".rs": "rust", ".js": "javascript", ".jsx": "javascript",
+    ".ts": "typescript", ".tsx": "typescript", ".go": "go", ".c": "c",
+    ".cpp": "cpp", ".h": "c", ".hpp": "cpp", ".java": "java",
+    ".kt": "kotlin", ".swift": "swift", ".rb": "ruby", ".php": "php"
+})
+
+# Files whose presence marks a project type, relative to the project root
+_PROJECT_INDICATORS = MappingProxyType({
+    "rust": ("Cargo.toml", "Cargo.lock", "src/main.rs", "src/lib.rs"),
+    "python": ("setup.py", "pyproject.toml", "requirements.txt", "Pipfile", "__init__.py"),
+    "javascript": ("package.json", "yarn.lock", "package-lock.json"),
+    "typescript": ("tsconfig.json", "tslint.json"),
+    "go": ("go.mod", "go.sum", "main.go"),
+    "java": ("pom.xml", "build.gradle", "build.gradle.kts")
+})
+
+# Dependency, build, cache and VCS directories the content walk does not
+# enter; they can hold far more files than the project itself
+_PRUNE_DIRS = frozenset({
+    ".git", ".hg", ".svn", "node_modules", "target", "build", "dist",
+    "__pycache__", ".venv", "venv", ".mypy_cache", ".pytest_cache", ".tox", ".cargo"
+})
+
+# Files above this size are reported, the largest few of them
+_LARGE_FILE_SIZE = 100000
+_LARGEST_FILES = 10
+
+# Code files sampled by the quick language probe: it stops at the cap, or
+# once at least the minimum is seen and one language holds the share
+_PROBE_MAX_CODE_FILES = 500
+_PROBE_MIN_CODE_FILES = 50
+_PROBE_CONFIDENCE = 0.9
+
+# Content scans kept per diagnostic, and how long one may be reused; the
+# cache key only notices changes to the root directory itself
+_SCAN_CACHE_SIZE = 32
+_SCAN_CACHE_SECONDS = 30.0
+
+# Threads for walking top-level subdirectories; the walk waits on the
+# filesystem far more than it runs Python code, so more threads than cores
+_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _walk(
+    root: str,
+    relative_dir: str = "",
+    depth: int = 0,
+    recurse: bool = True,
+    prune: AbstractSet[str] = frozenset(),
+) -> Iterator[Tuple[os.DirEntry, str, int]]:
+    """
+    Walk everything below a directory with os.scandir.
+    
+    Like Path.rglob("*"), symlinked directories are reported but not entered
+    and unreadable directories are skipped, but the file type answers cached
+    on each DirEntry are reused instead of a stat per Path.
+    
+    Args:
+        root: Root of the tree; yielded paths are relative to it
+        relative_dir: Directory below root to start from
+        depth: Depth of relative_dir below root
+        recurse: Whether to descend into subdirectories
+        prune: Names of directories to report but not descend into
+        
+    Yields:
+        (entry, path relative to root, depth of its directory below root)
+    """
+    pending = deque([(relative_dir, depth)])
+    while pending:
+        relative_dir, depth = pending.popleft()
+        try:
+            with os.scandir(os.path.join(root, relative_dir)) as entries:
+                # Relative paths are built by concatenation, not per-entry joins
+                prefix = relative_dir + os.sep if relative_dir else ""
+                for entry in entries:
+                    relative_path = prefix + entry.name
+                    yield entry, relative_path, depth
+                    if recurse and entry.name not in prune and entry.is_dir(follow_symlinks=False):
+                        pending.append((relative_path, depth + 1))
+        except OSError:
+            continue
+
+
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """Stat a path, or return None where Path.exists() would be False."""
+    try:
+        return path.stat()
+    except (OSError, ValueError):
+        return None
+
+
+def _indicator_exists(
+    root: Path,
+    indicator: str,
+    top_level: Optional[Dict[str, os.DirEntry]]
+) -> bool:
+    """
+    Check whether a project indicator exists, like (root / indicator).exists().
+    
+    Args:
+        root: Project root
+        indicator: Indicator path relative to root, "/"-separated
+        top_level: Entries of root by name, or None if it could not be listed
+        
+    Returns:
+        Whether the indicator exists
+    """
+    if top_level is None:
+        return (root / indicator).exists()
+    
+    first, nested, _ = indicator.partition("/")
+    entry = top_level.get(first)
+    if entry is None:
+        return False
+    if nested or entry.is_symlink():
+        # Nested paths are only stat'ed when their directory is present, and
+        # symlinks are stat'ed to rule out broken ones
+        return (root / indicator).exists()
+    return True
+
+
+def _suffix(name: str) -> str:
+    """Lowercase suffix of a file name, by the same rule as Path.suffix."""
+    # No suffix for dotfiles or a trailing dot
+    dot = name.rfind('.')
+    return name[dot:].lower() if 0 < dot < len(name) - 1 else ''
+
+
+@dataclass(slots=True)
+class _ContentScan:
+    """Counters gathered while walking part of a directory tree."""
+    total_files: int = 0
+    total_dirs: int = 0
+    code_files: int = 0
+    max_depth: int = 0
+    pruned_dirs: int = 0
+    has_hidden_files: bool = False
+    files_by_extension: Counter = field(default_factory=Counter)
+    # Min-heap of the largest (size, path) pairs, never more than _LARGEST_FILES
+    large_files: List[Tuple[int, str]] = field(default_factory=list)
+    # Subdirectories left unwalked by a non-recursive scan
+    subdirectories: List[str] = field(default_factory=list)
+    
+    def merge(self, other: "_ContentScan") -> None:
+        """Add the counters of another scan to this one."""
+        self.total_files += other.total_files
+        self.total_dirs += other.total_dirs
+        self.code_files += other.code_files
+        self.max_depth = max(self.max_depth, other.max_depth)
+        self.pruned_dirs += other.pruned_dirs
+        self.has_hidden_files = self.has_hidden_files or other.has_hidden_files
+        self.files_by_extension.update(other.files_by_extension)
+        for size, relative_path in other.large_files:
+            self.add_large_file(size, relative_path)
+    
+    def add_large_file(self, size: int, relative_path: str) -> None:
+        """Keep a file if it is among the largest seen so far."""
+        if len(self.large_files) < _LARGEST_FILES:
+            heapq.heappush(self.large_files, (size, relative_path))
+        else:
+            heapq.heappushpop(self.large_files, (size, relative_path))
+
+
+def _scan_subtree(
+    root: str,
+    relative_dir: str = "",
+    depth: int = 0,
+    recurse: bool = True,
+    sizes: bool = True,
+) -> _ContentScan:
+    """
+    Count the files and directories below one directory of a tree.
+    
+    Directories named in _PRUNE_DIRS are counted but not walked.
+    
+    Args:
+        root: Root of the tree; reported paths are relative to it
+        relative_dir: Directory below root to scan
+        depth: Depth of relative_dir below root
+        recurse: Whether to descend into subdirectories; if not, they are
+            collected in the result's subdirectories instead
+        sizes: Whether to stat files to find the largest ones
+        
+    Returns:
+        Counters for the scanned part of the tree
+    """
+    scan = _ContentScan()
+    files_by_extension = scan.files_by_extension
+    
+    for entry, relative_path, entry_depth in _walk(root, relative_dir, depth, recurse, _PRUNE_DIRS):
+        try:
+            is_file = entry.is_file()
+            is_dir = not is_file and entry.is_dir()
+        except OSError:
+            continue
+        
+        if is_file:
+            scan.total_files += 1
+            name = entry.name
+            ext = _suffix(name)
+            files_by_extension[ext] += 1
+            
+            if ext in _CODE_EXTENSIONS:
+                scan.code_files += 1
+            
+            scan.max_depth = max(scan.max_depth, entry_depth + 1)
+            if entry_depth == 0 and name.startswith('.'):
+                scan.has_hidden_files = True
+            
+            if sizes:
+                try:
+                    size = entry.stat().st_size
+                    if size > _LARGE_FILE_SIZE:
+                        scan.add_large_file(size, relative_path)
+                except OSError:
+                    pass
+                
+        elif is_dir:
+            scan.total_dirs += 1
+            if entry.name in _PRUNE_DIRS:
+                scan.pruned_dirs += 1
+            elif not recurse and not entry.is_symlink():
+                scan.subdirectories.append(relative_path)
+    
+    return scan
+
+
+def _scan_tree(root: str, sizes: bool = True) -> _ContentScan:
+    """
+    Count the files and directories below root.
+    
+    The top level is listed directly and its subdirectories are walked on a
+    thread pool, so a cold directory cache is read with several requests in
+    flight instead of one at a time.
+    
+    Args:
+        root: Directory to scan
+        sizes: Whether to stat files to find the largest ones
+        
+    Returns:
+        Counters for the whole tree
+    """
+    scan = _scan_subtree(root, recurse=False, sizes=sizes)
+    subdirectories = scan.subdirectories
+    
+    if len(subdirectories) < 2:
+        subtrees = [_scan_subtree(root, subdir, 1, sizes=sizes) for subdir in subdirectories]
+    else:
+        with ThreadPoolExecutor(max_workers=min(_SCAN_WORKERS, len(subdirectories))) as executor:
+            subtrees = list(executor.map(
+                lambda subdir: _scan_subtree(root, subdir, 1, sizes=sizes),
+                subdirectories,
+            ))
+    
+    # Merged in listing order, so the result does not depend on thread timing
+    for subtree in subtrees:
+        scan.merge(subtree)
+    
+    return scan
+
+
 class ProjectDiagnostic:
     """Tool to diagnose project detection and language identification issues."""
     
     def __init__(self, logger=None):
         self.logger = logger
+        # (root, root mtime, sizes) -> (monotonic time scanned, scan), least recently used first
+        self._scan_cache: "OrderedDict[Tuple[str, int, bool], Tuple[float, _ContentScan]]" = OrderedDict()
+        # Tools may run on worker threads; guards every change to _scan_cache
+        self._scan_cache_lock = threading.Lock()
     
     @handle_errors
     def diagnose_directory_detection(
         self,
         directory: str,
         expected_language: Optional[str] = None,
-        expected_project_type: Optional[str] = None
+        expected_project_type: Optional[str] = None,
+        mode: str = "full"
     ) -> Dict[str, Any]:
         """
         Comprehensive diagnostic of directory and language detection.
@@ -31,10 +314,16 @@ class ProjectDiagnostic:
             directory: Directory to diagnose
             expected_language: What language you expect to find
             expected_project_type: What project type you expect
+            mode: "full", or "fast" to skip sizing every file for the
+                largest_files report
             
         Returns:
             Detailed diagnostic information
         """
+        if mode not in ("full", "fast"):
+            raise ValueError(f"Unknown diagnostic mode: {mode}")
+        sizes = mode == "full"
+        cwd = os.getcwd()
         
         diagnostic = {
             "input": {
@@ -43,8 +332,8 @@ class ProjectDiagnostic:
                 "expected_project_type": expected_project_type
             },
             "environment": {
-                "current_working_directory": str(Path.cwd()),
-                "python_working_directory": os.getcwd(),
+                "current_working_directory": cwd,
+                "python_working_directory": cwd,
                 "script_location": str(Path(__file__).parent)
             },
             "path_resolution": {},
@@ -60,25 +349,39 @@ class ProjectDiagnostic:
             original_path = Path(directory)
             resolved_path = original_path.resolve()
             absolute_path = original_path.absolute()
+            resolved = str(resolved_path)
+            # One stat answers both exists() and is_dir()
+            root_stat = _stat_or_none(resolved_path)
+            exists = root_stat is not None
+            is_directory = root_stat is not None and stat.S_ISDIR(root_stat.st_mode)
+            
+            # Plain string prefix test instead of is_relative_to/relative_to
+            cwd_prefix = cwd if cwd.endswith(os.sep) else cwd + os.sep
+            if resolved == cwd:
+                relative_to_cwd = "."
+            elif resolved.startswith(cwd_prefix):
+                relative_to_cwd = resolved[len(cwd_prefix):]
+            else:
+                relative_to_cwd = "outside_cwd"
             
             diagnostic["path_resolution"] = {
                 "original": directory,
                 "as_path_object": str(original_path),
-                "resolved": str(resolved_path),
+                "resolved": resolved,
                 "absolute": str(absolute_path),
                 "is_relative": not original_path.is_absolute(),
-                "exists": resolved_path.exists(),
-                "is_directory": resolved_path.is_dir() if resolved_path.exists() else False,
-                "relative_to_cwd": str(resolved_path.relative_to(Path.cwd())) if resolved_path.exists() and resolved_path.is_relative_to(Path.cwd()) else "outside_cwd"
+                "exists": exists,
+                "is_directory": is_directory,
+                "relative_to_cwd": relative_to_cwd if exists else "outside_cwd"
             }
             
-            if not resolved_path.exists():
+            if not exists:
                 diagnostic["directory_validation"]["error"] = f"Directory does not exist: {resolved_path}"
                 diagnostic["recommendations"].append(f"Check if directory '{directory}' exists")
-                diagnostic["recommendations"].append(f"Current working directory is: {Path.cwd()}")
+                diagnostic["recommendations"].append(f"Current working directory is: {cwd}")
                 return diagnostic
                 
-            if not resolved_path.is_dir():
+            if not is_directory:
                 diagnostic["directory_validation"]["error"] = f"Path exists but is not a directory: {resolved_path}"
                 diagnostic["recommendations"].append(f"'{directory}' is a file, not a directory")
                 return diagnostic
@@ -96,77 +399,47 @@ class ProjectDiagnostic:
             diagnostic["recommendations"].append(f"Path resolution failed: {e}")
             return diagnostic
         
-        # Step 3: Content analysis
+        # Step 3: Content analysis; empty counters stand in if it fails
+        scan = _ContentScan()
+        # Missing paths returned in step 1, so the root was stat'ed
+        assert root_stat is not None
         try:
-            files_by_extension = {}
-            total_files = 0
-            total_dirs = 0
-            code_files = 0
-            large_files = []
-            
-            # Common code file extensions
-            code_extensions = {
-                '.py', '.rs', '.js', '.jsx', '.ts', '.tsx', '.go', '.c', '.cpp', '.h', '.hpp',
-                '.java', '.kt', '.swift', '.rb', '.php', '.lua', '.hs', '.ml', '.scala',
-                '.clj', '.ex', '.erl', '.dart', '.zig'
-            }
-            
-            for item in resolved_path.rglob("*"):
-                if item.is_file():
-                    total_files += 1
-                    ext = item.suffix.lower()
-                    files_by_extension[ext] = files_by_extension.get(ext, 0) + 1
-                    
-                    if ext in code_extensions:
-                        code_files += 1
-                    
-                    try:
-                        size = item.stat().st_size
-                        if size > 100000:  # Files larger than 100KB
-                            large_files.append((str(item.relative_to(resolved_path)), size))
-                    except OSError:
-                        pass
-                        
-                elif item.is_dir():
-                    total_dirs += 1
-            
-            # Sort extensions by frequency
-            sorted_extensions = sorted(files_by_extension.items(), key=lambda x: x[1], reverse=True)
+            scan = self._cached_scan(resolved, root_stat.st_mtime_ns, sizes)
             
             diagnostic["content_analysis"] = {
-                "total_files": total_files,
-                "total_directories": total_dirs,
-                "code_files": code_files,
-                "files_by_extension": dict(sorted_extensions[:20]),  # Top 20
-                "largest_files": sorted(large_files, key=lambda x: x[1], reverse=True)[:10],
-                "has_hidden_files": any(f.name.startswith('.') for f in resolved_path.iterdir() if f.is_file()),
-                "depth": max((len(p.relative_to(resolved_path).parts) for p in resolved_path.rglob("*") if p.is_file()), default=0)
+                "total_files": scan.total_files,
+                "total_directories": scan.total_dirs,
+                "code_files": scan.code_files,
+                "files_by_extension": dict(scan.files_by_extension.most_common(20)),  # Top 20
+                "has_hidden_files": scan.has_hidden_files,
+                "depth": scan.max_depth,
+                "pruned_directories": scan.pruned_dirs
             }
+            if sizes:
+                diagnostic["content_analysis"]["largest_files"] = [
+                    (path, size) for size, path in sorted(scan.large_files, reverse=True)
+                ]
             
         except Exception as e:
             diagnostic["content_analysis"]["error"] = str(e)
             diagnostic["recommendations"].append(f"Content analysis failed: {e}")
         
+        files_by_extension = scan.files_by_extension
+        total_files = scan.total_files
+        code_files = scan.code_files
+        
         # Step 4: Language detection analysis
         try:
             # Extension-based detection
-            ext_to_lang = {
-                ".py": "python", ".rs": "rust", ".js": "javascript", ".jsx": "javascript",
-                ".ts": "typescript", ".tsx": "typescript", ".go": "go", ".c": "c",
-                ".cpp": "cpp", ".h": "c", ".hpp": "cpp", ".java": "java",
-                ".kt": "kotlin", ".swift": "swift", ".rb": "ruby", ".php": "php"
-            }
-            
-            lang_counts = {}
+            lang_counts: Counter[str] = Counter()
             for ext, count in files_by_extension.items():
-                if ext in ext_to_lang:
-                    lang = ext_to_lang[ext]
-                    lang_counts[lang] = lang_counts.get(lang, 0) + count
+                if ext in _EXT_TO_LANG:
+                    lang_counts[_EXT_TO_LANG[ext]] += count
             
-            primary_lang_by_files = max(lang_counts.items(), key=lambda x: x[1]) if lang_counts else (None, 0)
+            primary_lang_by_files = lang_counts.most_common(1)[0] if lang_counts else (None, 0)
             
             diagnostic["language_detection"] = {
-                "files_by_language": lang_counts,
+                "files_by_language": dict(lang_counts),
                 "primary_by_file_count": primary_lang_by_files[0],
                 "primary_file_count": primary_lang_by_files[1],
                 "confidence": primary_lang_by_files[1] / code_files if code_files > 0 else 0,
@@ -178,20 +451,18 @@ class ProjectDiagnostic:
         
         # Step 5: Project type detection
         try:
-            project_indicators = {
-                "rust": ["Cargo.toml", "Cargo.lock", "src/main.rs", "src/lib.rs"],
-                "python": ["setup.py", "pyproject.toml", "requirements.txt", "Pipfile", "__init__.py"],
-                "javascript": ["package.json", "yarn.lock", "package-lock.json"],
-                "typescript": ["tsconfig.json", "tslint.json"],
-                "go": ["go.mod", "go.sum", "main.go"],
-                "java": ["pom.xml", "build.gradle", "build.gradle.kts"]
-            }
+            # One listing of the root answers the top-level indicators
+            try:
+                with os.scandir(resolved_path) as entries:
+                    top_level = {entry.name: entry for entry in entries}
+            except OSError:
+                top_level = None
             
             detected_indicators = {}
-            for project_type, indicators in project_indicators.items():
+            for project_type, indicators in _PROJECT_INDICATORS.items():
                 found_indicators = []
                 for indicator in indicators:
-                    if (resolved_path / indicator).exists():
+                    if _indicator_exists(resolved_path, indicator, top_level):
                         found_indicators.append(indicator)
                 if found_indicators:
                     detected_indicators[project_type] = found_indicators
@@ -211,8 +482,8 @@ class ProjectDiagnostic:
         except Exception as e:
             diagnostic["project_type_detection"]["error"] = str(e)
         
-        # Step 6: Generate recommendations
-        recommendations = []
+        # Step 6: Generate recommendations, after any added by earlier steps
+        recommendations = diagnostic["recommendations"]
         
         # Check if we're analyzing the right directory
         if expected_language and diagnostic["language_detection"].get("primary_by_file_count") == expected_language:
@@ -241,8 +512,6 @@ class ProjectDiagnostic:
         elif total_files > 10000:
             recommendations.append("Very large directory - consider using more specific subdirectories")
         
-        diagnostic["recommendations"] = recommendations
-        
         return diagnostic
     
     @handle_errors  
@@ -258,25 +527,73 @@ class ProjectDiagnostic:
         Returns:
             Validation results with suggestions
         """
+        return self._validate_pattern(self._check_directory(directory), pattern, language)
+    
+    @handle_errors
+    def validate_many(
+        self,
+        directory: str,
+        patterns: List[Tuple[str, Optional[str]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Validate several patterns against one search directory.
+        
+        The directory is checked once and shared by every validation.
         
+        Args:
+            directory: Directory to search
+            patterns: (pattern, language) pairs to validate
+            
+        Returns:
+            One validation result per pattern, in order
+        """
+        directory_check = self._check_directory(directory)
+        return [
+            self._validate_pattern(directory_check, pattern, language)
+            for pattern, language in patterns
+        ]
+    
+    def _check_directory(self, directory: str) -> Dict[str, Any]:
+        """Check a search directory exists and sample its code files."""
+        # Only a sample of the code files is needed to tell whether there
+        # is anything to search and in which language
+        exists = is_directory = False
+        resolved = ""
+        code_files, detected = 0, None
+        try:
+            resolved_path = Path(directory).resolve()
+            resolved = str(resolved_path)
+            root_stat = _stat_or_none(resolved_path)
+            exists = root_stat is not None
+            is_directory = root_stat is not None and stat.S_ISDIR(root_stat.st_mode)
+        except (OSError, RuntimeError):
+            pass
+        if is_directory:
+            code_files, detected = self._quick_language_probe(resolved)
+        
+        return {
+            "exists": exists,
+            "is_directory": is_directory,
+            "resolved_path": resolved,
+            "code_files_found": code_files,
+            "detected_language": detected
+        }
+    
+    def _validate_pattern(
+        self,
+        directory_check: Dict[str, Any],
+        pattern: str,
+        language: Optional[str]
+    ) -> Dict[str, Any]:
+        """Validate a pattern and language against a checked directory."""
         validation = {
-            "directory_check": {},
+            "directory_check": dict(directory_check),
             "pattern_check": {},
             "language_check": {},
             "recommendations": [],
             "ready_to_search": False
         }
         
-        # Check directory
-        dir_diagnostic = self.diagnose_directory_detection(directory, language)
-        validation["directory_check"] = {
-            "exists": dir_diagnostic["path_resolution"].get("exists", False),
-            "is_directory": dir_diagnostic["path_resolution"].get("is_directory", False),
-            "resolved_path": dir_diagnostic["path_resolution"].get("resolved", ""),
-            "code_files_found": dir_diagnostic["content_analysis"].get("code_files", 0),
-            "detected_language": dir_diagnostic["language_detection"].get("primary_by_file_count")
-        }
-        
         # Check pattern
         validation["pattern_check"] = {
             "pattern": pattern,
@@ -331,4 +648,86 @@ class ProjectDiagnostic:
         else:
             validation["recommendations"].append("❌ Not ready to search - address issues above")
         
-        return validation
\ No newline at end of file
+        return validation
+    
+    def _cached_scan(self, root: str, mtime_ns: int, sizes: bool = True) -> _ContentScan:
+        """
+        Scan a directory tree, reusing a recent scan of the same tree.
+        
+        Repeated diagnostics of one directory are common, so scans are kept
+        per (root, root mtime) for up to _SCAN_CACHE_SECONDS; the results
+        are shared and must not be modified.
+        
+        Args:
+            root: Resolved directory to scan
+            mtime_ns: Modification time of root in nanoseconds
+            sizes: Whether to stat files to find the largest ones
+            
+        Returns:
+            Counters for the whole tree
+        """
+        key = (root, mtime_ns, sizes)
+        now = time.monotonic()
+        with self._scan_cache_lock:
+            cached = self._scan_cache.get(key)
+            if cached is not None and now - cached[0] < _SCAN_CACHE_SECONDS:
+                self._scan_cache.move_to_end(key)
+                return cached[1]
+        
+        # The walk runs outside the lock so other directories are not held up
+        scan = _scan_tree(root, sizes)
+        with self._scan_cache_lock:
+            self._scan_cache[key] = (now, scan)
+            self._scan_cache.move_to_end(key)
+            while len(self._scan_cache) > _SCAN_CACHE_SIZE:
+                self._scan_cache.popitem(last=False)
+        return scan
+    
+    def _quick_language_probe(
+        self,
+        root: str,
+        max_files: int = _PROBE_MAX_CODE_FILES
+    ) -> Tuple[int, Optional[str]]:
+        """
+        Sample code files breadth-first until the primary language is clear.
+        
+        The walk stops after max_files code files, or once at least
+        _PROBE_MIN_CODE_FILES were seen and one language accounts for more
+        than _PROBE_CONFIDENCE of them, so the count is a lower bound.
+        
+        Args:
+            root: Directory to probe
+            max_files: Code files after which the walk always stops
+            
+        Returns:
+            (code files seen, primary language by file count)
+        """
+        code_files = 0
+        lang_counts: Counter[str] = Counter()
+        
+        for entry, _, _ in _walk(root, prune=_PRUNE_DIRS):
+            ext = _suffix(entry.name)
+            if ext not in _CODE_EXTENSIONS:
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+            except OSError:
+                continue
+            
+            code_files += 1
+            lang = _EXT_TO_LANG.get(ext)
+            if lang:
+                lang_counts[lang] += 1
+            
+            if code_files >= max_files:
+                break
+            if (
+                lang
+                and code_files >= _PROBE_MIN_CODE_FILES
+                and lang_counts[lang] > _PROBE_CONFIDENCE * code_files
+            ):
+                break
+        
+        primary = lang_counts.most_common(1)[0][0] if lang_counts else None
+        return code_files, primary
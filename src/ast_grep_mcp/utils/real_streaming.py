@@ -3,15 +3,197 @@ Real streaming implementation for large operations.
 """
 from typing import Dict, Any, List, Optional
 from pathlib import Path
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import os
+import re
 import time
 from dataclasses import dataclass, asdict
-import queue
 import threading
 from enum import Enum
 
+from ..ast_analyzer import AstAnalyzer
 from ..utils.error_handling import handle_errors
 
 
+_EXTENSION_TO_LANGUAGE = {
+    ".py": "python",
+    ".rs": "rust",
+    ".js": "javascript",
+    ".jsx": "javascript",
+    ".ts": "typescript",
+    ".tsx": "typescript",
+    ".go": "go",
+    ".c": "c",
+    ".h": "c",
+    ".cpp": "cpp",
+    ".java": "java",
+    ".lua": "lua",
+}
+
+# Worker batches hold at least this many files, so each IPC round-trip does real work
+_MIN_BATCH_FILES = 5
+
+# The producer blocks once this many chunks are waiting to be read
+_MAX_PENDING_CHUNKS = 4
+# How often a blocked producer rechecks for cancellation
+_SPACE_WAIT_SECONDS = 1.0
+# A blocked stream with no chunk requested for this long is treated as abandoned
+_STREAM_IDLE_SECONDS = 300.0
+
+# Worker pools are shared by all streams; starting processes per stream is costly.
+# Pools are created from a stream thread, where forking could copy held locks.
+_process_pools: Dict[int, ProcessPoolExecutor] = {}
+_process_pools_lock = threading.Lock()
+
+
+def _get_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Return the shared process pool with the given number of workers."""
+    with _process_pools_lock:
+        pool = _process_pools.get(max_workers)
+        if pool is None:
+            pool = _process_pools[max_workers] = ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return pool
+
+
+def _discard_process_pool(max_workers: int, pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next stream starts a fresh one."""
+    with _process_pools_lock:
+        if _process_pools.get(max_workers) is pool:
+            del _process_pools[max_workers]
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _default_workers(num_files: int) -> int:
+    """Pick a worker count for a stream, with the same limits as AstAnalyzer.search_directory."""
+    cpu_count = os.cpu_count() or 4
+    if num_files < 100:
+        workers = min(2, cpu_count)
+    elif num_files < 500:
+        workers = min(cpu_count - 1, 4)
+    else:
+        workers = min(cpu_count, 8)
+    return max(1, workers)
+
+
+def _detect_language(file_path: str) -> Optional[str]:
+    """Detect language from file extension."""
+    return _EXTENSION_TO_LANGUAGE.get(Path(file_path).suffix.lower())
+
+
+def _process_single_file(analyzer: Optional[AstAnalyzer], file_path: Path, pattern: str) -> Optional[Dict[str, Any]]:
+    """
+    Process a single file for matches.
+    
+    This is a module-level function so worker processes can run it with a
+    pickled analyzer instead of the whole search engine.
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            content = f.read()
+        
+        # Detect language
+        language = _detect_language(str(file_path))
+        if not language:
+            return None
+        
+        # Use analyzer if available
+        if analyzer:
+            result = analyzer.analyze_code(content, language, pattern)
+            if result and result.get("matches"):
+                return {
+                    "file": str(file_path),
+                    "language": language,
+                    "matches": len(result["matches"]),
+                    "sample_matches": result["matches"][:3],  # First 3 matches only
+                    "file_size": len(content),
+                    "lines": content.count('\n') + 1
+                }
+        else:
+            # Simple fallback
+            if pattern in content:
+                matches = list(re.finditer(re.escape(pattern), content))
+                if matches:
+                    return {
+                        "file": str(file_path),
+                        "language": language,
+                        "matches": len(matches),
+                        "file_size": len(content),
+                        "lines": content.count('\n') + 1
+                    }
+    
+    except Exception:
+        pass
+    
+    return None
+
+
+def _process_file_patterns(
+    analyzer: Optional[AstAnalyzer], file_path: Path, patterns: List[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """
+    Read and detect a file once, then match every pattern against it.
+    
+    A pattern that fails is reported as a finding with an "error" entry, so
+    one bad pattern does not hide the findings of the others.
+    """
+    language = _detect_language(str(file_path))
+    if not language:
+        return None
+    
+    try:
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            content = f.read()
+    except OSError:
+        return None
+    
+    findings = []
+    for pattern_info in patterns:
+        pattern = pattern_info["pattern"]
+        finding = {
+            "pattern": pattern,
+            "severity": pattern_info.get("severity"),
+            "issue": pattern_info.get("issue"),
+        }
+        try:
+            if analyzer:
+                result = analyzer.analyze_code(content, language, pattern)
+                matches = result.get("matches") if result else None
+            else:
+                matches = [m.group(0) for m in re.finditer(re.escape(pattern), content)]
+        except Exception as e:
+            findings.append({**finding, "matches": 0, "error": str(e)})
+            continue
+        
+        if matches:
+            findings.append({**finding, "matches": len(matches), "sample_matches": matches[:3]})
+    
+    if not findings:
+        return None
+    
+    return {
+        "file": str(file_path),
+        "language": language,
+        "matches": sum(finding["matches"] for finding in findings),
+        "findings": findings,
+        "file_size": len(content),
+        "lines": content.count('\n') + 1
+    }
+
+
+def _process_file_batch(
+    analyzer: Optional[AstAnalyzer], files: List[Path], pattern: str, patterns: Optional[List[Dict[str, Any]]] = None
+) -> List[Optional[Dict[str, Any]]]:
+    """Process a batch of files in a single worker, keeping their order."""
+    if patterns is not None:
+        return [_process_file_patterns(analyzer, file_path, patterns) for file_path in files]
+    return [_process_single_file(analyzer, file_path, pattern) for file_path in files]
+
+
 class StreamStatus(Enum):
     INITIALIZING = "initializing"
     RUNNING = "running" 
@@ -64,7 +246,7 @@ class StreamingSearchEngine:
         language: Optional[str] = None,
         file_extensions: Optional[List[str]] = None,
         chunk_size: int = 10,
-        max_workers: int = 2
+        max_workers: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Create a real streaming search that processes files in chunks.
@@ -75,11 +257,54 @@ class StreamingSearchEngine:
             language: Language filter
             file_extensions: File extension filter  
             chunk_size: Number of files per chunk
-            max_workers: Number of parallel workers
+            max_workers: Number of worker processes (by default sized from the CPU
+                and file counts, at most 8)
+            
+        Returns:
+            Stream configuration with stream_id
+        """
+        return self._create_stream(
+            pattern, None, directory, language, file_extensions, chunk_size, max_workers
+        )
+    
+    def create_multi_pattern_stream(
+        self,
+        patterns: List[Dict[str, Any]],
+        directory: str,
+        language: Optional[str] = None,
+        chunk_size: int = 10,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Create a stream that reads each file once and matches several patterns in it.
+        
+        Args:
+            patterns: Pattern dicts with "pattern" and optional "severity" and "issue"
+            directory: Directory to search
+            language: Language filter
+            chunk_size: Number of files per chunk
+            max_workers: Number of worker processes (by default sized from the CPU
+                and file counts, at most 8)
             
         Returns:
             Stream configuration with stream_id
         """
+        description = ", ".join(p["pattern"] for p in patterns)
+        return self._create_stream(
+            description, patterns, directory, language, None, chunk_size, max_workers
+        )
+    
+    def _create_stream(
+        self,
+        pattern: str,
+        patterns: Optional[List[Dict[str, Any]]],
+        directory: str,
+        language: Optional[str],
+        file_extensions: Optional[List[str]],
+        chunk_size: int,
+        max_workers: Optional[int]
+    ) -> Dict[str, Any]:
+        """Discover the files to search and start processing them in the background."""
         stream_id = f"stream_{self.stream_counter}_{int(time.time())}"
         self.stream_counter += 1
         
@@ -109,16 +334,22 @@ class StreamingSearchEngine:
         stream_state = {
             "stream_id": stream_id,
             "pattern": pattern,
+            "patterns": patterns,
             "directory": directory,
             "language": language,
             "file_extensions": file_extensions,
             "chunk_size": chunk_size,
-            "max_workers": max_workers,
+            "max_workers": max_workers or _default_workers(len(files_to_process)),
             "files_to_process": files_to_process,
             "total_files": len(files_to_process),
             "processed_files": 0,
+            "processed_lock": threading.Lock(),
             "status": StreamStatus.INITIALIZING,
-            "results_queue": queue.Queue(),
+            # One producer thread appends chunks and sets the event for the consumer
+            "results_deque": deque(),
+            "results_event": threading.Event(),
+            "space_event": threading.Event(),
+            "last_read": time.monotonic(),
             "start_time": time.time(),
             "current_chunk": 0,
             "total_chunks": (len(files_to_process) + chunk_size - 1) // chunk_size,
@@ -154,29 +385,12 @@ class StreamingSearchEngine:
             return {"error": f"Stream not found: {stream_id}"}
         
         stream_state = self.active_streams[stream_id]
+        stream_state["last_read"] = time.monotonic()
         
-        try:
-            # Wait for next chunk
-            chunk = stream_state["results_queue"].get(timeout=timeout)
-            
-            # Update progress
-            progress = self._calculate_progress(stream_state)
-            
-            response = {
-                "stream_id": stream_id,
-                "chunk": chunk.to_dict(),
-                "progress": progress.to_dict(),
-                "status": stream_state["status"].value,
-                "has_more": not chunk.is_final and stream_state["status"] != StreamStatus.COMPLETED
-            }
-            
-            # Clean up completed streams
-            if chunk.is_final:
-                self._cleanup_stream(stream_id)
-            
-            return response
-            
-        except queue.Empty:
+        # Wait for next chunk
+        chunk = self._wait_for_chunk(stream_state, timeout)
+        
+        if chunk is None:
             # Timeout - check if stream is still active
             if stream_state["status"] in [StreamStatus.COMPLETED, StreamStatus.FAILED, StreamStatus.CANCELLED]:
                 return {
@@ -194,6 +408,76 @@ class StreamingSearchEngine:
                     "has_more": True,
                     "message": "No data available yet, try again"
                 }
+        
+        # Update progress
+        progress = self._calculate_progress(stream_state)
+        
+        response = {
+            "stream_id": stream_id,
+            "chunk": chunk.to_dict(),
+            "progress": progress.to_dict(),
+            "status": stream_state["status"].value,
+            # A completed stream may still have chunks waiting, so only the final chunk ends it
+            "has_more": not chunk.is_final and stream_state["status"] != StreamStatus.CANCELLED
+        }
+        
+        # Clean up completed streams
+        if chunk.is_final:
+            self._cleanup_stream(stream_id)
+        
+        return response
+    
+    def _wait_for_space(self, stream_state: Dict) -> bool:
+        """
+        Block the producer while the consumer is _MAX_PENDING_CHUNKS chunks behind.
+        
+        A stream whose chunks have not been requested for _STREAM_IDLE_SECONDS
+        is cancelled and cleaned up, so abandoned streams do not keep their
+        producer thread alive.
+        
+        Returns:
+            False if the stream was cancelled while waiting
+        """
+        results = stream_state["results_deque"]
+        space = stream_state["space_event"]
+        
+        while len(results) >= _MAX_PENDING_CHUNKS and stream_state["status"] != StreamStatus.CANCELLED:
+            if time.monotonic() - stream_state["last_read"] > _STREAM_IDLE_SECONDS:
+                stream_state["status"] = StreamStatus.CANCELLED
+                stream_state["error"] = f"No chunk requested for {_STREAM_IDLE_SECONDS:.0f} seconds"
+                if self.logger:
+                    self.logger.info(f"Cancelling abandoned stream {stream_state['stream_id']}")
+                self._cleanup_stream(stream_state["stream_id"])
+                break
+            
+            space.clear()
+            # Re-check after clearing so a pop just before the clear is not missed
+            if len(results) < _MAX_PENDING_CHUNKS:
+                break
+            space.wait(_SPACE_WAIT_SECONDS)
+        
+        status: StreamStatus = stream_state["status"]
+        return status != StreamStatus.CANCELLED
+    
+    def _wait_for_chunk(self, stream_state: Dict, timeout: float) -> Optional[StreamChunk]:
+        """Take the next chunk from a stream, or return None once the timeout expires."""
+        results = stream_state["results_deque"]
+        event = stream_state["results_event"]
+        deadline = time.monotonic() + timeout
+        
+        while True:
+            try:
+                chunk: StreamChunk = results.popleft()
+                stream_state["space_event"].set()
+                return chunk
+            except IndexError:
+                pass
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not event.wait(remaining):
+                return None
+            # Clearing before the retry cannot lose a chunk appended after the wait
+            event.clear()
     
     def get_stream_progress(self, stream_id: str) -> Dict[str, Any]:
         """Get current progress of a stream."""
@@ -217,6 +501,8 @@ class StreamingSearchEngine:
         
         stream_state = self.active_streams[stream_id]
         stream_state["status"] = StreamStatus.CANCELLED
+        # Wake a producer waiting for the consumer to catch up
+        stream_state["space_event"].set()
         
         return {
             "stream_id": stream_id,
@@ -252,6 +538,9 @@ class StreamingSearchEngine:
             files_to_process = stream_state["files_to_process"]
             chunk_size = stream_state["chunk_size"]
             pattern = stream_state["pattern"]
+            max_workers = stream_state["max_workers"]
+            # A chunk too small for two batches is not worth sending to workers
+            use_pool = max_workers > 1 and chunk_size >= 2 * _MIN_BATCH_FILES
             
             # Process files in chunks
             for chunk_idx in range(0, len(files_to_process), chunk_size):
@@ -260,24 +549,10 @@ class StreamingSearchEngine:
                     break
                 
                 chunk_files = files_to_process[chunk_idx:chunk_idx + chunk_size]
-                chunk_results = []
-                
-                # Process each file in the chunk
-                for file_path in chunk_files:
-                    if stream_state["status"] == StreamStatus.CANCELLED:
-                        break
-                    
-                    try:
-                        result = self._process_single_file(file_path, pattern)
-                        if result:
-                            chunk_results.append(result)
-                        
-                        stream_state["processed_files"] += 1
-                        
-                    except Exception as e:
-                        if self.logger:
-                            self.logger.debug(f"Error processing {file_path}: {e}")
-                        continue
+                if use_pool and len(chunk_files) >= 2 * _MIN_BATCH_FILES:
+                    chunk_results = self._process_chunk_parallel(stream_state, chunk_files, pattern)
+                else:
+                    chunk_results = self._process_chunk(stream_state, chunk_files, pattern)
                 
                 # Create chunk
                 chunk_num = chunk_idx // chunk_size
@@ -295,12 +570,12 @@ class StreamingSearchEngine:
                     is_final=is_final
                 )
                 
-                # Add chunk to queue
-                stream_state["results_queue"].put(chunk)
+                # Hand the chunk to the consumer once it has caught up
+                if not self._wait_for_space(stream_state):
+                    break
+                stream_state["results_deque"].append(chunk)
+                stream_state["results_event"].set()
                 stream_state["current_chunk"] = chunk_num
-                
-                # Small delay to prevent overwhelming
-                time.sleep(0.1)
             
             # Mark as completed if not cancelled
             if stream_state["status"] != StreamStatus.CANCELLED:
@@ -318,68 +593,92 @@ class StreamingSearchEngine:
                 is_final=True,
                 error=str(e)
             )
-            stream_state["results_queue"].put(error_chunk)
+            stream_state["results_deque"].append(error_chunk)
+            stream_state["results_event"].set()
     
-    def _process_single_file(self, file_path: Path, pattern: str) -> Optional[Dict[str, Any]]:
-        """Process a single file for matches."""
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            # Detect language
-            language = self._detect_language(str(file_path))
-            if not language:
-                return None
+    def _process_chunk(
+        self, stream_state: Dict, chunk_files: List[Path], pattern: str
+    ) -> List[Dict[str, Any]]:
+        """Process the files of a chunk one by one in the stream thread."""
+        patterns = stream_state["patterns"]
+        chunk_results = []
+        
+        for file_path in chunk_files:
+            if stream_state["status"] == StreamStatus.CANCELLED:
+                break
             
-            # Use analyzer if available
-            if self.analyzer:
-                result = self.analyzer.analyze_code(content, language, pattern)
-                if result and result.get("matches"):
-                    return {
-                        "file": str(file_path),
-                        "language": language,
-                        "matches": len(result["matches"]),
-                        "sample_matches": result["matches"][:3],  # First 3 matches only
-                        "file_size": len(content),
-                        "lines": content.count('\n') + 1
-                    }
+            if patterns is not None:
+                result = _process_file_patterns(self.analyzer, file_path, patterns)
             else:
-                # Simple fallback
-                if pattern in content:
-                    import re
-                    matches = list(re.finditer(re.escape(pattern), content))
-                    if matches:
-                        return {
-                            "file": str(file_path),
-                            "language": language,
-                            "matches": len(matches),
-                            "file_size": len(content),
-                            "lines": content.count('\n') + 1
-                        }
-        
-        except Exception:
-            pass
+                result = self._process_single_file(file_path, pattern)
+            if result:
+                chunk_results.append(result)
+            
+            with stream_state["processed_lock"]:
+                stream_state["processed_files"] += 1
         
-        return None
+        return chunk_results
+    
+    def _process_chunk_parallel(
+        self, stream_state: Dict, chunk_files: List[Path], pattern: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Split a chunk into one batch per worker and process the batches in parallel.
+        
+        Batches the workers cannot finish (a worker exception, an analyzer that
+        cannot be pickled, a broken pool) are rerun in the stream thread, so no
+        file is reported as processed without being searched.
+        """
+        max_workers = stream_state["max_workers"]
+        batch_count = min(max_workers, len(chunk_files) // _MIN_BATCH_FILES)
+        batch_size = (len(chunk_files) + batch_count - 1) // batch_count
+        batches = [chunk_files[i:i + batch_size] for i in range(0, len(chunk_files), batch_size)]
+        batch_results: List[Optional[List[Optional[Dict[str, Any]]]]] = [None] * len(batches)
+        
+        pool = _get_process_pool(max_workers)
+        try:
+            futures = {
+                pool.submit(_process_file_batch, self.analyzer, batch, pattern, stream_state["patterns"]): index
+                for index, batch in enumerate(batches)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    batch_results[index] = future.result()
+                except BrokenProcessPool:
+                    raise
+                except Exception as e:
+                    if self.logger:
+                        self.logger.warning(
+                            f"Worker failed on a batch of {len(batches[index])} files, retrying in-process: {e}"
+                        )
+                    continue
+                
+                with stream_state["processed_lock"]:
+                    stream_state["processed_files"] += len(batches[index])
+        
+        except RuntimeError as e:
+            # BrokenProcessPool, or a pool another stream has just discarded
+            if self.logger:
+                self.logger.warning(f"Process pool unusable, starting a new one: {e}")
+            _discard_process_pool(max_workers, pool)
+        
+        # Keep results in file order regardless of which batch finished first
+        chunk_results = []
+        for index, results in enumerate(batch_results):
+            if results is None:
+                chunk_results.extend(self._process_chunk(stream_state, batches[index], pattern))
+            else:
+                chunk_results.extend(result for result in results if result)
+        return chunk_results
+    
+    def _process_single_file(self, file_path: Path, pattern: str) -> Optional[Dict[str, Any]]:
+        """Process a single file for matches."""
+        return _process_single_file(self.analyzer, file_path, pattern)
     
     def _detect_language(self, file_path: str) -> Optional[str]:
         """Detect language from file extension."""
-        ext = Path(file_path).suffix.lower()
-        extension_map = {
-            ".py": "python",
-            ".rs": "rust",
-            ".js": "javascript",
-            ".jsx": "javascript", 
-            ".ts": "typescript",
-            ".tsx": "typescript",
-            ".go": "go",
-            ".c": "c",
-            ".h": "c",
-            ".cpp": "cpp",
-            ".java": "java",
-            ".lua": "lua",
-        }
-        return extension_map.get(ext)
+        return _detect_language(file_path)
     
     def _calculate_progress(self, stream_state: Dict) -> StreamProgress:
         """Calculate current progress for a stream."""
@@ -467,19 +766,19 @@ class StreamingSecurityAuditor:
         if severity_filter:
             patterns = [p for p in patterns if p["severity"] in severity_filter]
         
-        # Create composite stream that searches for multiple patterns
+        # One stream reads each file once and matches every pattern against it
         stream_results = []
         
-        for pattern_info in patterns:
-            stream_result = self.search_engine.create_search_stream(
-                pattern=pattern_info["pattern"],
+        if patterns:
+            stream_result = self.search_engine.create_multi_pattern_stream(
+                patterns=patterns,
                 directory=directory,
                 language=language,
                 chunk_size=chunk_size
             )
             
             if "error" not in stream_result:
-                stream_result["pattern_info"] = pattern_info
+                stream_result["patterns"] = patterns
                 stream_results.append(stream_result)
         
         return {
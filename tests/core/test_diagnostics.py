@@ -48,6 +48,12 @@ class TestPatternDiagnostics:
         analysis = analyze_pattern_error(pattern, "javascript")
         assert analysis["has_errors"] is True
 
+        # Variadic metavariables are valid; only the $$ form is flagged
+        analysis = analyze_pattern_error("foo($$$ARGS)", "python")
+        assert analysis["has_errors"] is False
+        analysis = analyze_pattern_error("foo($$ARGS)", "python")
+        assert any("$$ARGS" in err["message"] for err in analysis["errors"])
+
     def test_pattern_help(self):
         """Test getting pattern help for different languages."""
         help_info = get_pattern_help("python")
@@ -63,6 +69,17 @@ class TestPatternDiagnostics:
         assert "common_errors" in js_help
         assert any("jsx_syntax" in err["error"] for err in js_help["common_errors"])
 
+    def test_pattern_help_results_are_independent(self):
+        """Test modifying one help result does not affect later calls."""
+        help_info = get_pattern_help("rust")
+        original = help_info["common_errors"][0]["details"]["message"]
+        help_info["common_errors"][0]["details"]["message"] = "POISONED"
+        help_info["common_errors"][0]["details"] = "POISONED"
+        help_info["common_errors"].clear()
+
+        again = get_pattern_help("rust")
+        assert again["common_errors"][0]["details"]["message"] == original
+
     def test_enrich_error_message(self):
         """Test enhancement of error messages."""
         error_msg = "failed to parse pattern: unexpected token"
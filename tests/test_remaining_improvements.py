@@ -16,7 +16,11 @@ import tempfile
 
 from ast_grep_mcp.core.ast_grep_mcp import AstGrepMCP
 from ast_grep_mcp.utils.simple_pattern_builder import SimplePatternBuilder, create_pattern_for_concept
-from ast_grep_mcp.utils.pattern_templates import PatternTemplateLibrary
+from ast_grep_mcp.utils.pattern_templates import (
+    PatternTemplateLibrary,
+    _keyed_templates,
+    _language_keywords,
+)
 from ast_grep_mcp.utils.batch_operations import BatchSearcher, BatchSearchRequest, create_code_quality_batch
 from ast_grep_mcp.utils.auto_paginate import SearchResultStream, create_search_stream
 
@@ -139,6 +143,39 @@ class TestPatternTemplates:
         template = templates["console_to_logger"]
         assert template.pattern == "console.log($$$ARGS)"
         assert template.replacement == "logger.info($$$ARGS)"
+    
+    def test_templates_built_once(self):
+        """Test template libraries are cached and shared by language aliases."""
+        templates = PatternTemplateLibrary.get_all_templates("typescript")
+        assert templates is PatternTemplateLibrary.get_all_templates("javascript")
+        assert templates is PatternTemplateLibrary.javascript_templates()
+        assert not PatternTemplateLibrary.get_all_templates("cobol")
+        
+        template = templates["console_to_logger"]
+        with pytest.raises(AttributeError):
+            template.pattern = "console.error($$$ARGS)"
+        with pytest.raises(AttributeError):
+            template.example_matches.append("console.error(x)")
+        with pytest.raises(TypeError):
+            template.variables["$EXTRA"] = "Injected"
+    
+    def test_suggest_templates_for_code(self):
+        """Test templates are suggested from keywords found in code."""
+        suggestions = PatternTemplateLibrary.suggest_templates_for_code(
+            "let v = config.UNWRAP();", "rust"
+        )
+        names = [t.name for t in suggestions]
+        assert names == ["unwrap_to_expect", "unwrap_to_question_mark"]
+        
+        assert PatternTemplateLibrary.suggest_templates_for_code("x = 1", "python") == []
+    
+    def test_suggest_templates_unknown_language_not_cached(self):
+        """Test unknown languages are answered without growing the caches."""
+        before = (_keyed_templates.cache_info().currsize, _language_keywords.cache_info().currsize)
+        for index in range(5):
+            assert PatternTemplateLibrary.suggest_templates_for_code("x", f"lang{index}") == []
+        after = (_keyed_templates.cache_info().currsize, _language_keywords.cache_info().currsize)
+        assert after == before
 
 
 class TestBatchOperations:
@@ -274,6 +311,13 @@ class TestMCPIntegration:
         assert "pattern" in result
         assert result["pattern"] == "$EXPR.unwrap()"
         
+        # Results are copies of the shared template
+        result["example_matches"].append("injected")
+        result["variables"]["$EXTRA"] = "injected"
+        template = PatternTemplateLibrary.rust_templates()["unwrap_to_expect"]
+        assert "injected" not in template.example_matches
+        assert "$EXTRA" not in template.variables
+        
         # Invalid template
         result = mcp.get_pattern_template("nonexistent", "rust")
         assert "error" in result
@@ -78,6 +78,29 @@ class TestPatternFixer:
         assert "spawn(async { $$$BODY })" in alternatives
         assert "spawn(async move { $$$BODY })" in alternatives
     
+    def test_iter_pattern_fixes_is_lazy(self):
+        """Test the generator variant yields the original first and matches fix_pattern."""
+        fixes = PatternFixer.iter_pattern_fixes("$EXPR.unwrap()", "rust")
+        assert next(fixes) == "$EXPR.unwrap()"
+        assert list(dict.fromkeys(PatternFixer.iter_pattern_fixes("$EXPR.unwrap()", "rust"))) == \
+            PatternFixer.fix_pattern("$EXPR.unwrap()", "rust")
+    
+    def test_fix_pattern_max_alternatives(self):
+        """Test that fix_pattern stops once enough unique alternatives exist."""
+        pattern = "spawn(async move { $$BODY })"
+        full = PatternFixer.fix_pattern(pattern, "rust")
+        limited = PatternFixer.fix_pattern(pattern, "rust", max_alternatives=3)
+        assert limited == full[:3]
+        assert PatternFixer.fix_pattern(pattern, "rust", max_alternatives=100) == full
+    
+    def test_suggest_working_pattern_by_intent(self):
+        """Test that intent keywords map to library patterns per language."""
+        assert PatternFixer.suggest_working_pattern("$EXPR.unwrap()", "rust") == "unwrap()"
+        assert PatternFixer.suggest_working_pattern("async def $F", "python") == "async def $NAME"
+        assert PatternFixer.suggest_working_pattern("$A => $B", "typescript") is not None
+        assert PatternFixer.suggest_working_pattern("foo", "rust") is None
+        assert PatternFixer.suggest_working_pattern("unwrap", "cobol") is None
+    
     def test_pattern_issue_explanation(self):
         """Test that we can explain why patterns fail."""
         explanation = PatternFixer.explain_pattern_issue("$EXPR.unwrap()", "rust")
@@ -0,0 +1,84 @@
+import pytest
+
+from ast_grep_mcp.utils.pattern_simplifier import PatternSimplifier
+
+
+class TestPatternSimplifier:
+    """Tests for the pattern simplifier"""
+
+    def setup_method(self):
+        self.simplifier = PatternSimplifier()
+
+    def test_analyze_complexity_simple_pattern(self):
+        """Simple patterns report no issues"""
+        assert self.simplifier.analyze_complexity("fn $NAME") == []
+
+    def test_analyze_complexity_detects_issues(self):
+        """Complex and unbalanced patterns are flagged"""
+        issues = self.simplifier.analyze_complexity("fn $NAME($$$PARAMS) { $$$BODY }")
+        assert "function_with_params_and_body" in issues
+
+        issues = self.simplifier.analyze_complexity("def $F($A, $B, $C, $D")
+        assert "too_many_metavars" in issues
+        assert "unbalanced_parentheses" in issues
+
+    def test_simplify_pattern_uses_language_strategy(self):
+        """Known templates are simplified to their short form"""
+        simplified = self.simplifier.simplify_pattern(
+            "fn $NAME($$$PARAMS) { $$$BODY }", "rust"
+        )
+        assert simplified[0] == (
+            "fn $NAME",
+            "Simplified from: fn $NAME($$$PARAMS) { $$$BODY }",
+        )
+        assert ("For Rust functions, try: fn $NAME", "Common pattern suggestion") in simplified
+
+    def test_simplify_pattern_simple_enough(self):
+        """Patterns without issues are returned unchanged"""
+        assert self.simplifier.simplify_pattern("fn $NAME", "rust") == [
+            ("fn $NAME", "Pattern appears simple enough")
+        ]
+
+    def test_generic_simplifications(self):
+        """Unknown shapes fall back to generic simplifications"""
+        simplified = self.simplifier.simplify_pattern(
+            "struct $NAME { $$$FIELDS } impl $NAME { $X $Y }", "rust"
+        )
+        patterns = [p for p, _ in simplified]
+        assert "struct $NAME" in patterns
+        assert "impl $NAME" in patterns
+        assert "$NAME" in patterns
+
+    def test_get_pattern_examples(self):
+        """Examples are available per language"""
+        examples = self.simplifier.get_pattern_examples("python")
+        assert "def $NAME" in examples["functions"]
+        assert not self.simplifier.get_pattern_examples("cobol")
+
+    def test_pattern_tables_are_shared(self):
+        """Strategy and example tables are shared, read-only constants"""
+        other = PatternSimplifier()
+        assert other.simplification_strategies is self.simplifier.simplification_strategies
+        examples = self.simplifier.get_pattern_examples("rust")
+        assert examples is other.get_pattern_examples("rust")
+        with pytest.raises(TypeError):
+            examples["functions"] = ()
+
+        strategies = self.simplifier.simplification_strategies
+        with pytest.raises(TypeError):
+            strategies["rust"]["suggestions"] = ()
+        with pytest.raises(TypeError):
+            strategies["cobol"] = {}
+        assert PatternSimplifier().simplification_strategies["rust"]["suggestions"]
+
+    def test_analyze_complexity_literal_prefilter(self):
+        """Regex checks still fire regardless of keyword case"""
+        issues = self.simplifier.analyze_complexity("ASYNC FN $NAME() { x }")
+        assert "complex_async_function" in issues
+        assert self.simplifier.analyze_complexity("async fn $NAME") == []
+
+    def test_iter_simplified_patterns_is_lazy(self):
+        """The generator yields the same alternatives and can stop early"""
+        pattern = "fn $NAME($$$PARAMS) { $$$BODY }"
+        alternatives = self.simplifier.iter_simplified_patterns(pattern, "rust")
+        assert next(alternatives) == self.simplifier.simplify_pattern(pattern, "rust")[0]
@@ -36,6 +36,31 @@ class TestPatternSuggestions:
         # Should include a variant with just the first line
         assert "def $NAME($$$PARAMS):" in variants
 
+    def test_get_pattern_variants_unique(self):
+        """Test variants are unique and never repeat the original pattern"""
+        pattern = "def foo() { $$$BODY }"
+        variants = get_pattern_variants(pattern)
+
+        assert len(variants) == len(set(variants))
+        assert pattern not in variants
+        # Brace-to-colon conversions produce the same string in two places
+        assert variants.count("def foo() : $$$BODY ") == 1
+
+    def test_get_pattern_variants_plain_pattern(self):
+        """Test patterns without any structure have no variants"""
+        assert get_pattern_variants("console.log") == []
+
+    def test_get_pattern_variants_js_to_python(self):
+        """Test JavaScript-style blocks are converted to Python-style headers"""
+        variants = get_pattern_variants("function foo(a) { return a }")
+        assert "function foo(a):" in variants
+        assert "foo(a):" in variants
+
+        # A function declared after another block is still converted
+        variants = get_pattern_variants("bar() { function foo() {")
+        assert "function foo():" in variants
+        assert "bar():" in variants
+
     @patch("ast_grep_mcp.utils.pattern_suggestions.get_handler")
     def test_get_similar_patterns(self, mock_get_handler):
         """Test finding similar patterns from the library"""
@@ -105,6 +130,16 @@ class MyClass:
         # Should have at least one example
         assert len(suggestions["examples"]) > 0
 
+        # The handler and its library are only looked up once
+        mock_get_handler.assert_called_once_with("python")
+        mock_handler.get_default_patterns.assert_called_once()
+
+        # Repeating the question is served from the cache as fresh lists
+        again = suggest_patterns(pattern, "", "python")
+        assert again == suggestions
+        assert again["variants"] is not suggestions["variants"]
+        mock_handler.get_default_patterns.assert_called_once()
+
     def test_build_suggestion_message(self):
         """Test building a user-friendly message with suggestions"""
         suggestions = {
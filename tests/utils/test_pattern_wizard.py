@@ -0,0 +1,97 @@
+import pytest
+
+from ast_grep_mcp.utils.pattern_wizard import _KEYWORD_BITS, PatternWizard
+
+
+class TestPatternWizard:
+    """Tests for the pattern wizard"""
+
+    def setup_method(self):
+        self.wizard = PatternWizard()
+
+    def test_extract_keywords(self):
+        """Keywords are reported once each, in a fixed order"""
+        keywords = self.wizard._extract_keywords("find public async methods that await and def")
+        assert keywords == ["function", "async", "public"]
+        assert self.wizard._extract_keywords("nothing relevant here") == []
+
+    def test_pattern_wizard_suggestions(self):
+        """Suggestions carry the precomputed explanation and fresh examples"""
+        result = self.wizard.pattern_wizard("find async functions", "python")
+        top = result["suggestions"][0]
+        assert top["pattern"] == "async def $NAME($$$ARGS)"
+        assert top["explanation"] == "This pattern matches an identifier with any arguments (asynchronous)"
+        assert top["examples"][0]["code"] == "async def fetch_data(url: str) -> dict:"
+
+        # Mutating a result does not leak into later calls
+        top["examples"][0]["matches"].append("injected")
+        again = self.wizard.pattern_wizard("find async functions", "python")
+        assert "injected" not in again["suggestions"][0]["examples"][0]["matches"]
+        top["examples"].clear()
+        again = self.wizard.pattern_wizard("find async functions", "python")
+        assert again["suggestions"][0]["examples"]
+
+    def test_score_template(self):
+        """Category, name and specific-match points add up"""
+        masks = self.wizard._template_masks("function", "pub_async")
+        keyword_mask = _KEYWORD_BITS["function"] | _KEYWORD_BITS["async"] | _KEYWORD_BITS["public"]
+        # function in category (2), async in name (3 + 5), pub in name (4)
+        assert self.wizard._score_template(keyword_mask, masks) == 14
+        assert self.wizard._score_template(0, masks) == 0
+
+    def test_pattern_wizard_cache(self):
+        """Repeated descriptions are ranked once and returned as fresh copies"""
+        first = self.wizard.pattern_wizard("Find Async Functions", "python")
+        second = self.wizard.pattern_wizard("find async functions", "python")
+        assert first["suggestions"] == second["suggestions"]
+        assert first["suggestions"][0] is not second["suggestions"][0]
+        assert first["description"] == "Find Async Functions"
+        assert self.wizard._suggestion_cache.cache_info().hits == 1
+
+        first["metavariables"]["$VAR"] = "changed"
+        assert second["metavariables"]["$VAR"] == "Matches single identifier"
+
+    def test_constant_tables_are_shared(self):
+        """Templates, tips and the reference guide are shared read-only constants"""
+        other = PatternWizard()
+        assert other.pattern_templates is self.wizard.pattern_templates
+        with pytest.raises(TypeError):
+            self.wizard.pattern_templates["python"]["function"]["simple"] = "def $F"
+
+        assert self.wizard._get_pattern_tips("python")[-1] == "Use proper indentation in multi-line patterns"
+        assert self.wizard._get_pattern_tips("cobol") == self.wizard._get_pattern_tips("go")
+
+        result = self.wizard.pattern_wizard("find classes", "rust")
+        assert isinstance(result["tips"], list)
+        assert result["tips"][-1] == "Generic types can be matched with $T"
+
+    def test_parse_pattern_components(self):
+        """Metavariables are classified by their prefix, ellipsis last"""
+        components = self.wizard._parse_pattern_components("fn $NAME($$$ARGS) ...")
+        assert [(c["metavar"], c["type"]) for c in components] == [
+            ("$NAME", "single"),
+            ("$$$ARGS", "multiple"),
+            ("...", "ellipsis"),
+        ]
+        assert self.wizard._explain_pattern("fn $NAME($$$ARGS)", "rust") == (
+            "This pattern matches an identifier with any arguments"
+        )
+
+    def test_get_common_uses(self):
+        """Common uses follow the substrings present in the pattern"""
+        assert self.wizard._get_common_uses("async fn $NAME($$$ARGS)", "rust") == [
+            "Finding all occurrences of specific identifiers",
+            "Matching functions regardless of parameter count",
+            "Identifying asynchronous code for refactoring",
+        ]
+        assert self.wizard._get_common_uses("$$$ARGS", "rust") == [
+            "Matching functions regardless of parameter count"
+        ]
+        assert self.wizard._get_common_uses("fn $X", "rust") == []
+
+    def test_generate_examples(self):
+        """Example rules are looked up per language and category"""
+        examples = self.wizard._generate_examples("def $NAME($$$ARGS)", "python", "function")
+        assert examples == [{"code": "def calculate_sum(a, b):", "matches": ["calculate_sum", "a, b"]}]
+        assert self.wizard._generate_examples("fn $NAME", "rust", "function") == []
+        assert self.wizard._generate_examples("class $NAME", "python", "class") == []
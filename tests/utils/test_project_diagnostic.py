@@ -0,0 +1,257 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from ast_grep_mcp.utils.project_diagnostic import ProjectDiagnostic
+
+
+def _write(path, content=""):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+class TestProjectDiagnostic:
+    """Tests for the project diagnostic"""
+
+    def setup_method(self):
+        self.diagnostic = ProjectDiagnostic()
+
+    def test_content_analysis(self, tmp_path):
+        """Counts, depth, hidden files and large files come from one walk"""
+        _write(tmp_path / ".env")
+        _write(tmp_path / "setup.py")
+        _write(tmp_path / "pkg" / "mod.py")
+        _write(tmp_path / "pkg" / "sub" / "big.rs", "x" * 100001)
+        _write(tmp_path / "pkg" / ".hidden" / "notes.txt")
+
+        result = self.diagnostic.diagnose_directory_detection(str(tmp_path))
+        content = result["content_analysis"]
+        assert content["total_files"] == 5
+        assert content["total_directories"] == 3
+        assert content["code_files"] == 3
+        assert content["depth"] == 3
+        assert content["has_hidden_files"] is True
+        assert content["largest_files"] == [("pkg/sub/big.rs", 100001)]
+        assert result["language_detection"]["primary_by_file_count"] == "python"
+
+    def test_hidden_files_only_checked_at_top_level(self, tmp_path):
+        """Hidden files in subdirectories do not count as hidden files"""
+        _write(tmp_path / "src" / ".gitkeep")
+        result = self.diagnostic.diagnose_directory_detection(str(tmp_path))
+        assert result["content_analysis"]["has_hidden_files"] is False
+        assert result["content_analysis"]["depth"] == 2
+
+    def test_symlinked_directories_are_not_entered(self, tmp_path):
+        """Symlinked directories count as directories but are not walked twice"""
+        _write(tmp_path / "real" / "a.py")
+        _write(tmp_path / "real" / "b.")
+        (tmp_path / "link").symlink_to(tmp_path / "real", target_is_directory=True)
+
+        content = self.diagnostic.diagnose_directory_detection(str(tmp_path))["content_analysis"]
+        assert content["total_files"] == 2
+        assert content["total_directories"] == 2
+        assert content["files_by_extension"] == {".py": 1, "": 1}
+
+    def test_parallel_subtrees_are_merged(self, tmp_path):
+        """Counters from every top-level subdirectory are combined"""
+        for name in ("a", "b", "c"):
+            _write(tmp_path / name / "deep" / f"{name}.go", "x" * 100001)
+            _write(tmp_path / name / "readme.md")
+
+        content = self.diagnostic.diagnose_directory_detection(str(tmp_path))["content_analysis"]
+        assert content["total_files"] == 6
+        assert content["total_directories"] == 6
+        assert content["files_by_extension"] == {".go": 3, ".md": 3}
+        assert sorted(path for path, _ in content["largest_files"]) == [
+            "a/deep/a.go", "b/deep/b.go", "c/deep/c.go"
+        ]
+        assert content["depth"] == 3
+
+    def test_extension_histogram_keeps_top_twenty(self, tmp_path):
+        """Only the 20 most common extensions are reported, most common first"""
+        for index in range(25):
+            _write(tmp_path / f"file.e{index}")
+        for index in range(3):
+            _write(tmp_path / f"extra{index}.e24")
+        _write(tmp_path / "main.ts")
+        _write(tmp_path / "app.tsx")
+
+        result = self.diagnostic.diagnose_directory_detection(str(tmp_path))
+        histogram = result["content_analysis"]["files_by_extension"]
+        assert len(histogram) == 20
+        assert next(iter(histogram.items())) == (".e24", 4)
+        assert result["language_detection"]["files_by_language"] == {"typescript": 2}
+        assert result["language_detection"]["primary_file_count"] == 2
+
+    def test_dependency_directories_are_pruned(self, tmp_path):
+        """Dependency and VCS directories are counted but not walked"""
+        _write(tmp_path / "index.js")
+        _write(tmp_path / "node_modules" / "lib" / "dep.js")
+        _write(tmp_path / "src" / ".git" / "HEAD")
+        _write(tmp_path / "src" / "app.js")
+
+        content = self.diagnostic.diagnose_directory_detection(str(tmp_path))["content_analysis"]
+        assert content["total_files"] == 2
+        assert content["total_directories"] == 3
+        assert content["pruned_directories"] == 2
+        assert content["files_by_extension"] == {".js": 2}
+
+    def test_quick_language_probe_stops_early(self, tmp_path):
+        """The probe stops once the primary language is clear"""
+        for index in range(60):
+            _write(tmp_path / f"mod{index}.py")
+        _write(tmp_path / "main.go")
+
+        code_files, language = self.diagnostic._quick_language_probe(str(tmp_path))
+        assert language == "python"
+        assert 50 <= code_files < 61
+        assert self.diagnostic._quick_language_probe(str(tmp_path), max_files=5)[0] == 5
+
+    def test_validate_search_directory(self, tmp_path):
+        """Directory checks come from the probe"""
+        _write(tmp_path / "lib.rs")
+        validation = self.diagnostic.validate_search_directory(str(tmp_path), "fn $NAME")
+        assert validation["directory_check"] == {
+            "exists": True,
+            "is_directory": True,
+            "resolved_path": str(tmp_path.resolve()),
+            "code_files_found": 1,
+            "detected_language": "rust",
+        }
+        assert validation["ready_to_search"] is True
+
+        missing = self.diagnostic.validate_search_directory(str(tmp_path / "missing"), "fn $NAME")
+        assert missing["directory_check"]["exists"] is False
+        assert missing["ready_to_search"] is False
+
+    def test_largest_files_are_bounded(self, tmp_path):
+        """Only the ten largest files are kept, largest first"""
+        for index in range(15):
+            _write(tmp_path / f"data{index:02}.bin", "x" * (100001 + index))
+
+        largest = self.diagnostic.diagnose_directory_detection(str(tmp_path))["content_analysis"]["largest_files"]
+        assert largest == [(f"data{index:02}.bin", 100001 + index) for index in range(14, 4, -1)]
+
+    def test_content_scan_is_reused(self, tmp_path):
+        """Repeated diagnostics reuse the scan until the root changes"""
+        _write(tmp_path / "pkg" / "a.py")
+        first = self.diagnostic.diagnose_directory_detection(str(tmp_path))
+        assert len(self.diagnostic._scan_cache) == 1
+        scan = next(iter(self.diagnostic._scan_cache.values()))[1]
+
+        again = self.diagnostic.diagnose_directory_detection(str(tmp_path))
+        assert again["content_analysis"] == first["content_analysis"]
+        assert next(iter(self.diagnostic._scan_cache.values()))[1] is scan
+
+        _write(tmp_path / "b.py")
+        # Coarse filesystem clocks may not have ticked since the first scan
+        mtime = tmp_path.stat().st_mtime_ns + 1_000_000
+        os.utime(tmp_path, ns=(mtime, mtime))
+        changed = self.diagnostic.diagnose_directory_detection(str(tmp_path))
+        assert changed["content_analysis"]["total_files"] == 2
+
+    def test_relative_to_cwd(self, tmp_path, monkeypatch):
+        """Paths are reported relative to the working directory when inside it"""
+        _write(tmp_path / "pkg" / "sub" / "a.py")
+        monkeypatch.chdir(tmp_path)
+
+        resolution = self.diagnostic.diagnose_directory_detection("pkg/sub")["path_resolution"]
+        assert resolution["relative_to_cwd"] == os.path.join("pkg", "sub")
+        assert self.diagnostic.diagnose_directory_detection(".")["path_resolution"]["relative_to_cwd"] == "."
+
+        monkeypatch.chdir(tmp_path / "pkg")
+        outside = self.diagnostic.diagnose_directory_detection(str(tmp_path))["path_resolution"]
+        assert outside["relative_to_cwd"] == "outside_cwd"
+
+    def test_missing_and_file_paths(self, tmp_path):
+        """Missing paths and files are reported without a content scan"""
+        _write(tmp_path / "a.py")
+
+        missing = self.diagnostic.diagnose_directory_detection(str(tmp_path / "nope"))
+        assert missing["path_resolution"]["exists"] is False
+        assert missing["path_resolution"]["relative_to_cwd"] == "outside_cwd"
+        assert "does not exist" in missing["directory_validation"]["error"]
+
+        a_file = self.diagnostic.diagnose_directory_detection(str(tmp_path / "a.py"))
+        assert a_file["path_resolution"]["exists"] is True
+        assert a_file["path_resolution"]["is_directory"] is False
+        assert "not a directory" in a_file["directory_validation"]["error"]
+        assert not self.diagnostic._scan_cache
+
+    def test_project_indicators(self, tmp_path):
+        """Top-level and nested indicators are found from one root listing"""
+        _write(tmp_path / "Cargo.toml")
+        _write(tmp_path / "src" / "lib.rs")
+        _write(tmp_path / "go.mod")
+        (tmp_path / "go.sum").symlink_to(tmp_path / "missing")
+
+        detection = self.diagnostic.diagnose_directory_detection(
+            str(tmp_path), expected_project_type="rust"
+        )["project_type_detection"]
+        assert detection["indicators_found"] == {
+            "rust": ["Cargo.toml", "src/lib.rs"],
+            "go": ["go.mod"],
+        }
+        assert detection["primary_project_type"] == "rust"
+        assert detection["matches_expected"] is True
+
+    def test_step_recommendations_are_kept(self, tmp_path, monkeypatch):
+        """Recommendations from earlier steps survive the final summary"""
+        def failing_scan(root, sizes=True):
+            raise PermissionError("denied")
+
+        monkeypatch.setattr("ast_grep_mcp.utils.project_diagnostic._scan_tree", failing_scan)
+        result = self.diagnostic.diagnose_directory_detection(str(tmp_path))
+        assert result["content_analysis"]["error"] == "denied"
+        assert result["recommendations"] == [
+            "Content analysis failed: denied",
+            "Directory is empty - check if you're in the right location",
+        ]
+
+    def test_fast_mode_skips_file_sizes(self, tmp_path):
+        """Fast mode reports everything but the largest files"""
+        _write(tmp_path / "big.py", "x" * 100001)
+
+        fast = self.diagnostic.diagnose_directory_detection(str(tmp_path), mode="fast")
+        assert "largest_files" not in fast["content_analysis"]
+        assert fast["content_analysis"]["code_files"] == 1
+
+        full = self.diagnostic.diagnose_directory_detection(str(tmp_path))
+        assert full["content_analysis"]["largest_files"] == [("big.py", 100001)]
+
+    def test_validate_many_checks_directory_once(self, tmp_path, monkeypatch):
+        """Several patterns share a single directory check"""
+        _write(tmp_path / "main.go")
+        probes = []
+        original_probe = self.diagnostic._quick_language_probe
+
+        def counting_probe(root):
+            probes.append(root)
+            return original_probe(root)
+
+        monkeypatch.setattr(self.diagnostic, "_quick_language_probe", counting_probe)
+        results = self.diagnostic.validate_many(
+            str(tmp_path), [("func $NAME", "go"), ("", None), ("$X", "rust")]
+        )
+        assert len(probes) == 1
+        assert [result["ready_to_search"] for result in results] == [True, False, True]
+        assert results[2]["language_check"]["language_match"] is False
+        assert results[0]["directory_check"] is not results[1]["directory_check"]
+        assert results[0] == self.diagnostic.validate_search_directory(str(tmp_path), "func $NAME", "go")
+
+    def test_content_scan_cache_is_thread_safe(self, tmp_path, monkeypatch):
+        """Concurrent diagnostics can share and evict scans"""
+        monkeypatch.setattr("ast_grep_mcp.utils.project_diagnostic._SCAN_CACHE_SIZE", 2)
+        roots = []
+        for index in range(6):
+            _write(tmp_path / f"p{index}" / "a.py")
+            roots.append(str(tmp_path / f"p{index}"))
+
+        def diagnose(index):
+            root = roots[index % len(roots)]
+            return self.diagnostic.diagnose_directory_detection(root)["content_analysis"]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(diagnose, range(200)))
+
+        assert all("error" not in result and result["total_files"] == 1 for result in results)
+        assert len(self.diagnostic._scan_cache) <= 2
@@ -0,0 +1,223 @@
+import multiprocessing
+import os
+import threading
+import time
+
+from ast_grep_mcp.ast_analyzer import AstAnalyzer
+from ast_grep_mcp.utils.real_streaming import (
+    StreamChunk,
+    StreamingSearchEngine,
+    StreamingSecurityAuditor,
+    _default_workers,
+    _process_file_patterns,
+    _process_pools,
+)
+
+
+def _drain(engine, stream_id):
+    chunks = []
+    while True:
+        response = engine.get_stream_chunk(stream_id, timeout=10.0)
+        chunks.append(response["chunk"])
+        if not response["has_more"]:
+            return chunks
+
+
+class _SubstringAnalyzer:
+    """Analyzer stand-in that matches patterns as plain substrings"""
+
+    def analyze_code(self, code, language, pattern):
+        return {"matches": [pattern] * code.count(pattern)}
+
+
+class _ExitInWorkerAnalyzer(_SubstringAnalyzer):
+    """Kills any worker process that uses it, breaking the pool"""
+
+    def analyze_code(self, code, language, pattern):
+        if multiprocessing.parent_process() is not None:
+            os._exit(1)
+        return super().analyze_code(code, language, pattern)
+
+
+class _UnpicklableAnalyzer(_SubstringAnalyzer):
+    """Cannot be sent to worker processes"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+
+
+class _FailingPatternAnalyzer(_SubstringAnalyzer):
+    """Raises for one pattern only"""
+
+    def analyze_code(self, code, language, pattern):
+        if pattern == "broken":
+            raise ValueError("bad pattern")
+        return super().analyze_code(code, language, pattern)
+
+
+def _write_matching_files(directory, count):
+    for index in range(count):
+        (directory / f"mod{index}.py").write_text("needle = 1\n")
+
+
+class TestStreamingSearchEngine:
+    """Tests for the real streaming search engine"""
+
+    def test_parallel_chunks_match_sequential(self, tmp_path, monkeypatch):
+        """Worker processes return the same results, in file order"""
+        for index in range(14):
+            body = "def f():\n    pass\n" if index % 2 == 0 else "x = 1\n"
+            (tmp_path / f"mod{index}.py").write_text(body)
+
+        engine = StreamingSearchEngine(AstAnalyzer())
+        # Finished streams would otherwise linger on a five-minute timer
+        monkeypatch.setattr(engine, "_cleanup_stream", lambda stream_id: None)
+        results = {}
+        for workers in (1, 3):
+            stream = engine.create_search_stream(
+                "def $NAME()", str(tmp_path), chunk_size=10, max_workers=workers
+            )
+            chunks = _drain(engine, stream["stream_id"])
+            results[workers] = [item["file"] for chunk in chunks for item in chunk["data"]]
+            assert engine.active_streams[stream["stream_id"]]["processed_files"] == 14
+
+        assert results[3] == results[1]
+        assert sorted(name.rsplit("/", 1)[-1] for name in results[3]) == sorted(
+            f"mod{index}.py" for index in range(0, 14, 2)
+        )
+
+    def test_default_workers_are_capped(self, monkeypatch):
+        """Default worker counts follow the analyzer's limits"""
+        monkeypatch.setattr("os.cpu_count", lambda: 64)
+        assert [_default_workers(n) for n in (10, 200, 5000)] == [2, 4, 8]
+        monkeypatch.setattr("os.cpu_count", lambda: 1)
+        assert [_default_workers(n) for n in (10, 200, 5000)] == [1, 1, 1]
+
+    def test_security_audit_uses_one_stream(self, tmp_path, monkeypatch):
+        """All audit patterns are matched in a single pass over the files"""
+        (tmp_path / "a.py").write_text("eval(data)\nexec(code)\n")
+        (tmp_path / "b.py").write_text("print(1)\n")
+        (tmp_path / "c.js").write_text("eval(x)\n")
+
+        engine = StreamingSearchEngine(AstAnalyzer())
+        monkeypatch.setattr(engine, "_cleanup_stream", lambda stream_id: None)
+        audit = StreamingSecurityAuditor(engine).run_security_audit_streaming(
+            str(tmp_path), "python", severity_filter=["high"]
+        )
+        assert len(audit["pattern_streams"]) == 1
+        assert audit["total_patterns"] == 3
+        stream = audit["pattern_streams"][0]
+        assert stream["total_files"] == 2
+
+        chunks = _drain(engine, stream["stream_id"])
+        (finding_file,) = [item for chunk in chunks for item in chunk["data"]]
+        assert finding_file["file"].endswith("a.py")
+        assert [(f["pattern"], f["issue"]) for f in finding_file["findings"]] == [
+            ("eval($CODE)", "Code injection risk"),
+            ("exec($CODE)", "Code injection risk"),
+        ]
+        assert finding_file["matches"] == 2
+
+    def test_chunk_handoff_waits_for_producer(self, tmp_path):
+        """Consumers wake for chunks appended later and time out otherwise"""
+        engine = StreamingSearchEngine()
+        stream = engine.create_search_stream("x", str(tmp_path))
+        stream_state = engine.active_streams[stream["stream_id"]]
+
+        response = engine.get_stream_chunk(stream["stream_id"], timeout=0.05)
+        assert response["chunk"] is None
+        assert response["has_more"] is False
+
+        def produce():
+            stream_state["results_deque"].append(StreamChunk(7, [], {}, is_final=True))
+            stream_state["results_event"].set()
+
+        threading.Timer(0.05, produce).start()
+        assert engine._wait_for_chunk(stream_state, timeout=5.0).chunk_id == 7
+        assert engine._wait_for_chunk(stream_state, timeout=0.01) is None
+
+    def test_producer_is_bounded_by_the_consumer(self, tmp_path, monkeypatch):
+        """Chunks are produced without a fixed delay but never run far ahead"""
+        for index in range(12):
+            (tmp_path / f"mod{index}.py").write_text("x = 1\n")
+
+        engine = StreamingSearchEngine()
+        monkeypatch.setattr(engine, "_cleanup_stream", lambda stream_id: None)
+        start = time.monotonic()
+        stream = engine.create_search_stream("x", str(tmp_path), chunk_size=1, max_workers=1)
+        stream_state = engine.active_streams[stream["stream_id"]]
+
+        deadline = time.monotonic() + 5.0
+        while len(stream_state["results_deque"]) < 4 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        assert len(stream_state["results_deque"]) == 4
+
+        chunks = _drain(engine, stream["stream_id"])
+        assert [chunk["chunk_id"] for chunk in chunks] == list(range(12))
+        assert time.monotonic() - start < 1.0
+
+    def test_broken_pool_is_replaced(self, tmp_path, monkeypatch):
+        """A pool whose worker died is discarded and the chunk is rerun in-process"""
+        _write_matching_files(tmp_path, 10)
+        engine = StreamingSearchEngine(_ExitInWorkerAnalyzer())
+        monkeypatch.setattr(engine, "_cleanup_stream", lambda stream_id: None)
+
+        stream = engine.create_search_stream("needle", str(tmp_path), chunk_size=10, max_workers=3)
+        (chunk,) = _drain(engine, stream["stream_id"])
+        assert len(chunk["data"]) == 10
+        assert engine.active_streams[stream["stream_id"]]["processed_files"] == 10
+        assert 3 not in _process_pools
+
+        engine.analyzer = _SubstringAnalyzer()
+        stream = engine.create_search_stream("needle", str(tmp_path), chunk_size=10, max_workers=3)
+        (chunk,) = _drain(engine, stream["stream_id"])
+        assert len(chunk["data"]) == 10
+        assert 3 in _process_pools
+
+    def test_failed_batches_are_rerun(self, tmp_path, monkeypatch):
+        """Batches the workers cannot run are searched in the stream thread"""
+        _write_matching_files(tmp_path, 10)
+        engine = StreamingSearchEngine(_UnpicklableAnalyzer())
+        monkeypatch.setattr(engine, "_cleanup_stream", lambda stream_id: None)
+
+        stream = engine.create_search_stream("needle", str(tmp_path), chunk_size=10, max_workers=2)
+        (chunk,) = _drain(engine, stream["stream_id"])
+        assert len(chunk["data"]) == 10
+        assert engine.active_streams[stream["stream_id"]]["processed_files"] == 10
+
+    def test_pattern_errors_are_reported_per_finding(self, tmp_path):
+        """A failing pattern does not hide the findings of the others"""
+        _write_matching_files(tmp_path, 1)
+        patterns = [
+            {"pattern": "broken", "severity": "high", "issue": "Broken"},
+            {"pattern": "needle", "severity": "low", "issue": "Needle"},
+        ]
+        result = _process_file_patterns(_FailingPatternAnalyzer(), tmp_path / "mod0.py", patterns)
+        assert result["findings"][0]["error"] == "bad pattern"
+        assert result["findings"][1]["matches"] == 1
+        assert result["matches"] == 1
+
+        assert _process_file_patterns(_FailingPatternAnalyzer(), tmp_path / "missing.py", patterns) is None
+
+    def test_abandoned_stream_is_cancelled(self, tmp_path, monkeypatch):
+        """A producer blocked on an idle consumer gives up and cleans up"""
+        monkeypatch.setattr("ast_grep_mcp.utils.real_streaming._STREAM_IDLE_SECONDS", 0.2)
+        monkeypatch.setattr("ast_grep_mcp.utils.real_streaming._SPACE_WAIT_SECONDS", 0.02)
+        _write_matching_files(tmp_path, 12)
+
+        engine = StreamingSearchEngine()
+        cleaned = []
+        monkeypatch.setattr(engine, "_cleanup_stream", cleaned.append)
+        producers = threading.active_count()
+        stream = engine.create_search_stream("needle", str(tmp_path), chunk_size=1, max_workers=1)
+        stream_state = engine.active_streams[stream["stream_id"]]
+
+        deadline = time.monotonic() + 5.0
+        while threading.active_count() > producers and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert threading.active_count() == producers
+        assert stream_state["status"].value == "cancelled"
+        assert "No chunk requested" in stream_state["error"]
+        assert len(stream_state["results_deque"]) == 4
+        assert cleaned == [stream["stream_id"]]